@@ -0,0 +1,394 @@
+"""
+Benchmark suite for Pytheas.
+
+Times every public entry point -- compute_g for a single datetime or
+datetime64, compute_timeseries at several lengths, LabFrame.field/timeseries
+at order 0 and 1, the Moon/Sun ephemerides for one epoch (datetime or Julian
+Date) and for arrays, the Chebyshev ephemeris table against the Meeus series,
+and the command line end to end -- and records the results as JSON together
+with machine metadata.  A run can be compared against a
+stored baseline; cases slower than the baseline by more than a threshold
+are flagged as regressions.
+
+Usage:
+    python benchmarks/bench.py                       # run, compare to baseline
+    python benchmarks/bench.py -o results.json       # also save the results
+    python benchmarks/bench.py --save-baseline       # replace the baseline
+    python benchmarks/bench.py -k timeseries --check # subset; exit 1 on regression
+
+Timings are per call.  Each case is looped until one measurement takes at
+least --min-time seconds; the median of --repeat measurements is compared.
+Baselines are only meaningful on the machine that recorded them.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+import pytheas
+from pytheas import (
+    LabFrame, compute_g, compute_timeseries, moon_position_ecef,
+    sun_position_ecef,
+)
+from pytheas._core import (
+    _ephemerides_ecef, _grid_ns, _grid_spec, _ns_to_jd_split,
+)
+from pytheas.ephem import ChebyshevEphemeris
+
+BASELINE = Path(__file__).resolve().parent / "baseline.json"
+
+LAT, LON, ALT = 48.14, 11.58, 500.0    # Munich
+T0 = datetime(2025, 3, 20, 12)
+
+
+# ── Cases ────────────────────────────────────────────────────────────────────
+#
+# Each case is a setup function returning the zero-argument callable that is
+# timed, so one-off preparation is excluded from the measurement.
+
+CASES = {}
+
+
+def case(name, samples=1):
+    """Register a benchmark; *samples* is the epochs computed per call."""
+    def register(setup):
+        CASES[name] = (setup, samples)
+        return setup
+    return register
+
+
+@case("compute_g")
+def _():
+    return lambda: compute_g(T0, LAT, LON, ALT)
+
+
+@case("compute_g_tilted")
+def _():
+    return lambda: compute_g(T0, LAT, LON, ALT, 30.0, 45.0)
+
+
+@case("compute_g_datetime64")
+def _():
+    t = np.datetime64(T0, "ns")
+    return lambda: compute_g(t, LAT, LON, ALT)
+
+
+def _timeseries(days, interval):
+    end = datetime(2025, 1, 1 + days)
+
+    def setup():
+        return lambda: compute_timeseries(datetime(2025, 1, 1), end,
+                                          LAT, LON, ALT,
+                                          interval_minutes=interval)
+    return setup
+
+
+for _days, _interval, _n in [(1, 10.0, 145), (7, 1.0, 10081),
+                             (30, 1.0, 43201)]:
+    case(f"compute_timeseries_{_n}", _n)(_timeseries(_days, _interval))
+
+
+@case("labframe_field_order0")
+def _():
+    lab = LabFrame(LAT, LON, ALT)
+    return lambda: lab.field(T0, order=0)
+
+
+@case("labframe_field_order1")
+def _():
+    lab = LabFrame(LAT, LON, ALT)
+    return lambda: lab.field(T0, order=1)
+
+
+@case("labframe_timeseries_order0", 8641)
+def _():
+    lab = LabFrame(LAT, LON, ALT)
+    return lambda: lab.timeseries(datetime(2025, 1, 1), datetime(2025, 1, 2),
+                                  interval_minutes=1 / 6, order=0)
+
+
+@case("labframe_timeseries_order1", 8641)
+def _():
+    lab = LabFrame(LAT, LON, ALT)
+    return lambda: lab.timeseries(datetime(2025, 1, 1), datetime(2025, 1, 2),
+                                  interval_minutes=1 / 6, order=1)
+
+
+@case("moon_position_ecef")
+def _():
+    return lambda: moon_position_ecef(T0)
+
+
+@case("sun_position_ecef")
+def _():
+    return lambda: sun_position_ecef(T0)
+
+
+@case("moon_position_ecef_jd")
+def _():
+    jd = pytheas.julian_date(T0)
+    return lambda: moon_position_ecef(jd)
+
+
+@case("moon_position_ecef_array", 10000)
+def _():
+    t = np.datetime64("2025-01-01") + np.arange(10000) * np.timedelta64(1, "m")
+    return lambda: moon_position_ecef(t)
+
+
+@case("sun_position_ecef_array", 10000)
+def _():
+    t = np.datetime64("2025-01-01") + np.arange(10000) * np.timedelta64(1, "m")
+    return lambda: sun_position_ecef(t)
+
+
+# Chebyshev ephemeris table against the Meeus series on a 30-day, 10 s
+# grid: the ephemerides alone and compute_timeseries end to end.  The
+# table is fitted in setup, outside the measurement.
+_EPH_START, _EPH_END = datetime(2025, 1, 1), datetime(2025, 1, 31)
+_EPH_N = 259201
+
+
+def _ephemerides(table):
+    def setup():
+        n, step_us = _grid_spec(_EPH_START, _EPH_END, 1 / 6)
+        day, frac = _ns_to_jd_split(_grid_ns(_EPH_START, step_us, 0, n))
+        eph = ChebyshevEphemeris(_EPH_START, _EPH_END) if table else None
+        return lambda: _ephemerides_ecef(day, frac, eph)
+    return setup
+
+
+def _table_timeseries(table):
+    def setup():
+        eph = ChebyshevEphemeris(_EPH_START, _EPH_END) if table else None
+        return lambda: compute_timeseries(_EPH_START, _EPH_END, LAT, LON, ALT,
+                                          interval_minutes=1 / 6,
+                                          ephemeris=eph)
+    return setup
+
+
+case("ephemerides_30d_10s_meeus", _EPH_N)(_ephemerides(False))
+case("ephemerides_30d_10s_table", _EPH_N)(_ephemerides(True))
+case("compute_timeseries_30d_10s_meeus", _EPH_N)(_table_timeseries(False))
+case("compute_timeseries_30d_10s_table", _EPH_N)(_table_timeseries(True))
+
+
+def _cli(*args):
+    def setup():
+        out = os.path.join(tempfile.mkdtemp(prefix="pytheas-bench-"),
+                           "out.npy")
+        env = dict(os.environ, PYTHONPATH=str(ROOT))
+        cmd = [sys.executable, "-m", "pytheas", "--lat", str(LAT),
+               "--lon", str(LON), "--alt", str(ALT),
+               "--start", "2025-01-01", *args, "-o", out]
+        return lambda: subprocess.run(cmd, env=env, check=True,
+                                      stdout=subprocess.DEVNULL)
+    return setup
+
+
+case("cli_48h")(_cli("--hours", "48"))
+case("cli_30d_1min", 43201)(_cli("--hours", "720", "--interval", "1"))
+
+
+# ── Measurement ──────────────────────────────────────────────────────────────
+
+def measure(fn, repeat, min_time):
+    """Per-call times of *repeat* measurements of at least *min_time* s."""
+    fn()                                        # warm-up
+    number = 1
+    while True:
+        t = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - t
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= 2 if elapsed == 0 else max(
+            2, min(10, int(min_time / elapsed) + 1))
+    times = [elapsed / number]
+    for _ in range(repeat - 1):
+        t = time.perf_counter()
+        for _ in range(number):
+            fn()
+        times.append((time.perf_counter() - t) / number)
+    return number, times
+
+
+def _git(*args):
+    try:
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _cpu_model():
+    """CPU model name from /proc/cpuinfo, else the platform's processor."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or None
+
+
+def metadata():
+    status = _git("status", "--porcelain", "--untracked-files=no")
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "pytheas": pytheas.__version__,
+        "commit": _git("rev-parse", "--short", "HEAD"),
+        "dirty": None if status is None else bool(status),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_model": _cpu_model(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run(names, repeat, min_time):
+    results = {}
+    for name in names:
+        setup, samples = CASES[name]
+        number, times = measure(setup(), repeat, min_time)
+        median = statistics.median(times)
+        results[name] = {
+            "median_s": median,
+            "min_s": min(times),
+            "max_s": max(times),
+            "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "loops": number,
+            "repeat": len(times),
+            "samples": samples,
+            "samples_per_s": samples / median,
+        }
+        print(f"  {name:32s} {_fmt(median):>10s}   "
+              f"({number} loops x {len(times)})", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Ratio current/baseline per case; flag slowdowns over *threshold*."""
+    rows = []
+    for name, res in results.items():
+        ref = baseline.get(name)
+        if ref is None:
+            rows.append((name, res["median_s"], None, None, "new"))
+            continue
+        ratio = res["median_s"] / ref["median_s"]
+        if ratio > 1.0 + threshold:
+            status = "REGRESSION"
+        elif ratio < 1.0 / (1.0 + threshold):
+            status = "faster"
+        else:
+            status = "ok"
+        rows.append((name, res["median_s"], ref["median_s"], ratio, status))
+    return rows
+
+
+def _fmt(seconds):
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+def main(argv=None):
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[1],
+                                formatter_class=argparse.RawDescriptionHelpFormatter)
+    p.add_argument("-k", "--filter", default=None,
+                   help="Only run cases whose name contains this text")
+    p.add_argument("--repeat", type=int, default=5,
+                   help="Measurements per case (default 5)")
+    p.add_argument("--min-time", type=float, default=0.2,
+                   help="Minimum seconds per measurement (default 0.2)")
+    p.add_argument("-o", "--output", default=None,
+                   help="Write results JSON here")
+    p.add_argument("--baseline", default=str(BASELINE),
+                   help="Baseline JSON to compare against")
+    p.add_argument("--save-baseline", action="store_true",
+                   help="Write the results to the baseline file")
+    p.add_argument("--threshold", type=float, default=0.25,
+                   help="Flag cases slower than baseline by this fraction "
+                        "(default 0.25)")
+    p.add_argument("--check", action="store_true",
+                   help="Exit with status 1 if any case regressed")
+    p.add_argument("--list", action="store_true", help="List cases and exit")
+    args = p.parse_args(argv)
+
+    names = [n for n in CASES if args.filter is None or args.filter in n]
+    if args.list:
+        print("\n".join(names))
+        return 0
+    if not names:
+        p.error(f"no case matches {args.filter!r}")
+
+    meta = metadata()
+    print(f"pytheas {meta['pytheas']} ({meta['commit']}"
+          f"{', modified' if meta['dirty'] else ''}), "
+          f"Python {meta['python']}, NumPy {meta['numpy']}, "
+          f"{meta['cpu_count']} CPU ({meta['cpu_model']}), "
+          f"{meta['platform']}")
+    results = run(names, args.repeat, args.min_time)
+    doc = {"metadata": meta, "threshold": args.threshold, "results": results}
+
+    regressions = []
+    baseline_path = Path(args.baseline)
+    if baseline_path.exists() and not args.save_baseline:
+        base = json.loads(baseline_path.read_text())
+        rows = compare(results, base["results"], args.threshold)
+        doc["baseline"] = {"path": str(baseline_path),
+                           "metadata": base["metadata"],
+                           "ratios": {r[0]: r[3] for r in rows}}
+        print(f"\nBaseline: {baseline_path} "
+              f"({base['metadata'].get('commit')}, "
+              f"{base['metadata'].get('timestamp')})")
+        host = ("cpu_model", "cpu_count", "machine")
+        if any(k in base["metadata"] and base["metadata"][k] != meta[k]
+               for k in host):
+            print(f"  warning: recorded on other hardware "
+                  f"({base['metadata'].get('cpu_model')}, "
+                  f"{base['metadata'].get('cpu_count')} CPU); "
+                  f"ratios are not comparable")
+        print(f"  {'case':32s} {'current':>10s} {'baseline':>10s} "
+              f"{'ratio':>7s}  status")
+        for name, cur, ref, ratio, status in rows:
+            print(f"  {name:32s} {_fmt(cur):>10s} "
+                  f"{_fmt(ref) if ref else '-':>10s} "
+                  f"{f'{ratio:.2f}' if ratio else '-':>7s}  {status}")
+        regressions = [r[0] for r in rows if r[4] == "REGRESSION"]
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) beyond "
+                  f"{args.threshold:.0%}: {', '.join(regressions)}")
+    doc["regressions"] = regressions
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(doc, indent=2) + "\n")
+        print(f"\nSaved: {args.output}")
+    if args.save_baseline:
+        doc.pop("baseline", None)
+        baseline_path.write_text(json.dumps(doc, indent=2) + "\n")
+        print(f"\nBaseline saved: {baseline_path}")
+    return 1 if args.check and regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -17,48 +17,91 @@ Dependency: numpy only.
 
 __version__ = "3.4.0"
 
-from ._core import (
+import importlib
+
+# The computational core (and with it NumPy) is imported on first use of
+# any of its names, so lightweight submodules such as pytheas.client load
+# without it.
+_LAZY = {
     # Main API
-    compute_g,
-    compute_timeseries,
-    GravityResult,
-    TimeSeries,
+    "compute_g": "_core",
+    "compute_timeseries": "_core",
+    "iter_timeseries": "_core",
+    "compute_network_timeseries": "_core",
+    "GravityResult": "_core",
+    "TimeSeries": "_core",
+    "NetworkTimeSeries": "_core",
+    "Station": "_core",
+    # Real-time stream and profiling
+    "realtime": "_realtime",
+    "RealtimeSample": "_realtime",
+    "RealtimeMetrics": "_realtime",
+    "profiling": "_profiling",
+    "Profile": "_profiling",
+    "StageStats": "_profiling",
     # Lab frame
-    GravityField,
-    LabFrame,
+    "GravityField": "_core",
+    "GravityFieldSeries": "_core",
+    "LabFrame": "_core",
     # Building blocks
-    normal_gravity,
-    sun_position_ecef,
-    moon_position_ecef,
-    geodetic_to_ecef,
-    enu_basis,
-    measurement_axis,
-    tidal_acceleration,
-    julian_date,
-    gmst_rad,
+    "normal_gravity": "_core",
+    "sun_position_ecef": "_core",
+    "moon_position_ecef": "_core",
+    "geodetic_to_ecef": "_core",
+    "enu_basis": "_core",
+    "measurement_axis": "_core",
+    "tidal_acceleration": "_core",
+    "julian_date": "_core",
+    "julian_date_split": "_core",
+    "gmst_rad": "_core",
     # Constants
-    GM_MOON,
-    GM_SUN,
-    GM_E,
-    A_WGS84,
-    F_WGS84,
-    B_WGS84,
-    E2,
-    OMEGA,
-    AU,
-    H2,
-    K2,
-    DELTA_GRAV,
-    GAMMA_E,
-    GAMMA_P,
-)
+    "GM_MOON": "_core",
+    "GM_SUN": "_core",
+    "GM_E": "_core",
+    "A_WGS84": "_core",
+    "F_WGS84": "_core",
+    "B_WGS84": "_core",
+    "E2": "_core",
+    "OMEGA": "_core",
+    "AU": "_core",
+    "H2": "_core",
+    "K2": "_core",
+    "DELTA_GRAV": "_core",
+    "GAMMA_E": "_core",
+    "GAMMA_P": "_core",
+}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
 
 __all__ = [
     "compute_g",
     "compute_timeseries",
+    "iter_timeseries",
+    "compute_network_timeseries",
     "GravityResult",
     "TimeSeries",
+    "NetworkTimeSeries",
+    "Station",
+    "realtime",
+    "RealtimeSample",
+    "RealtimeMetrics",
+    "profiling",
+    "Profile",
+    "StageStats",
     "GravityField",
+    "GravityFieldSeries",
     "LabFrame",
     "normal_gravity",
     "sun_position_ecef",
@@ -68,6 +111,7 @@ __all__ = [
     "measurement_axis",
     "tidal_acceleration",
     "julian_date",
+    "julian_date_split",
     "gmst_rad",
     "GM_MOON",
     "GM_SUN",
@@ -1,14 +1,329 @@
 """CLI entry point: python -m pytheas"""
 
 import argparse
+import csv
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+
 import numpy as np
 from datetime import datetime, timedelta
 
-from . import __version__, compute_timeseries
+from . import Station, __version__, iter_timeseries
+from ._core import (
+    _CHUNK_SIZE, _concat_timeseries, _datetime_to_ns, _ephemerides_ecef,
+    _grid_ns, _grid_spec, _network_columns, _network_sites, _ns_to_jd_split,
+)
+from ._output import FIELDS, FORMATS, format_from_path, open_writer
+
+
+def _parse_start(text):
+    for fmt in ('%Y-%m-%dT%H:%M', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+    print(f"Cannot parse start time: {text}", file=sys.stderr)
+    sys.exit(1)
+
+
+class _Summary:
+    """Running statistics and sample rows of a streamed timeseries."""
+
+    HEAD = 5
+    TAIL = 3
+
+    def __init__(self):
+        self.n = 0
+        self.g_static = None
+        self.g_min = np.inf
+        self.g_max = -np.inf
+        self.tidal_min = np.inf
+        self.tidal_max = -np.inf
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._head = []
+        self._tail = deque(maxlen=self.TAIL)
+
+    def add(self, chunk):
+        g_t = chunk.g_tidal
+        m = len(g_t)
+        if m == 0:
+            return
+        if self.g_static is None:
+            self.g_static = chunk.g_static[0]
+        self.g_min = min(self.g_min, np.min(chunk.g_total))
+        self.g_max = max(self.g_max, np.max(chunk.g_total))
+        self.tidal_min = min(self.tidal_min, np.min(g_t))
+        self.tidal_max = max(self.tidal_max, np.max(g_t))
+
+        # Chan et al. pairwise update of the mean and sum of squares
+        mean = np.mean(g_t)
+        m2 = np.sum((g_t - mean) ** 2)
+        delta = mean - self._mean
+        total = self.n + m
+        self._mean += delta * m / total
+        self._m2 += m2 + delta ** 2 * self.n * m / total
+
+        def row(i):
+            return (chunk.times[i], chunk.g_total[i], g_t[i],
+                    chunk.g_tidal_moon[i], chunk.g_tidal_sun[i])
+
+        for i in range(min(self.HEAD - len(self._head), m)):
+            self._head.append((self.n + i, row(i)))
+        for i in range(max(0, m - self.TAIL), m):
+            self._tail.append((self.n + i, row(i)))
+        self.n = total
+
+    @property
+    def tidal_ptp(self):
+        return self.tidal_max - self.tidal_min
+
+    @property
+    def tidal_std(self):
+        return np.sqrt(self._m2 / self.n)
+
+    def rows(self):
+        """First and last rows, with None marking skipped ones."""
+        rows = dict(self._head)
+        last = self._head[-1][0] if self._head else -1
+        tail = [(i, r) for i, r in self._tail if i > last]
+        if tail and tail[0][0] > last + 1:
+            rows[None] = None
+        rows.update(tail)
+        return list(rows.values())
+
+
+def _read_stations(path, alt=0.0, zenith=0.0, azimuth=0.0):
+    """Stations from a CSV file with columns id, lat, lon[, alt, zenith,
+    azimuth] (header required, extra columns ignored); *alt*, *zenith* and
+    *azimuth* fill in missing or empty optional columns."""
+    try:
+        with open(path, newline='') as f:
+            rows = list(csv.DictReader(f))
+    except OSError as e:
+        print(f"Cannot read stations: {e}", file=sys.stderr)
+        sys.exit(1)
+    stations = []
+    for line, row in enumerate(rows, start=2):
+        row = {k.strip().lower(): (v or '').strip()
+               for k, v in row.items() if k is not None}
+        try:
+            stations.append(Station(
+                float(row['lat']), float(row['lon']),
+                float(row.get('alt') or alt),
+                float(row.get('zenith') or zenith),
+                float(row.get('azimuth') or azimuth),
+                name=row.get('id') or str(len(stations))))
+        except (KeyError, ValueError) as e:
+            print(f"{path}:{line}: bad station row ({e})", file=sys.stderr)
+            sys.exit(1)
+    if not stations:
+        print(f"{path}: no stations", file=sys.stderr)
+        sys.exit(1)
+    names = [st.name for st in stations]
+    if len(set(names)) != len(names):
+        print(f"{path}: station ids must be unique", file=sys.stderr)
+        sys.exit(1)
+    return stations
+
+
+def _network(args, start, end, output, fmt):
+    """Timeseries of every station in ``--stations`` over one window.
+
+    The Moon and Sun are evaluated once per epoch chunk and shared by all
+    stations; ``--jobs`` threads split the stations of each chunk (the
+    kernels are NumPy array operations, which release the GIL).
+    """
+    stations = _read_stations(args.stations, args.alt, args.zenith,
+                              args.azimuth)
+    ids = [st.name for st in stations]
+    S = len(stations)
+    g0, n_hat, cos_z, r = _network_sites(stations)
+    g_static = g0 * cos_z
+    offsets = [round(st.lon_deg / 15.0) for st in stations]
+
+    n, step_us = _grid_spec(start, end, args.interval)
+    print(f"Stations : {S} from {args.stations}")
+    print(f"Window   : {start.isoformat()} to {end.isoformat()} UTC "
+          f"({args.hours:.1f} h, {args.interval:.0f} min)")
+    print(f"Epochs   : {n}")
+    print()
+
+    per_station = output is not None and '{id}' in output
+    if (S > 1 and output and not per_station
+            and ('{' in output or '}' in output)):
+        print(f"Output {output!r} looks like a template but has no {{id}}; "
+              "it would write all stations to one file", file=sys.stderr)
+        sys.exit(1)
+    grid = dict(start_ns=_datetime_to_ns(start), step_ns=step_us * 1000)
+    writers = []
+    try:
+        if per_station:
+            writers = [open_writer(output.replace('{id}', sid), fmt, n, off,
+                                   **grid)
+                       for sid, off in zip(ids, offsets)]
+        elif output:
+            writers = [open_writer(output, fmt, n, offsets, stations=ids,
+                                   **grid)]
+
+        groups = np.array_split(np.arange(S), min(args.jobs, S))
+        pool = ThreadPoolExecutor(len(groups)) if len(groups) > 1 else None
+        tide_min = np.full(S, np.inf)
+        tide_max = np.full(S, -np.inf)
+        tide_sum = np.zeros(S)
+        tide_sq = np.zeros(S)
+        try:
+            # Ephemeris chunks are multiples of the ephemeris block, so
+            # each equals the corresponding slice of a one-shot evaluation.
+            # The (S, epochs) tide arrays are sliced further to hold about
+            # _CHUNK_SIZE elements regardless of the station count.
+            step = max(1, _CHUNK_SIZE // S)
+            for lo in range(0, n, _CHUNK_SIZE):
+                ns_chunk = _grid_ns(start, step_us, lo,
+                                    min(lo + _CHUNK_SIZE, n))
+                R_moon_chunk, R_sun_chunk = _ephemerides_ecef(
+                    *_ns_to_jd_split(ns_chunk))
+                for a in range(0, len(ns_chunk), step):
+                    ns = ns_chunk[a:a + step]
+                    R_moon = R_moon_chunk[a:a + step]
+                    R_sun = R_sun_chunk[a:a + step]
+
+                    def tides(group):
+                        return _network_columns(r[group], n_hat[group],
+                                                R_moon, R_sun)
 
+                    parts = (pool.map(tides, groups) if pool is not None
+                             else map(tides, groups))
+                    g_moon, g_sun = (np.concatenate(c)
+                                     for c in zip(*parts))
+                    g_tidal = g_moon + g_sun
+                    g_total = g_static[:, None] + g_tidal
+
+                    tide_min = np.minimum(tide_min, g_tidal.min(axis=1))
+                    tide_max = np.maximum(tide_max, g_tidal.max(axis=1))
+                    tide_sum += g_tidal.sum(axis=1)
+                    tide_sq += np.einsum('sn,sn->s', g_tidal, g_tidal)
+
+                    columns = (g_total, np.broadcast_to(g_static[:, None],
+                                                        g_total.shape),
+                               g_tidal, g_moon, g_sun)
+                    if per_station:
+                        for i, w in enumerate(writers):
+                            w.write(ns, [c[i] for c in columns])
+                    elif writers:
+                        writers[0].write(ns, [c.T for c in columns])
+        finally:
+            if pool is not None:
+                pool.shutdown()
+    finally:
+        for w in writers:
+            w.close()
+
+    mean = tide_sum / n
+    rms = np.sqrt(np.maximum(tide_sq / n - mean ** 2, 0.0))
+    print(f"{'Station':>12s}  {'Lat':>9s}  {'Lon':>10s}  "
+          f"{'Static g on axis':>17s}  {'Tidal p-p':>10s}  {'Tidal RMS':>10s}")
+    print(f"{'':>12s}  {'(deg)':>9s}  {'(deg)':>10s}  {'(m/s^2)':>17s}  "
+          f"{'(um/s^2)':>10s}  {'(um/s^2)':>10s}")
+    print('-' * 77)
+    for i, st in enumerate(stations):
+        print(f"{st.name[:12]:>12s}  {st.lat_deg:9.4f}  {st.lon_deg:10.4f}  "
+              f"{g_static[i]:17.8f}  "
+              f"{(tide_max[i] - tide_min[i]) * 1e6:10.4f}  "
+              f"{rms[i] * 1e6:10.4f}")
+
+    if output:
+        where = (f"{S} files {output}" if per_station else output)
+        print(f"\nSaved: {where} ({fmt})")
+
+
+def build(argv):
+    """``pytheas build``: write a Chebyshev ephemeris table."""
+    from .ephem import ChebyshevEphemeris
+
+    p = argparse.ArgumentParser(
+        prog='pytheas build',
+        description='Precompute a Moon/Sun ephemeris table for a date range',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""\
+examples:
+  pytheas build --start 2025-01-01 --end 2026-01-01 -o ephem_2025.pyteph
+  pytheas --lat 48.14 --lon 11.58 --ephemeris ephem_2025.pyteph
+""")
+    p.add_argument('--start', type=str, required=True,
+                   help='Window start UTC (YYYY-MM-DD or YYYY-MM-DDTHH:MM)')
+    p.add_argument('--end', type=str, required=True,
+                   help='Window end UTC (YYYY-MM-DD or YYYY-MM-DDTHH:MM)')
+    p.add_argument('-o', '--output', type=str, required=True,
+                   help='Output table file')
+    p.add_argument('--granule-hours', type=float, default=24.0,
+                   help='Polynomial granule length (hours, default 24)')
+    p.add_argument('--tol', type=float, default=1.0,
+                   help='Maximum position error (m, default 1)')
+    args = p.parse_args(argv)
+
+    start, end = _parse_start(args.start), _parse_start(args.end)
+    try:
+        eph = ChebyshevEphemeris(start, end, granule_hours=args.granule_hours,
+                                 tol_m=args.tol)
+    except ValueError as e:
+        print(f"pytheas build: {e}", file=sys.stderr)
+        sys.exit(1)
+    eph.save(args.output)
+    print(f"Window   : {start.isoformat()} to {end.isoformat()} UTC")
+    print(f"Granules : {eph._n_granules} x {args.granule_hours:g} h, "
+          f"degree {eph.degree}")
+    print(f"Max error: Moon {eph.max_error_m[0]:.3g} m, "
+          f"Sun {eph.max_error_m[1]:.3g} m")
+    print(f"Saved: {args.output}")
+
+
+def serve(argv):
+    """``pytheas serve``: run the local prediction server."""
+    from .server import DEFAULT_PORT, serve as run_server
+
+    p = argparse.ArgumentParser(
+        prog='pytheas serve',
+        description='Serve compute_g requests as JSON lines, coalescing '
+                    'concurrent requests into vectorized batches',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""\
+examples:
+  pytheas serve
+  pytheas serve --socket /tmp/pytheas.sock --ephemeris ephem_2025.pyteph
+""")
+    p.add_argument('--host', type=str, default='127.0.0.1',
+                   help='TCP interface (default 127.0.0.1)')
+    p.add_argument('--port', type=int, default=DEFAULT_PORT,
+                   help=f'TCP port (default {DEFAULT_PORT})')
+    p.add_argument('--socket', type=str, default=None,
+                   help='Unix socket path (instead of TCP)')
+    p.add_argument('--batch-window', type=float, default=2.0,
+                   help='Coalescing window (ms, default 2)')
+    p.add_argument('--epoch-tolerance', type=float, default=1.0,
+                   help='Epochs closer than this share one ephemeris '
+                        'evaluation (ms, default 1; 0 = identical only)')
+    p.add_argument('--ephemeris', type=str, default=None,
+                   help='Ephemeris table from "pytheas build" to use')
+    args = p.parse_args(argv)
+
+    if args.ephemeris:
+        from .ephem import set_ephemeris
+        set_ephemeris(args.ephemeris)
+    run_server(args.host, args.port, args.socket,
+               batch_window=args.batch_window / 1000.0,
+               epoch_tolerance=args.epoch_tolerance / 1000.0)
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] == 'build':
+        return build(argv[1:])
+    if argv and argv[0] == 'serve':
+        return serve(argv[1:])
 
-def main():
     p = argparse.ArgumentParser(
         prog='pytheas',
         description='Compute g(t) at a point on Earth (accuracy ~200-1000 nGal)',
@@ -19,10 +334,15 @@ examples:
   pytheas --lat 48.14 --lon 11.58 --alt 500 --start 2025-03-20 --hours 72
   pytheas --lat 48.14 --lon 11.58 --alt 500 --zenith 90 --azimuth 0
   pytheas --lat 48.14 --lon 11.58 --alt 500 --csv output.csv --plot
+  pytheas --lat 48.14 --lon 11.58 --hours 8760 --interval 0.0167 -o year.npy
+  pytheas --stations stations.csv --hours 24 -o network.npz
+  pytheas --stations stations.csv --hours 24 -o 'out/{id}.csv' --jobs 4
+  pytheas build --start 2025-01-01 --end 2026-01-01 -o ephem_2025.pyteph
+  pytheas serve --port 8765
 """)
     p.add_argument('--version', action='version', version=f'%(prog)s {__version__}')
-    p.add_argument('--lat',     type=float, required=True, help='Latitude (deg)')
-    p.add_argument('--lon',     type=float, required=True, help='Longitude (deg)')
+    p.add_argument('--lat',     type=float, default=None,  help='Latitude (deg)')
+    p.add_argument('--lon',     type=float, default=None,  help='Longitude (deg)')
     p.add_argument('--alt',     type=float, default=0.0,   help='Altitude (m, default 0)')
     p.add_argument('--zenith',  type=float, default=0.0,
                    help='Zenith angle of measurement axis (0=vertical, default 0)')
@@ -32,26 +352,52 @@ examples:
                    help='Start time UTC (YYYY-MM-DD or YYYY-MM-DDTHH:MM)')
     p.add_argument('--hours',   type=float, default=48.0,  help='Duration (hours, default 48)')
     p.add_argument('--interval', type=float, default=10.0, help='Cadence (minutes, default 10)')
-    p.add_argument('--csv',     type=str,   default=None,  help='Output CSV file')
+    p.add_argument('-o', '--output', type=str, default=None,
+                   help='Output file, streamed in chunks')
+    p.add_argument('--format',  type=str, default=None, choices=FORMATS,
+                   help='Output format (default from the -o extension, '
+                        'else csv); binary formats store int64 UTC ns epochs')
+    p.add_argument('--csv',     type=str,   default=None,
+                   help='Output CSV file (same as -o FILE --format csv)')
     p.add_argument('--plot',    action='store_true',        help='Show plot')
-    args = p.parse_args()
+    p.add_argument('--stations', type=str, default=None,
+                   help='Station CSV (id,lat,lon[,alt,zenith,azimuth]) '
+                        'instead of --lat/--lon; --alt, --zenith and '
+                        '--azimuth fill in missing columns, and an -o path '
+                        'containing {id} writes one file per station')
+    p.add_argument('--jobs',    type=int,   default=1,
+                   help='Threads sharing the station work (default 1)')
+    p.add_argument('--ephemeris', type=str, default=None,
+                   help='Ephemeris table from "pytheas build" to use')
+    args = p.parse_args(argv)
+
+    if args.stations is None and (args.lat is None or args.lon is None):
+        p.error('--lat and --lon are required unless --stations is given')
+    if args.stations is not None and args.plot:
+        p.error('--plot is not available with --stations')
+    if args.jobs < 1:
+        p.error('--jobs must be >= 1')
+    if args.csv and args.output:
+        p.error('--csv and -o/--output are mutually exclusive')
+    output = args.csv or args.output
+    fmt = 'csv' if args.csv else args.format or (
+        format_from_path(output) if output else None)
+
+    if args.ephemeris:
+        from .ephem import set_ephemeris
+        set_ephemeris(args.ephemeris)
 
     if args.start:
-        for fmt in ('%Y-%m-%dT%H:%M', '%Y-%m-%d'):
-            try:
-                start = datetime.strptime(args.start, fmt)
-                break
-            except ValueError:
-                continue
-        else:
-            print(f"Cannot parse start time: {args.start}", file=sys.stderr)
-            sys.exit(1)
+        start = _parse_start(args.start)
     else:
         now = datetime.utcnow()
         start = now.replace(minute=0, second=0, microsecond=0)
 
     end = start + timedelta(hours=args.hours)
 
+    if args.stations is not None:
+        return _network(args, start, end, output, fmt)
+
     # Approximate local time offset from longitude (standard timezone)
     utc_offset_h = round(args.lon / 15.0)
     local_dt = timedelta(hours=utc_offset_h)
@@ -66,58 +412,57 @@ examples:
     print(f"Local tz : {utc_label} (from longitude)")
     print()
 
-    data = compute_timeseries(start, end, args.lat, args.lon, args.alt,
-                              args.zenith, args.azimuth, args.interval)
+    n, step_us = _grid_spec(start, end, args.interval)
+    stats = _Summary()
+    kept = [] if args.plot else None
+    writer = None
+    if output:
+        writer = open_writer(output, fmt, n, utc_offset_h,
+                             start_ns=_datetime_to_ns(start),
+                             step_ns=step_us * 1000)
 
-    g_s = data.g_static[0]
-    g_t = data.g_tidal
-    print(f"Static g on axis   : {g_s:.8f} m/s^2")
-    print(f"Tidal peak-to-peak : {np.ptp(g_t) * 1e6:.4f} um/s^2")
-    print(f"Tidal RMS          : {np.std(g_t) * 1e6:.4f} um/s^2")
-    print(f"g_total range      : [{np.min(data.g_total):.8f}, "
-          f"{np.max(data.g_total):.8f}] m/s^2")
+    # Stream chunks: only the summary, the sample rows and (for --plot)
+    # the series are kept, so any span fits in memory.
+    try:
+        for chunk in iter_timeseries(start, end, args.lat, args.lon, args.alt,
+                                     args.zenith, args.azimuth, args.interval):
+            lo = stats.n
+            stats.add(chunk)
+            if writer is not None:
+                writer.write(_grid_ns(start, step_us, lo, stats.n),
+                             [getattr(chunk, name) for name in FIELDS])
+            if kept is not None:
+                kept.append(chunk)
+    finally:
+        if writer is not None:
+            writer.close()
 
-    # Sample table
-    times = data.times
-    head = min(5, len(times))
-    tail = min(3, len(times))
-    rows = list(range(head))
-    if len(times) > head + tail:
-        rows.append(None)
-        rows.extend(range(len(times) - tail, len(times)))
-    elif len(times) > head:
-        rows.extend(range(head, len(times)))
+    print(f"Static g on axis   : {stats.g_static:.8f} m/s^2")
+    print(f"Tidal peak-to-peak : {stats.tidal_ptp * 1e6:.4f} um/s^2")
+    print(f"Tidal RMS          : {stats.tidal_std * 1e6:.4f} um/s^2")
+    print(f"g_total range      : [{stats.g_min:.8f}, "
+          f"{stats.g_max:.8f}] m/s^2")
 
+    # Sample table
+    rows = stats.rows()
     print(f"\n{'Time UTC':>20s}  {'Local (' + utc_label + ')':>20s}  {'g_total':>17s}  "
           f"{'tidal (um/s2)':>14s}  {'Moon':>10s}  {'Sun':>10s}")
     print('-' * 100)
-    for idx in rows:
-        if idx is None:
+    for row in rows:
+        if row is None:
             print(f"{'...':>20s}")
             continue
-        t = times[idx]
+        t, g_total, g_tidal, g_moon, g_sun = row
         t_local = t + local_dt
         print(f"{t.strftime('%Y-%m-%d %H:%M'):>20s}  "
               f"{t_local.strftime('%Y-%m-%d %H:%M'):>20s}  "
-              f"{data.g_total[idx]:17.10f}  "
-              f"{data.g_tidal[idx] * 1e6:14.4f}  "
-              f"{data.g_tidal_moon[idx] * 1e6:10.4f}  "
-              f"{data.g_tidal_sun[idx] * 1e6:10.4f}")
-
-    if args.csv:
-        with open(args.csv, 'w') as f:
-            f.write(f'time_utc,time_local_{utc_label},'
-                    'g_total_m_s2,g_static_m_s2,g_tidal_m_s2,'
-                    'g_tidal_moon_m_s2,g_tidal_sun_m_s2\n')
-            for i, t in enumerate(times):
-                t_local = t + local_dt
-                f.write(f"{t.isoformat()},{t_local.isoformat()},"
-                        f"{data.g_total[i]:.12e},"
-                        f"{data.g_static[i]:.12e},"
-                        f"{data.g_tidal[i]:.12e},"
-                        f"{data.g_tidal_moon[i]:.12e},"
-                        f"{data.g_tidal_sun[i]:.12e}\n")
-        print(f"\nSaved: {args.csv}")
+              f"{g_total:17.10f}  "
+              f"{g_tidal * 1e6:14.4f}  "
+              f"{g_moon * 1e6:10.4f}  "
+              f"{g_sun * 1e6:10.4f}")
+
+    if output:
+        print(f"\nSaved: {output} ({fmt})")
 
     if args.plot:
         try:
@@ -126,8 +471,9 @@ examples:
             print('matplotlib not available, skipping plot', file=sys.stderr)
             return
 
+        data = _concat_timeseries(kept)
         hours = np.array([(t - start).total_seconds() / 3600.0
-                          for t in times])
+                          for t in data.times])
 
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(10, 6), sharex=True)
 
@@ -17,11 +17,15 @@ tensor are less certain.
 Dependencies: numpy only.
 """
 
+import math
+
 import numpy as np
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import List
 
+from ._profiling import profiled as _profiled, stage as _stage
+
 # =============================================================================
 # Physical Constants
 # =============================================================================
@@ -63,15 +67,15 @@ def normal_gravity(lat_deg, alt_m):
 
     Parameters
     ----------
-    lat_deg : float
+    lat_deg : float or array_like
         Geodetic latitude in degrees.
-    alt_m : float
+    alt_m : float or array_like
         Altitude above the ellipsoid in meters.
 
     Returns
     -------
-    float
-        Normal gravity in m/s^2.
+    float or numpy.ndarray
+        Normal gravity in m/s^2, broadcast shape of the inputs.
     """
     phi = np.radians(lat_deg)
     sin2 = np.sin(phi) ** 2
@@ -101,38 +105,129 @@ def _as_utc_naive(dt):
     return dt.astimezone(timezone.utc).replace(tzinfo=None)
 
 
+# Epochs are carried as int64 nanoseconds since 1970-01-01T00:00 UTC and
+# converted to a split Julian Date (day + fraction).  The day part is an
+# exact half-integer and the fraction resolves ~10 ps, whereas a single
+# float JD near 2.46e6 is quantized at ~40 us.
+_UNIX_EPOCH    = datetime(1970, 1, 1)
+_UNIX_EPOCH_JD = 2440587.5          # JD of 1970-01-01T00:00 UTC
+_J2000_JD      = 2451545.0
+_NS_PER_DAY    = 86400 * 10 ** 9
+_ONE_US        = timedelta(microseconds=1)
+
+
+def _datetime_to_ns(dt):
+    """UTC nanoseconds since 1970 for a single datetime (exact)."""
+    return ((_as_utc_naive(dt) - _UNIX_EPOCH) // _ONE_US) * 1000
+
+
+@_profiled('time')
+def _epochs_to_ns(dt):
+    """Convert epochs to int64 UTC nanoseconds since 1970.
+
+    Parameters
+    ----------
+    dt : datetime, sequence of datetime or datetime64 array_like
+        UTC epoch(s).  ``numpy.datetime64`` values (any unit) are read as
+        UTC; int64 nanoseconds since 1970 are passed as ``datetime64[ns]``
+        (``ns.view('datetime64[ns]')``).
+
+    Returns
+    -------
+    numpy.ndarray
+        int64 nanoseconds, same shape as the input.
+
+    Raises
+    ------
+    TypeError
+        For plain numbers, which are ambiguous between Julian Dates and
+        nanoseconds.
+    """
+    if isinstance(dt, datetime):
+        return np.int64(_datetime_to_ns(dt))
+    arr = np.asarray(dt)
+    if arr.dtype == object:
+        return np.fromiter((_datetime_to_ns(t) for t in arr.reshape(-1)),
+                           dtype=np.int64, count=arr.size).reshape(arr.shape)
+    if np.issubdtype(arr.dtype, np.datetime64):
+        return arr.astype('datetime64[ns]').astype(np.int64)
+    if np.issubdtype(arr.dtype, np.number):
+        raise TypeError(
+            f"cannot interpret {arr.dtype} values as epochs; pass "
+            "datetime64 (e.g. ns.view('datetime64[ns]') for int64 "
+            "nanoseconds since 1970)")
+    raise TypeError(f"cannot interpret {arr.dtype} values as epochs")
+
+
+@_profiled('time')
+def _ns_to_jd_split(ns):
+    """Split Julian Date (day, fraction) from int64 UTC nanoseconds."""
+    days, rem = np.divmod(ns, _NS_PER_DAY)
+    return _UNIX_EPOCH_JD + days, rem / _NS_PER_DAY
+
+
+@_profiled('time')
+def julian_date_split(dt):
+    """Julian Date as an exact day part plus a fraction of a day.
+
+    Parameters
+    ----------
+    dt : datetime, sequence of datetime, datetime64 or numeric array_like
+        UTC epoch(s).  ``numpy.datetime64`` values are read as UTC and
+        plain numbers, integer or float, as Julian Dates.  Pass int64
+        nanoseconds since 1970 as ``datetime64[ns]``.
+
+    Returns
+    -------
+    tuple
+        (day, frac): *day* is the JD of the preceding 0h UTC (a
+        half-integer, exact in float64) and *frac* in [0, 1) is the elapsed
+        fraction of that day.  Scalars for a single epoch, arrays otherwise.
+    """
+    if isinstance(dt, datetime):
+        # Single epoch: integer arithmetic on the exact nanoseconds
+        days, rem = divmod(_datetime_to_ns(dt), _NS_PER_DAY)
+        return _UNIX_EPOCH_JD + days, rem / _NS_PER_DAY
+    arr = np.asarray(dt)
+    if (np.issubdtype(arr.dtype, np.number)
+            and not np.issubdtype(arr.dtype, np.complexfloating)):
+        arr = arr.astype(float)
+        day = np.floor(arr - 0.5) + 0.5
+        return day, arr - day
+    return _ns_to_jd_split(_epochs_to_ns(dt))
+
+
 def julian_date(dt):
-    """Convert a UTC datetime to Julian Date (Meeus algorithm).
+    """Convert UTC epoch(s) to Julian Date.
 
     Timezone-aware datetimes are converted to UTC first.  Naive datetimes
     are assumed to already be UTC.
 
     Parameters
     ----------
-    dt : datetime
-        UTC date and time.
+    dt : datetime, sequence of datetime, datetime64 or numeric array_like
+        UTC date and time(s); plain numbers are Julian Dates (see
+        :func:`julian_date_split`).
 
     Returns
     -------
-    float
-        Julian Date.
-    """
-    dt = _as_utc_naive(dt)
-    y, m = dt.year, dt.month
-    if m <= 2:
-        y -= 1
-        m += 12
-    A = y // 100
-    B = 2 - A + A // 4
-    jd = (int(365.25 * (y + 4716)) + int(30.6001 * (m + 1))
-          + dt.day + B - 1524.5)
-    jd += (dt.hour + dt.minute / 60.0 + dt.second / 3600.0) / 24.0
-    return jd
+    float or numpy.ndarray
+        Julian Date(s).  A single float carries ~40 us resolution; use
+        :func:`julian_date_split` where that matters.
+    """
+    day, frac = julian_date_split(dt)
+    jd = day + frac
+    return float(jd) if np.ndim(jd) == 0 else jd
+
+
+def _centuries(day, frac):
+    """Julian centuries since J2000.0 from a split Julian Date."""
+    return ((day - _J2000_JD) + frac) / 36525.0
 
 
 def _T(dt):
     """Julian centuries since J2000.0."""
-    return (julian_date(dt) - 2451545.0) / 36525.0
+    return _centuries(*julian_date_split(dt))
 
 
 def gmst_rad(dt):
@@ -140,30 +235,142 @@ def gmst_rad(dt):
 
     Parameters
     ----------
-    dt : datetime
-        UTC date and time.
+    dt : datetime, sequence of datetime, datetime64 or numeric array_like
+        UTC date and time(s); see :func:`julian_date_split`.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         GMST in radians.
     """
-    T = _T(dt)
-    JD = julian_date(dt)
+    theta = _gmst_split(*julian_date_split(dt))
+    return float(theta) if np.ndim(theta) == 0 else theta
+
+
+@_profiled('rotation')
+def _gmst_split(day, frac):
+    """GMST in radians from a split Julian Date (scalar or array).
+
+    The 360 deg/day rotation is reduced on the exact day part so that the
+    result keeps the resolution of *frac* over decades.
+    """
+    d = day - _J2000_JD
+    T = (d + frac) / 36525.0
     gmst_deg = (280.46061837
-                + 360.98564736629 * (JD - 2451545.0)
+                + (360.0 * d) % 360.0 + 0.98564736629 * d
+                + 360.98564736629 * frac
                 + 0.000387933 * T ** 2
                 - T ** 3 / 38710000.0) % 360.0
     return np.radians(gmst_deg)
 
 
-def _eci_to_ecef(x_eci, y_eci, z_eci, dt):
-    """Rotate ECI to ECEF using GMST."""
-    theta = gmst_rad(dt)
+def _eci_to_ecef(r_eci, dt):
+    """Rotate ECI to ECEF using GMST.
+
+    Parameters
+    ----------
+    r_eci : numpy.ndarray
+        (3,) or (N, 3) ECI vectors.
+    dt : datetime, sequence of datetime, datetime64 or numeric array_like
+        Epoch(s) as accepted by :func:`julian_date_split`; N epochs rotate
+        N vectors (or one vector N times) in a single pass.
+
+    Returns
+    -------
+    numpy.ndarray
+        ECEF vectors, broadcast shape (3,) or (N, 3).
+    """
+    return _rotate_gmst(np.asarray(r_eci, dtype=float),
+                        _gmst_split(*julian_date_split(dt)))
+
+
+@_profiled('rotation', lambda r, theta: r.size // 3)
+def _rotate_gmst(r_eci, theta):
+    """Rotate (..., 3) ECI vectors to ECEF by GMST angle(s) *theta*."""
+    if r_eci.ndim == 1 and np.ndim(theta) == 0:
+        c, s = math.cos(theta), math.sin(theta)
+        x, y, z = r_eci
+        return np.array((c * x + s * y, -s * x + c * y, z))
     c, s = np.cos(theta), np.sin(theta)
-    return (c * x_eci + s * y_eci,
-            -s * x_eci + c * y_eci,
-            z_eci)
+    x, y, z = r_eci[..., 0], r_eci[..., 1], r_eci[..., 2]
+    return np.stack((c * x + s * y, -s * x + c * y, z), axis=-1)
+
+
+def _grid_spec(start, end, interval_minutes=10.0, n_samples=None):
+    """Validate a sampling request and return (n, step_us).
+
+    Sample *i* lies ``i * step_us`` microseconds after *start*, rounded to
+    the nearest microsecond when *step_us* is fractional (n_samples mode).
+    """
+    if end < start:
+        raise ValueError("end must be >= start")
+    span_us = (end - start) // _ONE_US
+    if n_samples is not None:
+        if n_samples < 1:
+            raise ValueError("n_samples must be >= 1")
+        if n_samples == 1:
+            return 1, 0
+        return n_samples, span_us / (n_samples - 1)
+    if interval_minutes <= 0:
+        raise ValueError(
+            "interval_minutes must be > 0 when n_samples is not set")
+    step_us = timedelta(minutes=interval_minutes) // _ONE_US
+    if step_us == 0:
+        raise ValueError("interval_minutes must be >= 1 microsecond")
+    return span_us // step_us + 1, step_us
+
+
+def _grid_ns(start, step_us, lo, hi):
+    """Epochs *lo* .. *hi*-1 of a :func:`_grid_spec` grid as int64 UTC ns."""
+    index = np.arange(lo, hi, dtype=np.int64)
+    if isinstance(step_us, float):
+        offsets_us = np.rint(index * step_us).astype(np.int64)
+    else:
+        offsets_us = index * step_us
+    return _datetime_to_ns(start) + offsets_us * 1000
+
+
+@_profiled('time', lambda start, step_us, lo, hi: hi - lo)
+def _grid_slice(start, step_us, lo, hi):
+    """Epochs *lo* .. *hi*-1 of a grid from :func:`_grid_spec`.
+
+    Returns ``(times, ns)`` as for :func:`_time_grid`; any slicing of the
+    grid reproduces the corresponding samples of the full grid exactly.
+    """
+    ns = _grid_ns(start, step_us, lo, hi)
+    utc = ns.astype('datetime64[ns]').astype('datetime64[us]').tolist()
+    if start.tzinfo is None:
+        times = utc
+    else:
+        tz = start.tzinfo
+        times = [t.replace(tzinfo=timezone.utc).astimezone(tz) for t in utc]
+    return times, ns
+
+
+def _time_grid(start, end, interval_minutes=10.0, n_samples=None):
+    """Sample epochs between *start* and *end* (inclusive).
+
+    The grid is built in integer microseconds, so no per-sample datetime
+    arithmetic is needed.
+
+    Parameters
+    ----------
+    start, end : datetime
+        Window bounds (UTC).
+    interval_minutes : float
+        Time step in minutes.  Ignored if *n_samples* is set.
+    n_samples : int, optional
+        Number of evenly spaced samples (inclusive).
+
+    Returns
+    -------
+    times : list of datetime
+        Sample epochs, in the timezone of *start* if it is aware.
+    ns : numpy.ndarray
+        (N,) int64 UTC nanoseconds since 1970 of the same epochs.
+    """
+    n, step_us = _grid_spec(start, end, interval_minutes, n_samples)
+    return _grid_slice(start, step_us, 0, n)
 
 
 # =============================================================================
@@ -178,38 +385,58 @@ def sun_position_ecef(dt):
 
     Parameters
     ----------
-    dt : datetime
-        UTC date and time.
+    dt : datetime, sequence of datetime, datetime64 or numeric array_like
+        UTC date and time(s).  Arrays of ``numpy.datetime64`` are read as
+        UTC; plain numbers, integer or float, are Julian Dates.
 
     Returns
     -------
     numpy.ndarray
-        ECEF position vector [x, y, z] in meters.
+        ECEF position vector [x, y, z] in meters, shape (3,) for a single
+        epoch or (N, 3) for N epochs.
     """
-    T = _T(dt)
+    day, frac = julian_date_split(dt)
+    backend = _active_ephemeris(day, frac)
+    if backend is None:
+        sun = _sun_eci(_centuries(day, frac))
+    else:
+        sun = backend.eci(day, frac)[1]
+    return _rotate_gmst(sun, _gmst_split(day, frac))
+
 
+@_profiled('sun_series')
+def _sun_eci(T):
+    """Solar ECI position for Julian centuries *T* (scalar or array).
+
+    Returns
+    -------
+    numpy.ndarray
+        (..., 3) ECI position in meters.
+    """
+    xp = math if np.ndim(T) == 0 else np   # no ufunc overhead on scalars
     L0 = (280.46646 + 36000.76983 * T + 0.0003032 * T ** 2) % 360
     M  = (357.52911 + 35999.05029 * T - 0.0001537 * T ** 2) % 360
-    M_rad = np.radians(M)
+    M_rad = xp.radians(M)
 
-    C = ((1.914602 - 0.004817 * T - 0.000014 * T ** 2) * np.sin(M_rad)
-         + (0.019993 - 0.000101 * T) * np.sin(2.0 * M_rad)
-         + 0.000289 * np.sin(3.0 * M_rad))
+    C = ((1.914602 - 0.004817 * T - 0.000014 * T ** 2) * xp.sin(M_rad)
+         + (0.019993 - 0.000101 * T) * xp.sin(2.0 * M_rad)
+         + 0.000289 * xp.sin(3.0 * M_rad))
 
-    sun_lon = np.radians((L0 + C) % 360)
+    sun_lon = xp.radians((L0 + C) % 360)
 
     e = 0.016708634 - 0.000042037 * T
-    v_rad = np.radians((M + C) % 360)
-    R = AU * (1.000001018 * (1.0 - e ** 2)) / (1.0 + e * np.cos(v_rad))
+    v_rad = xp.radians((M + C) % 360)
+    R = AU * (1.000001018 * (1.0 - e ** 2)) / (1.0 + e * xp.cos(v_rad))
 
-    eps = np.radians(OBLIQUITY_J2000 - 0.013004 * T)
+    eps = xp.radians(OBLIQUITY_J2000 - 0.013004 * T)
 
-    x_eci = R * np.cos(sun_lon)
-    y_eci = R * np.sin(sun_lon) * np.cos(eps)
-    z_eci = R * np.sin(sun_lon) * np.sin(eps)
+    x_eci = R * xp.cos(sun_lon)
+    y_eci = R * xp.sin(sun_lon) * xp.cos(eps)
+    z_eci = R * xp.sin(sun_lon) * xp.sin(eps)
 
-    x, y, z = _eci_to_ecef(x_eci, y_eci, z_eci, dt)
-    return np.array([x, y, z])
+    if xp is math:
+        return np.array((x_eci, y_eci, z_eci))
+    return np.stack((x_eci, y_eci, z_eci), axis=-1)
 
 
 # =============================================================================
@@ -262,72 +489,174 @@ _LAT_TERMS = [
 ]
 
 
+# Additional longitude/latitude corrections (Meeus p. 338) as multipliers of
+# (D, Ms, Mp, F, Lp, A1, A2, A3) with coeff * 1e-6 deg
+_LON_EXTRA = [
+    (0, 0,  0, 0, 0, 1, 0, 0,  3958), (0, 0,  0, -1, 1, 0, 0, 0,  1962),
+    (0, 0,  0, 0, 0, 0, 1, 0,   318),
+]
+_LAT_EXTRA = [
+    (0, 0,  0, 0, 1, 0, 0, 0, -2235), (0, 0,  0,  0, 0, 0, 0, 1,   382),
+    (0, 0,  0, -1, 0, 1, 0, 0,  175), (0, 0,  0,  1, 0, 1, 0, 0,   175),
+    (0, 0, -1, 0, 1, 0, 0, 0,   127), (0, 0,  1,  0, 1, 0, 0, 0,  -115),
+]
+
+_SERIES_BLOCK = 8192   # epochs per block in the matrix-form lunar series
+_NETWORK_BLOCK = 1 << 20   # station-epoch pairs per (S, n, 3) tidal block
+_CHUNK_SIZE = 1 << 16      # default epochs per iter_timeseries chunk
+
+
+def _build_series_matrix():
+    """Merge the lunar series into one argument table.
+
+    Every distinct argument appears once as a row of integer multipliers
+    of (D, Ms, Mp, F, Lp, A1, A2, A3).  Rows carrying a distance term come
+    first, so the cosine pass only touches the leading ``n_dist`` rows.
+
+    Returns
+    -------
+    mult : numpy.ndarray
+        (K, 8) integer multiplier matrix.
+    sin_coeff : numpy.ndarray
+        (K, 6) coefficients of sin(arg) for [lon, lat] x [E^0, E^1, E^2].
+    cos_coeff : numpy.ndarray
+        (n_dist, 3) coefficients of cos(arg) for distance x [E^0, E^1, E^2].
+    n_dist : int
+        Number of leading rows with a distance term.
+    """
+    rows = {}
+    def _add(mult, series, coeff):
+        rows.setdefault(tuple(mult), np.zeros(3))[series] += coeff
+    for d, ms, mp, f, coeff in _DIST_TERMS:
+        _add((d, ms, mp, f, 0, 0, 0, 0), 1, coeff)
+    for d, ms, mp, f, coeff in _LON_TERMS:
+        _add((d, ms, mp, f, 0, 0, 0, 0), 0, coeff)
+    for d, ms, mp, f, coeff in _LAT_TERMS:
+        _add((d, ms, mp, f, 0, 0, 0, 0), 2, coeff)
+    for *mult, coeff in _LON_EXTRA:
+        _add(mult, 0, coeff)
+    for *mult, coeff in _LAT_EXTRA:
+        _add(mult, 2, coeff)
+
+    mult = np.array(list(rows), dtype=np.int64)
+    coeff = np.array(list(rows.values()))
+    n_dist = int(np.count_nonzero(coeff[:, 1]))
+
+    # Eccentricity factor E^|Ms| becomes a column choice
+    ecc = np.abs(mult[:, 1])
+    sin_coeff = np.zeros((len(mult), 2, 3))
+    cos_coeff = np.zeros((n_dist, 3))
+    k = np.arange(len(mult))
+    sin_coeff[k, 0, ecc] = coeff[:, 0]
+    sin_coeff[k, 1, ecc] = coeff[:, 2]
+    cos_coeff[k[:n_dist], ecc[:n_dist]] = coeff[:n_dist, 1]
+    return mult, sin_coeff.reshape(-1, 6), cos_coeff, n_dist
+
+
+_SERIES_MULT, _SIN_COEFF, _COS_COEFF, _N_DIST_ROWS = _build_series_matrix()
+_SERIES_MULT_T = _SERIES_MULT.T.astype(float)   # (8, K) for 1-D products
+
 def moon_position_ecef(dt):
     """Moon position in ECEF coordinates.
 
     Truncated Meeus (ch. 47) ephemeris using 24 longitude, 23 distance,
     and 18 latitude terms.  Accuracy ~0.1 deg in position, ~200 km in
-    distance.
+    distance.  All epochs are evaluated together in matrix form; a single
+    epoch sums the series over term vectors directly.
 
     Parameters
     ----------
-    dt : datetime
-        UTC date and time.
+    dt : datetime, sequence of datetime, datetime64 or numeric array_like
+        UTC date and time(s).  Arrays of ``numpy.datetime64`` are read as
+        UTC; plain numbers, integer or float, are Julian Dates.
 
     Returns
     -------
     numpy.ndarray
-        ECEF position vector [x, y, z] in meters.
-    """
-    T = _T(dt)
-
-    # Fundamental arguments (degrees)
-    Lp = (218.3164477 + 481267.88123421 * T
-          - 0.0015786 * T ** 2 + T ** 3 / 538841.0) % 360
-    D  = (297.8501921 + 445267.1114034 * T
-          - 0.0018819 * T ** 2 + T ** 3 / 545868.0) % 360
-    Mp = (134.9633964 + 477198.8675055 * T
-          + 0.0087414 * T ** 2 + T ** 3 / 69699.0) % 360
-    Ms = (357.5291092 + 35999.0502909 * T
-          - 0.0001536 * T ** 2) % 360
-    F  = (93.2720950 + 483202.0175233 * T
-          - 0.0036539 * T ** 2 - T ** 3 / 3526000.0) % 360
-
-    Lp_r = np.radians(Lp)
-    D_r  = np.radians(D)
-    Mp_r = np.radians(Mp)
-    Ms_r = np.radians(Ms)
-    F_r  = np.radians(F)
+        ECEF position vector [x, y, z] in meters, shape (3,) for a single
+        datetime or (N, 3) for N epochs.
+    """
+    day, frac = julian_date_split(dt)
+    backend = _active_ephemeris(day, frac)
+    if backend is None:
+        moon = _moon_eci(_centuries(day, frac))
+    else:
+        moon = backend.eci(day, frac)[0]
+    return _rotate_gmst(moon, _gmst_split(day, frac))
+
+
+@_profiled('moon_series')
+def _moon_eci(T):
+    """Lunar ECI position for Julian centuries *T* (scalar or array).
 
+    The epochs are processed in blocks of ``_SERIES_BLOCK`` so that the
+    (N, K) argument matrix stays cache-sized.
+
+    Returns
+    -------
+    numpy.ndarray
+        (..., 3) ECI position in meters.
+    """
+    T = np.asarray(T, dtype=float)
+    if T.ndim == 0:
+        return _moon_eci_scalar(float(T))
+    T_flat = T.reshape(-1)
+    out = np.empty((T_flat.size, 3))
+    for i in range(0, T_flat.size, _SERIES_BLOCK):
+        out[i:i + _SERIES_BLOCK] = _moon_eci_block(
+            T_flat[i:i + _SERIES_BLOCK])
+    return out.reshape(T.shape + (3,))
+
+
+def _moon_eci_scalar(T):
+    """Lunar ECI position for a single Julian century value *T*.
+
+    Sums the series over (K,) term vectors, without the (N, K) argument
+    matrix, the block loop or the uniform-grid check of the array path.
+    """
+    T2 = T * T
+    c0, c1, c2, c3 = _FUND_POLY.T
+    fund = (c0 + c1 * T + c2 * T2 + c3 * (T2 * T)) % 360
+    args = np.radians(fund) @ _SERIES_MULT_T
+    sums = np.concatenate((np.sin(args) @ _SIN_COEFF,
+                           np.cos(args[:_N_DIST_ROWS]) @ _COS_COEFF))
+    E = 1.0 - 0.002516 * T - 0.0000074 * T2
+    sum_l, sum_b, sum_r = sums.reshape(3, 3) @ (1.0, E, E * E)
+
+    lam    = math.radians(fund[4] + sum_l / 1e6)
+    beta   = math.radians(sum_b / 1e6)
+    dist_m = (385000.56 + sum_r / 1000.0) * 1000.0
+
+    eps = math.radians(OBLIQUITY_J2000 - 0.013004 * T)
+    cb, sb = math.cos(beta), math.sin(beta)
+    cl, sl = math.cos(lam),  math.sin(lam)
+    ce, se = math.cos(eps),  math.sin(eps)
+    return np.array((dist_m * cb * cl,
+                     dist_m * (cb * sl * ce - sb * se),
+                     dist_m * (cb * sl * se + sb * ce)))
+
+
+def _moon_eci_block(T):
+    """Lunar ECI position for a 1-D block of Julian centuries.
+
+    Evenly spaced blocks take the angle-addition path of
+    :func:`_uniform_series_sums`; any other block sums the series directly.
+    """
     E = 1.0 - 0.002516 * T - 0.0000074 * T ** 2
 
-    def _sum_series(terms, use_cos=False):
-        total = 0.0
-        for d, ms, mp, f, coeff in terms:
-            arg = d * D_r + ms * Ms_r + mp * Mp_r + f * F_r
-            e_corr = E ** abs(ms)
-            if use_cos:
-                total += coeff * e_corr * np.cos(arg)
-            else:
-                total += coeff * e_corr * np.sin(arg)
-        return total
-
-    sum_l = _sum_series(_LON_TERMS)
-    sum_r = _sum_series(_DIST_TERMS, use_cos=True)
-    sum_b = _sum_series(_LAT_TERMS)
-
-    # Additional corrections (Meeus p. 338)
-    A1 = np.radians((119.75 + 131.849 * T) % 360)
-    A2 = np.radians((53.09 + 479264.290 * T) % 360)
-    A3 = np.radians((313.45 + 481266.484 * T) % 360)
-
-    sum_l += (3958 * np.sin(A1) + 1962 * np.sin(Lp_r - F_r)
-              + 318 * np.sin(A2))
-    sum_b += (-2235 * np.sin(Lp_r) + 382 * np.sin(A3)
-              + 175 * np.sin(A1 - F_r) + 175 * np.sin(A1 + F_r)
-              + 127 * np.sin(Lp_r - Mp_r) - 115 * np.sin(Lp_r + Mp_r))
-
-    lam    = np.radians(Lp + sum_l / 1e6)         # ecliptic longitude
+    # Columns: [lon, lat, dist] x [E^0, E^1, E^2]
+    sums = _uniform_series_sums(T) if _UNIFORM_SERIES else None
+    if sums is None:
+        fund = _fundamental_args(T)
+        sums = _series_sums(np.radians(fund))
+        Lp = fund[:, 4]
+    else:
+        Lp = _fundamental_args(T, _LP)[:, 0]
+    e_pow = np.stack((np.ones_like(E), E, E * E), axis=-1)
+    sum_l, sum_b, sum_r = np.einsum('nsp,np->sn', sums.reshape(-1, 3, 3),
+                                    e_pow)
+
+    lam    = np.radians(Lp + sum_l / 1e6)          # ecliptic longitude
     beta   = np.radians(sum_b / 1e6)               # ecliptic latitude
     dist_m = (385000.56 + sum_r / 1000.0) * 1000.0 # meters
 
@@ -341,8 +670,215 @@ def moon_position_ecef(dt):
     y_eci = dist_m * (cb * sl * ce - sb * se)
     z_eci = dist_m * (cb * sl * se + sb * ce)
 
-    x, y, z = _eci_to_ecef(x_eci, y_eci, z_eci, dt)
-    return np.array([x, y, z])
+    return np.stack((x_eci, y_eci, z_eci), axis=-1)
+
+
+# Fundamental arguments (D, Ms, Mp, F, Lp, A1, A2, A3) as cubic polynomials
+# in T: degrees per T^0 .. T^3 (Meeus ch. 47 and p. 338)
+_FUND_POLY = np.array([
+    [297.8501921, 445267.1114034,  -0.0018819,  1.0 / 545868.0],   # D
+    [357.5291092,  35999.0502909,  -0.0001536,  0.0],              # Ms
+    [134.9633964, 477198.8675055,   0.0087414,  1.0 / 69699.0],    # Mp
+    [ 93.2720950, 483202.0175233,  -0.0036539, -1.0 / 3526000.0],  # F
+    [218.3164477, 481267.88123421, -0.0015786,  1.0 / 538841.0],   # Lp
+    [119.75,         131.849,       0.0,        0.0],              # A1
+    [ 53.09,      479264.290,       0.0,        0.0],              # A2
+    [313.45,      481266.484,       0.0,        0.0],              # A3
+])
+_LP = [4]
+
+
+def _fundamental_args(T, rows=slice(None)):
+    """(N, 8) fundamental arguments in degrees, reduced to [0, 360).
+
+    *rows* selects arguments (rows of ``_FUND_POLY``) to evaluate.
+    """
+    T = T[:, None]
+    T2 = T * T
+    c0, c1, c2, c3 = _FUND_POLY[rows].T
+    return (c0 + c1 * T + c2 * T2 + c3 * (T2 * T)) % 360
+
+
+def _series_sums(fund_rad):
+    """(N, 9) sums of the lunar series from (N, 8) fundamental arguments.
+
+    Every series argument for every epoch is one (N, 8) @ (8, K) product;
+    the sums are [lon, lat] x [E^0, E^1, E^2] of the sines followed by
+    dist x [E^0, E^1, E^2] of the cosines.
+    """
+    args = fund_rad @ _SERIES_MULT.T
+    return np.hstack((np.sin(args) @ _SIN_COEFF,
+                      np.cos(args[:, :_N_DIST_ROWS]) @ _COS_COEFF))
+
+
+# Uniform-grid evaluation of the lunar series (see _uniform_series_sums)
+_UNIFORM_SERIES = True
+_UNIFORM_MIN = 64          # shortest block worth the setup
+_UNIFORM_TOL = 1e-12       # bound on the argument error [rad]
+
+
+def _build_uniform_coeff():
+    """Series rows grouped by eccentricity power for the uniform path.
+
+    Returns, per power E^0, E^1, E^2, the row indices of the terms carrying
+    it and their (k, 3) [lon, lat, dist] coefficients of sin(arg) and of
+    cos(arg).
+    """
+    sin_c = _SIN_COEFF.reshape(-1, 2, 3)
+    cos_c = np.zeros((len(_SERIES_MULT), 3))
+    cos_c[:_N_DIST_ROWS] = _COS_COEFF
+    ecc = np.abs(_SERIES_MULT[:, 1])
+    groups = []
+    for p in range(3):
+        rows = np.flatnonzero(ecc == p)
+        sin_part, cos_part = np.zeros((rows.size, 3)), np.zeros((rows.size, 3))
+        sin_part[:, :2] = sin_c[rows, :, p]
+        cos_part[:, 2] = cos_c[rows, p]
+        groups.append((rows, sin_part, cos_part))
+    return groups
+
+
+_UNIFORM_GROUPS = _build_uniform_coeff()
+
+
+def _uniform_series_sums(T):
+    """:func:`_series_sums` on an evenly spaced block by angle addition.
+
+    The block is cut into groups of s x s epochs.  Every series argument is
+    evaluated exactly at the s anchors of a group (every s-th epoch) and
+    advanced from there by multiples of its per-step increment, taken at
+    the group centre::
+
+        sin(a + r d) = sin(a) cos(r d) + cos(a) sin(r d)
+
+    so each group needs the sines and cosines of its s anchors and s
+    offsets only, and the products are summed as one matrix product
+    instead of taking sin/cos per epoch and term.  The anchors resync the
+    recurrence every s steps; s is the largest side for which the neglected
+    curvature of the arguments stays below ``_UNIFORM_TOL``.
+
+    Returns
+    -------
+    numpy.ndarray or None
+        (N, 9) sums, or None when *T* is not evenly spaced (to rounding)
+        or too short or coarse for the recurrence to pay off.
+    """
+    n = T.size
+    if n < _UNIFORM_MIN:
+        return None
+    step = (T[-1] - T[0]) / (n - 1)
+    t_max = max(abs(T[0]), abs(T[-1]))
+    if step == 0.0 or np.max(np.abs(
+            T - (T[0] + np.arange(n) * step))) > 8 * np.spacing(t_max):
+        return None
+
+    # Largest second derivative of any series argument [rad / century^2]
+    mult = np.abs(_SERIES_MULT)
+    curv = np.radians(mult @ (2 * np.abs(_FUND_POLY[:, 2])
+                              + 6 * np.abs(_FUND_POLY[:, 3]) * (t_max + 1)))
+    # Error of a group ~ curv * (s^2 step / 2) * (s step)
+    side = int(np.cbrt(2 * _UNIFORM_TOL / (curv.max() * step * step)))
+    side = min(side, int(np.ceil(np.sqrt(n))))
+    if side < 8:
+        return None
+    groups = -(-n // (side * side))
+
+    # Exact arguments at the anchors: (groups, side, K)
+    anchors = T[0] + np.arange(groups * side) * (side * step)
+    theta = (np.radians(_fundamental_args(anchors)) @ _SERIES_MULT.T
+             ).reshape(groups, side, -1)
+    # Per-step increments at the group centres: (groups, K)
+    mid = T[0] + (np.arange(groups) * side * side
+                  + (side * side - 1) / 2) * step
+    _, c1, c2, c3 = _FUND_POLY.T
+    rate = np.radians(c1 + 2 * c2 * mid[:, None] + 3 * c3 * mid[:, None] ** 2)
+    phi = (np.arange(side)[None, :, None]
+           * (rate @ _SERIES_MULT.T * step)[:, None, :])
+
+    # sum_k c_k sin(a + r d) = sum_k [c_k sin a, c_k cos a] . [cos rd, sin rd]
+    # and likewise for the cosine sums, one product per power of E:
+    # (groups, side*3, 2k) @ (groups, 2k, side) -> (groups, side, 3, side)
+    sa, ca, cp, sp = np.sin(theta), np.cos(theta), np.cos(phi), np.sin(phi)
+    sums = np.empty((groups, side, side, 3, 3))
+    for p, (rows, sin_c, cos_c) in enumerate(_UNIFORM_GROUPS):
+        s_a, c_a = sa[..., rows, None], ca[..., rows, None]
+        left = np.concatenate((s_a * sin_c + c_a * cos_c,
+                               c_a * sin_c - s_a * cos_c), axis=2)
+        left = left.transpose(0, 1, 3, 2).reshape(groups, side * 3, -1)
+        right = np.concatenate((cp[..., rows], sp[..., rows]), axis=2)
+        part = (left @ right.transpose(0, 2, 1)).reshape(groups, side, 3, side)
+        sums[..., p] = part.transpose(0, 1, 3, 2)
+    return sums.reshape(-1, 9)[:n]
+
+
+def _meeus_eci(day, frac):
+    """Moon and Sun ECI positions from the Meeus series.
+
+    Parameters
+    ----------
+    day, frac : numpy.ndarray
+        (N,) split Julian Dates from :func:`julian_date_split`.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        (moon_eci, sun_eci), each (N, 3) in meters.
+    """
+    T = _centuries(day, frac)
+    return _moon_eci(T), _sun_eci(T)
+
+
+# Process-wide default backend, set through pytheas.ephem.set_ephemeris()
+_EPHEMERIS = None
+
+
+def _active_ephemeris(day, frac):
+    """Configured default backend if it covers all epochs, else None."""
+    backend = _EPHEMERIS
+    if backend is not None and backend.covers(day, frac):
+        return backend
+    return None
+
+
+def _ephemerides_ecef(day, frac, ephemeris=None):
+    """Moon and Sun ECEF positions for a split Julian Date.
+
+    Parameters
+    ----------
+    day, frac : numpy.ndarray
+        (N,) split Julian Dates from :func:`julian_date_split`.
+    ephemeris : object, optional
+        Ephemeris backend providing ``eci(day, frac) -> (moon, sun)``, e.g.
+        :class:`pytheas.ephem.ChebyshevEphemeris`.  Defaults to the backend
+        configured with :func:`pytheas.ephem.set_ephemeris` when it covers
+        the epochs, otherwise the direct Meeus series.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        (R_moon, R_sun), each (N, 3) in meters.
+
+    Notes
+    -----
+    Epochs are evaluated in blocks of ``_SERIES_BLOCK`` counted from the
+    first one.  Matrix products may round differently for different
+    operand sizes, so any caller splitting a long grid at multiples of
+    ``_SERIES_BLOCK`` gets bit-identical positions to a one-shot call.
+    """
+    if ephemeris is None:
+        ephemeris = _active_ephemeris(day, frac)
+    eci = _meeus_eci if ephemeris is None else ephemeris.eci
+
+    n = np.size(day)
+    if np.ndim(day) == 1 and n > _SERIES_BLOCK:
+        moon, sun = np.empty((n, 3)), np.empty((n, 3))
+        for i in range(0, n, _SERIES_BLOCK):
+            blk = slice(i, i + _SERIES_BLOCK)
+            moon[blk], sun[blk] = eci(day[blk], frac[blk])
+    else:
+        moon, sun = eci(day, frac)
+    theta = _gmst_split(day, frac)
+    return _rotate_gmst(moon, theta), _rotate_gmst(sun, theta)
 
 
 # =============================================================================
@@ -354,25 +890,27 @@ def geodetic_to_ecef(lat_deg, lon_deg, alt_m):
 
     Parameters
     ----------
-    lat_deg : float
+    lat_deg : float or array_like
         Geodetic latitude in degrees.
-    lon_deg : float
+    lon_deg : float or array_like
         Geodetic longitude in degrees (east positive).
-    alt_m : float
+    alt_m : float or array_like
         Altitude above the WGS84 ellipsoid in meters.
 
     Returns
     -------
     numpy.ndarray
-        ECEF position vector [x, y, z] in meters.
+        ECEF position vector [x, y, z] in meters; (..., 3) for the
+        broadcast shape of the inputs.
     """
     phi = np.radians(lat_deg)
     lam = np.radians(lon_deg)
     sp, cp = np.sin(phi), np.cos(phi)
     N = A_WGS84 / np.sqrt(1.0 - E2 * sp ** 2)
-    return np.array([(N + alt_m) * cp * np.cos(lam),
-                     (N + alt_m) * cp * np.sin(lam),
-                     (N * (1.0 - E2) + alt_m) * sp])
+    x, y, z = np.broadcast_arrays((N + alt_m) * cp * np.cos(lam),
+                                  (N + alt_m) * cp * np.sin(lam),
+                                  (N * (1.0 - E2) + alt_m) * sp)
+    return np.stack((x, y, z), axis=-1)
 
 
 def enu_basis(lat_deg, lon_deg):
@@ -380,23 +918,24 @@ def enu_basis(lat_deg, lon_deg):
 
     Parameters
     ----------
-    lat_deg : float
+    lat_deg : float or array_like
         Geodetic latitude in degrees.
-    lon_deg : float
+    lon_deg : float or array_like
         Geodetic longitude in degrees.
 
     Returns
     -------
     tuple of numpy.ndarray
-        (e_east, e_north, e_up) unit vectors in ECEF coordinates.
+        (e_east, e_north, e_up) unit vectors in ECEF coordinates, each
+        (3,) or (..., 3) for the broadcast shape of the inputs.
     """
     phi = np.radians(lat_deg)
     lam = np.radians(lon_deg)
-    sp, cp = np.sin(phi), np.cos(phi)
-    sl, cl = np.sin(lam), np.cos(lam)
-    e_east  = np.array([-sl,      cl,       0.0])
-    e_north = np.array([-sp * cl, -sp * sl, cp])
-    e_up    = np.array([ cp * cl,  cp * sl, sp])
+    sp, cp, sl, cl = np.broadcast_arrays(np.sin(phi), np.cos(phi),
+                                         np.sin(lam), np.cos(lam))
+    e_east  = np.stack((-sl,      cl,       np.zeros_like(sl)), axis=-1)
+    e_north = np.stack((-sp * cl, -sp * sl, cp), axis=-1)
+    e_up    = np.stack(( cp * cl,  cp * sl, sp), axis=-1)
     return e_east, e_north, e_up
 
 
@@ -405,23 +944,23 @@ def measurement_axis(lat_deg, lon_deg, zenith_deg=0.0, azimuth_deg=0.0):
 
     Parameters
     ----------
-    lat_deg : float
+    lat_deg : float or array_like
         Geodetic latitude in degrees.
-    lon_deg : float
+    lon_deg : float or array_like
         Geodetic longitude in degrees.
-    zenith_deg : float
+    zenith_deg : float or array_like
         Angle from vertical.  0 = straight up, 90 = horizontal.
-    azimuth_deg : float
+    azimuth_deg : float or array_like
         Azimuth of the horizontal projection, clockwise from north.
 
     Returns
     -------
     numpy.ndarray
-        Unit vector in ECEF coordinates.
+        Unit vector in ECEF coordinates; (..., 3) for array inputs.
     """
     e_e, e_n, e_u = enu_basis(lat_deg, lon_deg)
-    zen = np.radians(zenith_deg)
-    azi = np.radians(azimuth_deg)
+    zen = np.radians(zenith_deg)[..., None]
+    azi = np.radians(azimuth_deg)[..., None]
     return (np.cos(zen) * e_u
             + np.sin(zen) * (np.cos(azi) * e_n + np.sin(azi) * e_e))
 
@@ -438,19 +977,61 @@ def tidal_acceleration(r, R, GM):
     Parameters
     ----------
     r : numpy.ndarray
-        Observer position in ECEF (meters).
+        Observer position in ECEF (meters), shape (3,) or (..., 3).
     R : numpy.ndarray
-        Celestial body position in ECEF (meters).
+        Celestial body position in ECEF (meters), shape (3,) or (..., 3).
     GM : float
         Gravitational parameter of the body (m^3/s^2).
 
     Returns
     -------
     numpy.ndarray
-        Tidal acceleration vector in ECEF (m/s^2).
+        Tidal acceleration vector in ECEF (m/s^2), broadcast shape of
+        *r* and *R*.
+    """
+    return _tidal_acceleration_kernel(np.asarray(r, dtype=float),
+                                      np.asarray(R, dtype=float), GM)
+
+
+def _inverse_cube_norm(v, GM):
+    """GM / |v|^3 over the last axis of *v*, shape (...,), in one pass."""
+    v2 = np.einsum('...k,...k->...', v, v)
+    return GM / (v2 * np.sqrt(v2))
+
+
+def _pair_count(r, R, GM):
+    """Site-epoch pairs of a broadcast kernel call (profiling)."""
+    return int(np.prod(np.broadcast_shapes(np.shape(r), np.shape(R))[:-1]))
+
+
+@_profiled('tidal', _pair_count)
+def _tidal_acceleration_kernel(r, R, GM):
+    """Broadcasting core of :func:`tidal_acceleration` for (..., 3) arrays.
+
+    The norms come from a single einsum contraction each and the result is
+    accumulated in place in the ``R - r`` buffer.
+    """
+    d = np.subtract(R, r)
+    d *= _inverse_cube_norm(d, GM)[..., None]
+    d -= R * _inverse_cube_norm(R, GM)[..., None]
+    return d
+
+
+@_profiled('tidal_gradient', _pair_count)
+def _tidal_gradient_kernel(r, R, GM):
+    """Broadcasting core of :func:`_tidal_gradient_tensor`.
+
+    Returns (..., 3, 3) tensors built from one einsum outer product, with
+    the isotropic term subtracted in place on the diagonal.
     """
-    d = R - r
-    return GM * (d / np.linalg.norm(d) ** 3 - R / np.linalg.norm(R) ** 3)
+    d = np.subtract(R, r)
+    d2 = np.einsum('...k,...k->...', d, d)
+    inv3 = _inverse_cube_norm(d, GM)
+    T = np.einsum('...i,...j->...ij', d, d)
+    T *= (3.0 * inv3 / d2)[..., None, None]
+    diag = np.einsum('...ii->...i', T)    # writable view of the diagonal
+    diag -= inv3[..., None]
+    return T
 
 
 # =============================================================================
@@ -480,17 +1061,17 @@ def _ecef_to_enu_vector(v_ecef, enu):
     Parameters
     ----------
     v_ecef : numpy.ndarray
-        (3,) vector in ECEF.
+        (3,) or (..., 3) vector in ECEF.
     enu : tuple of numpy.ndarray
         (e_east, e_north, e_up) basis vectors from enu_basis().
 
     Returns
     -------
     numpy.ndarray
-        (3,) vector in ENU.
+        Vector in ENU, same shape as *v_ecef*.
     """
     R = np.array(enu)  # (3,3) rows = E, N, U in ECEF
-    return R @ v_ecef
+    return v_ecef @ R.T
 
 
 def _ecef_to_enu_tensor(T_ecef, enu):
@@ -499,14 +1080,14 @@ def _ecef_to_enu_tensor(T_ecef, enu):
     Parameters
     ----------
     T_ecef : numpy.ndarray
-        (3,3) tensor in ECEF.
+        (3,3) or (..., 3, 3) tensor in ECEF.
     enu : tuple of numpy.ndarray
         (e_east, e_north, e_up) basis vectors from enu_basis().
 
     Returns
     -------
     numpy.ndarray
-        (3,3) tensor in ENU.
+        Tensor in ENU, same shape as *T_ecef*.
     """
     R = np.array(enu)  # (3,3) rows = E, N, U in ECEF
     return R @ T_ecef @ R.T
@@ -521,22 +1102,20 @@ def _tidal_gradient_tensor(r, R, GM):
     Parameters
     ----------
     r : numpy.ndarray
-        Observer position in ECEF (meters).
+        Observer position in ECEF (meters), shape (3,) or (..., 3).
     R : numpy.ndarray
-        Celestial body position in ECEF (meters).
+        Celestial body position in ECEF (meters), shape (3,) or (..., 3).
     GM : float
         Gravitational parameter of the body (m^3/s^2).
 
     Returns
     -------
     numpy.ndarray
-        (3,3) tidal gradient tensor in ECEF (s^-2).
+        (3,3) tidal gradient tensor in ECEF (s^-2); (..., 3, 3) for the
+        broadcast shape of *r* and *R*.
     """
-    d = R - r
-    d_norm = np.linalg.norm(d)
-    d3 = d_norm ** 3
-    d5 = d_norm ** 5
-    return GM * (-np.eye(3) / d3 + 3.0 * np.outer(d, d) / d5)
+    return _tidal_gradient_kernel(np.asarray(r, dtype=float),
+                                  np.asarray(R, dtype=float), GM)
 
 
 def _earth_gradient_tensor(lat_deg, alt_m):
@@ -586,13 +1165,20 @@ class GravityField:
 
     All vectors and tensors are in the local ENU (East-North-Up) frame.
 
+    Constructing a field directly copies the arrays and makes them
+    read-only.  Fields returned by :meth:`LabFrame.field` instead take
+    ownership of the freshly computed arrays without copies; they are
+    writable unless requested with ``readonly=True``.  The slotted layout
+    keeps either kind cheap to create in integrator loops.
+
     Attributes
     ----------
     g : numpy.ndarray
         (3,) gravity vector [m/s^2].  Convention: g points downward,
         so g[2] < 0 for a surface lab.
     omega : numpy.ndarray
-        (3,) Earth rotation vector [rad/s].
+        (3,) Earth rotation vector [rad/s].  Always read-only: it is
+        shared by every field of a :class:`LabFrame`.
     T : numpy.ndarray
         (3,3) gravity gradient tensor [s^-2].
     g_normal : float
@@ -602,6 +1188,9 @@ class GravityField:
     g_tidal_sun : numpy.ndarray
         (3,) solar tidal acceleration in ENU [m/s^2].
     """
+    __slots__ = ('g', 'omega', 'T', 'g_normal', 'g_tidal_moon',
+                 'g_tidal_sun')
+
     g: np.ndarray
     omega: np.ndarray
     T: np.ndarray
@@ -615,40 +1204,55 @@ class GravityField:
             arr.flags.writeable = False
             object.__setattr__(self, name, arr)
 
-    def at(self, offset):
-        """Gravity at a displacement from the lab origin.
+    # Frozen slotted classes cannot be unpickled through setattr
+    def __getstate__(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state):
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
+    def at(self, offset, out=None):
+        """Gravity at displacements from the lab origin.
 
         Parameters
         ----------
         offset : array_like
-            (3,) displacement in ENU [meters].
+            (3,) or (N, 3) displacement(s) in ENU [meters].
+        out : numpy.ndarray, optional
+            Array of the result shape to write into.
 
         Returns
         -------
         numpy.ndarray
-            (3,) gravity vector at the offset [m/s^2].
+            (3,) or (N, 3) gravity vector(s) at the offsets [m/s^2].
         """
-        return self.g + self.T @ np.asarray(offset, dtype=float)
+        out = np.matmul(np.asarray(offset, dtype=float), self.T.T, out=out)
+        out += self.g
+        return out
 
     def reading(self, axis, offset=None):
-        """Projected gravity reading along a measurement axis.
+        """Projected gravity reading along measurement axes.
 
         Parameters
         ----------
         axis : array_like
-            (3,) unit vector in ENU defining the measurement direction.
+            (3,) unit vector, or (K, 3) unit vectors, in ENU defining the
+            measurement directions.
         offset : array_like, optional
-            (3,) displacement from the lab origin [meters].
+            (3,) or (N, 3) displacement(s) from the lab origin [meters].
 
         Returns
         -------
-        float
-            Gravity component along *axis* [m/s^2].
+        float or numpy.ndarray
+            Gravity component along *axis* [m/s^2]: a float for one axis
+            and one position, else (K,), (N,) or (N, K) readings.
         """
         g_local = self.at(offset) if offset is not None else self.g
-        return float(np.dot(g_local, np.asarray(axis, dtype=float)))
+        r = g_local @ np.asarray(axis, dtype=float).T
+        return float(r) if r.ndim == 0 else r
 
-    def eom(self, dx, v):
+    def eom(self, dx, v, out=None):
         """Equation of motion in the rotating lab frame.
 
         Returns  g + T @ dx - 2 * (omega x v).
@@ -659,18 +1263,123 @@ class GravityField:
         Parameters
         ----------
         dx : array_like
-            (3,) displacement from lab origin [meters].
+            (3,) or (N, 3) displacement(s) from lab origin [meters].
         v : array_like
-            (3,) velocity in the lab frame [m/s].
+            (3,) or (N, 3) velocity(ies) in the lab frame [m/s].
+        out : numpy.ndarray, optional
+            Array of the broadcast shape of *dx* and *v* to write into.
 
         Returns
         -------
         numpy.ndarray
-            (3,) acceleration [m/s^2].
+            (3,) or (N, 3) acceleration(s) [m/s^2].
         """
         dx = np.asarray(dx, dtype=float)
         v = np.asarray(v, dtype=float)
-        return self.g + self.T @ dx - 2.0 * np.cross(self.omega, v)
+        shape = np.broadcast_shapes(dx.shape, v.shape)
+
+        # [dx, v] @ [T^T; -2 W^T], with W the cross-product matrix of omega
+        wx, wy, wz = 2.0 * self.omega
+        op = np.empty((6, 3))
+        op[:3] = self.T.T
+        op[3:] = ((0.0, -wz, wy), (wz, 0.0, -wx), (-wy, wx, 0.0))
+        state = np.empty(shape[:-1] + (6,))
+        state[..., :3] = dx
+        state[..., 3:] = v
+        out = np.matmul(state, op, out=out)
+        out += self.g
+        return out
+
+    @classmethod
+    def _view(cls, g, omega, T, g_normal, g_tidal_moon, g_tidal_sun):
+        """Wrap arrays as they are, without checks or defensive copies.
+
+        The field takes ownership: callers pass fresh arrays, or read-only
+        views when the data is shared.
+        """
+        self = object.__new__(cls)
+        _set = object.__setattr__
+        _set(self, 'g', g)
+        _set(self, 'omega', omega)
+        _set(self, 'T', T)
+        _set(self, 'g_normal', g_normal)
+        _set(self, 'g_tidal_moon', g_tidal_moon)
+        _set(self, 'g_tidal_sun', g_tidal_sun)
+        return self
+
+
+@dataclass(frozen=True)
+class GravityFieldSeries:
+    """Columnar timeseries of gravity fields at a lab-frame origin.
+
+    Returned by :meth:`LabFrame.timeseries`.  The per-epoch quantities are
+    stored as contiguous read-only arrays; indexing or iterating yields
+    :class:`GravityField` views into them, built on demand.
+
+    Attributes
+    ----------
+    times : list of datetime
+        (N,) epochs.
+    g : numpy.ndarray
+        (N, 3) gravity vectors in ENU [m/s^2].
+    T : numpy.ndarray
+        (N, 3, 3) gravity gradient tensors [s^-2].
+    g_tidal_moon, g_tidal_sun : numpy.ndarray
+        (N, 3) lunar and solar tidal accelerations in ENU [m/s^2].
+    omega : numpy.ndarray
+        (3,) Earth rotation vector [rad/s], the same at every epoch.
+    g_normal : float
+        Normal gravity magnitude [m/s^2].
+
+    Notes
+    -----
+    ``series["times"]`` and ``series["fields"]`` still work for code
+    written against the former ``dict(times=..., fields=...)`` result;
+    ``"fields"`` returns the series itself.
+    """
+    times: List[datetime]
+    g: np.ndarray
+    T: np.ndarray
+    g_tidal_moon: np.ndarray
+    g_tidal_sun: np.ndarray
+    omega: np.ndarray
+    g_normal: float
+
+    def __post_init__(self):
+        for name in ('g', 'T', 'g_tidal_moon', 'g_tidal_sun', 'omega'):
+            # Read-only views, so the caller's own arrays stay writable
+            arr = np.asarray(getattr(self, name)).view()
+            arr.flags.writeable = False
+            object.__setattr__(self, name, arr)
+
+    def __len__(self):
+        return len(self.g)
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            if index == 'times':
+                return self.times
+            if index == 'fields':
+                return self
+            raise KeyError(index)
+        if isinstance(index, slice):
+            return GravityFieldSeries(
+                times=self.times[index], g=self.g[index], T=self.T[index],
+                g_tidal_moon=self.g_tidal_moon[index],
+                g_tidal_sun=self.g_tidal_sun[index],
+                omega=self.omega, g_normal=self.g_normal)
+        return GravityField._view(
+            g=self.g[index], omega=self.omega, T=self.T[index],
+            g_normal=self.g_normal, g_tidal_moon=self.g_tidal_moon[index],
+            g_tidal_sun=self.g_tidal_sun[index])
+
+    @property
+    def g_tidal(self):
+        """(N, 3) total tidal acceleration in ENU [m/s^2]."""
+        return self.g_tidal_moon + self.g_tidal_sun
 
 
 # =============================================================================
@@ -706,8 +1415,11 @@ class LabFrame:
         self._g_normal = normal_gravity(lat_deg, alt_m)
         self._omega = _omega_enu(lat_deg)
         self._T_earth = _earth_gradient_tensor(lat_deg, alt_m)
+        # Shared by every field without copies
+        self._omega.flags.writeable = False
+        self._T_earth.flags.writeable = False
 
-    def field(self, dt, order=1):
+    def field(self, dt, order=1, readonly=False):
         """Compute the gravity field at a given time.
 
         Parameters
@@ -717,48 +1429,66 @@ class LabFrame:
         order : int, optional
             Expansion order: 0 = gravity vector only (T is Earth-only),
             1 = include tidal gradient tensor (default).
+        readonly : bool, optional
+            Make the arrays of the field read-only (default False: the
+            field owns fresh, writable arrays).
 
         Returns
         -------
         GravityField
             Full gravity field at the lab origin.
         """
-        # Tidal accelerations in ECEF
-        R_moon = moon_position_ecef(dt)
-        R_sun = sun_position_ecef(dt)
-        a_moon_ecef = DELTA_GRAV * tidal_acceleration(self._r, R_moon, GM_MOON)
-        a_sun_ecef = DELTA_GRAV * tidal_acceleration(self._r, R_sun, GM_SUN)
+        R_moon, R_sun = _ephemerides_ecef(*julian_date_split(dt))
+        return self._field_from_positions(R_moon, R_sun, order, readonly)
 
-        # Rotate tidal vectors to ENU
-        a_moon_enu = _ecef_to_enu_vector(a_moon_ecef, self._enu)
-        a_sun_enu = _ecef_to_enu_vector(a_sun_ecef, self._enu)
+    def _tidal_enu(self, R_moon, R_sun, order):
+        """Gravity, tensor and tidal vectors in ENU for body positions.
+
+        *R_moon* and *R_sun* are (3,) or (N, 3); every result gains the
+        same leading axis.  T is the Earth tensor alone when *order* is 0.
+        """
+        E = np.array(self._enu)  # (3,3) rows = E, N, U in ECEF
+
+        # Tidal accelerations in ECEF, rotated to ENU
+        a_moon = _tidal_acceleration_kernel(self._r, R_moon,
+                                            DELTA_GRAV * GM_MOON)
+        a_sun = _tidal_acceleration_kernel(self._r, R_sun,
+                                           DELTA_GRAV * GM_SUN)
+        n = a_moon.size // 3
+        with _stage('projection', n):
+            a_moon_enu = a_moon @ E.T
+            a_sun_enu = a_sun @ E.T
 
         # Total gravity vector: normal (down) + tidal
-        g = np.array([0.0, 0.0, -self._g_normal]) + a_moon_enu + a_sun_enu
+        g = a_moon_enu + a_sun_enu
+        g[..., 2] -= self._g_normal
 
         # Gradient tensor
         if order >= 1:
-            T_moon = DELTA_GRAV * _tidal_gradient_tensor(
-                self._r, R_moon, GM_MOON)
-            T_sun = DELTA_GRAV * _tidal_gradient_tensor(
-                self._r, R_sun, GM_SUN)
-            T_tidal_enu = (_ecef_to_enu_tensor(T_moon, self._enu)
-                           + _ecef_to_enu_tensor(T_sun, self._enu))
-            T = self._T_earth + T_tidal_enu
+            T = _tidal_gradient_kernel(self._r, R_moon, DELTA_GRAV * GM_MOON)
+            T += _tidal_gradient_kernel(self._r, R_sun, DELTA_GRAV * GM_SUN)
+            with _stage('projection', n):
+                T = E @ T @ E.T
+            T += self._T_earth
         else:
-            T = self._T_earth
+            T = np.broadcast_to(self._T_earth, g.shape[:-1] + (3, 3))
+        return g, T, a_moon_enu, a_sun_enu
 
-        return GravityField(
-            g=g,
-            omega=self._omega,
-            T=T,
-            g_normal=self._g_normal,
-            g_tidal_moon=a_moon_enu,
-            g_tidal_sun=a_sun_enu,
-        )
+    def _field_from_positions(self, R_moon, R_sun, order, readonly=False):
+        """Assemble a :class:`GravityField` from body ECEF positions.
+
+        The arrays from :meth:`_tidal_enu` are fresh (T is a read-only view
+        of the Earth tensor at order 0), so the field takes them as they are.
+        """
+        g, T, a_moon_enu, a_sun_enu = self._tidal_enu(R_moon, R_sun, order)
+        if readonly:
+            for arr in (g, T, a_moon_enu, a_sun_enu):
+                arr.flags.writeable = False
+        return GravityField._view(g, self._omega, T, self._g_normal,
+                                  a_moon_enu, a_sun_enu)
 
     def timeseries(self, start, end, interval_minutes=10.0, n_samples=None,
-                   order=1):
+                   order=1, ephemeris=None, workers=None):
         """Compute a timeseries of gravity fields.
 
         Parameters
@@ -773,38 +1503,61 @@ class LabFrame:
             Number of evenly spaced samples (inclusive).
         order : int, optional
             Expansion order passed to :meth:`field` (default 1).
+        ephemeris : object, optional
+            Ephemeris backend such as
+            :class:`pytheas.ephem.ChebyshevEphemeris`.  Defaults to the
+            configured backend (see :func:`pytheas.ephem.set_ephemeris`),
+            else the direct Meeus series.
+        workers : int, optional
+            Number of worker processes, as for
+            :func:`compute_timeseries`.
 
         Returns
         -------
-        dict
-            times  : list of datetime objects
-            fields : list of GravityField objects
+        GravityFieldSeries
+            Columnar (N, 3) g, (N, 3, 3) T and (N, 3) tidal arrays;
+            indexing yields :class:`GravityField` views.
         """
-        if end < start:
-            raise ValueError("end must be >= start")
-        if n_samples is not None:
-            if n_samples < 1:
-                raise ValueError("n_samples must be >= 1")
-            total_sec = (end - start).total_seconds()
-            if n_samples == 1:
-                times = [start]
-            else:
-                step_sec = total_sec / (n_samples - 1)
-                times = [start + timedelta(seconds=i * step_sec)
-                         for i in range(n_samples)]
-        else:
-            if interval_minutes <= 0:
-                raise ValueError(
-                    "interval_minutes must be > 0 when n_samples is not set")
-            step = timedelta(minutes=interval_minutes)
-            times = []
-            t = start
-            while t <= end:
-                times.append(t)
-                t += step
+        _check_workers(workers)
+        times, ns = _time_grid(start, end, interval_minutes, n_samples)
+        if ephemeris is None:
+            ephemeris = _active_ephemeris(*_ns_to_jd_split(ns))
+
+        g, T, a_moon, a_sun = _map_epochs(
+            _lab_columns, ns, [(3,), (3, 3), (3,), (3,)],
+            (self, order, ephemeris), workers)
+        omega = self._omega.copy()
+        return GravityFieldSeries(times=times, g=g, T=T, g_tidal_moon=a_moon,
+                                  g_tidal_sun=a_sun, omega=omega,
+                                  g_normal=self._g_normal)
+
+
+def _lab_columns(ns, lab, order, ephemeris):
+    """(g, T, g_tidal_moon, g_tidal_sun) of *lab* at epochs *ns*."""
+    R_moon, R_sun = _ephemerides_ecef(*_ns_to_jd_split(ns), ephemeris)
+    return lab._tidal_enu(R_moon, R_sun, order)
+
+
+# =============================================================================
+# Parallel Evaluation
+# =============================================================================
+
+def _check_workers(workers):
+    if workers is not None and (int(workers) != workers or workers < 1):
+        raise ValueError("workers must be a positive integer")
 
-        fields = [self.field(t, order=order) for t in times]
-        return dict(times=times, fields=fields)
+
+def _map_epochs(fn, ns, shapes, args, workers):
+    """Evaluate ``fn(ns, *args)`` serially or over a process pool.
+
+    Parallel evaluation (see :mod:`pytheas._parallel`) is used only when
+    *workers* > 1 and the grid spans more than one ephemeris block; the
+    output columns are identical either way.
+    """
+    if workers is None or workers == 1 or ns.size <= _SERIES_BLOCK:
+        return fn(ns, *args)
+    from ._parallel import map_epochs
+    return map_epochs(fn, ns, shapes, args, int(workers))
 
 
 # =============================================================================
@@ -816,7 +1569,8 @@ class GravityResult:
     """Result of a single-epoch gravity computation.
 
     Returned by :func:`compute_g`.  For dict access use
-    ``dataclasses.asdict(result)``.
+    ``dataclasses.asdict(result)``.  For K measurement axes every field
+    except g_normal is a (K,) array.
     """
     g_total: float       # total g on axis [m/s²]
     g_static: float      # normal gravity projected on axis [m/s²]
@@ -832,7 +1586,8 @@ class TimeSeries:
     """Result of a timeseries gravity computation.
 
     Returned by :func:`compute_timeseries`.  For dict access use
-    ``dataclasses.asdict(result)``.
+    ``dataclasses.asdict(result)``.  For K measurement axes the per-epoch
+    arrays are (N, K) and cos_zenith is (K,).
     """
     times: List[datetime]
     g_total: np.ndarray
@@ -851,6 +1606,60 @@ class TimeSeries:
             object.__setattr__(self, name, arr)
 
 
+@dataclass(frozen=True)
+class Station:
+    """A gravimeter site: location and measurement axis.
+
+    Used by :func:`compute_network_timeseries`.  Plain tuples
+    ``(lat_deg, lon_deg, alt_m[, zenith_deg, azimuth_deg])`` are accepted
+    wherever a Station is.
+    """
+    lat_deg: float
+    lon_deg: float
+    alt_m: float = 0.0
+    zenith_deg: float = 0.0
+    azimuth_deg: float = 0.0
+    name: str = ""
+
+
+@dataclass(frozen=True)
+class NetworkTimeSeries:
+    """Result of a multi-station timeseries computation.
+
+    Returned by :func:`compute_network_timeseries`.  Per-station arrays
+    are (S,); station-by-time arrays are (S, N) with rows in station order.
+    """
+    times: np.ndarray             # (N,) datetime64[ns] UTC
+    stations: tuple               # (S,) Station
+    g_total: np.ndarray           # (S, N) total g on axis [m/s²]
+    g_static: np.ndarray          # (S, N) normal gravity on axis [m/s²]
+    g_normal: np.ndarray          # (S,) normal gravity magnitude [m/s²]
+    cos_zenith: np.ndarray        # (S,) projection factor
+    g_tidal: np.ndarray           # (S, N) tidal perturbation on axis [m/s²]
+    g_tidal_moon: np.ndarray      # (S, N) lunar contribution [m/s²]
+    g_tidal_sun: np.ndarray       # (S, N) solar contribution [m/s²]
+
+    def __post_init__(self):
+        for name in ('times', 'g_total', 'g_static', 'g_normal', 'cos_zenith',
+                     'g_tidal', 'g_tidal_moon', 'g_tidal_sun'):
+            # Read-only views: network arrays can be large, and the
+            # caller's own arrays must stay writable.
+            arr = np.asarray(getattr(self, name)).view()
+            arr.flags.writeable = False
+            object.__setattr__(self, name, arr)
+
+    def station(self, index):
+        """Single-station :class:`TimeSeries` for row *index*."""
+        return TimeSeries(
+            times=self.times.astype('datetime64[us]').tolist(),
+            g_total=self.g_total[index], g_static=self.g_static[index],
+            g_normal=float(self.g_normal[index]),
+            cos_zenith=float(self.cos_zenith[index]),
+            g_tidal=self.g_tidal[index],
+            g_tidal_moon=self.g_tidal_moon[index],
+            g_tidal_sun=self.g_tidal_sun[index])
+
+
 # =============================================================================
 # Main API
 # =============================================================================
@@ -869,30 +1678,32 @@ def compute_g(dt, lat_deg, lon_deg, alt_m,
         Geodetic longitude in degrees.
     alt_m : float
         Altitude above the WGS84 ellipsoid in meters.
-    zenith_deg : float
-        Zenith angle of the measurement axis (0 = vertical).
-    azimuth_deg : float
+    zenith_deg : float or array_like
+        Zenith angle of the measurement axis (0 = vertical).  A (K,)
+        array, broadcast against *azimuth_deg*, projects the same tide
+        onto K axes.
+    azimuth_deg : float or array_like
         Azimuth of the measurement axis (clockwise from north).
 
     Returns
     -------
     GravityResult
         Frozen dataclass with fields: g_total, g_static, g_normal,
-        cos_zenith, g_tidal, g_tidal_moon, g_tidal_sun.
+        cos_zenith, g_tidal, g_tidal_moon, g_tidal_sun.  The per-axis
+        fields are (K,) arrays when K axes are given.
         Use ``dataclasses.asdict(result)`` for dict access.
     """
-    g0    = normal_gravity(lat_deg, alt_m)
-    n_hat = measurement_axis(lat_deg, lon_deg, zenith_deg, azimuth_deg)
-    e_up  = enu_basis(lat_deg, lon_deg)[2]
-    cos_z = np.dot(e_up, n_hat)
+    g0, n_hat, cos_z, r = _site(lat_deg, lon_deg, alt_m,
+                                zenith_deg, azimuth_deg)
     g_static = g0 * cos_z
 
-    r = geodetic_to_ecef(lat_deg, lon_deg, alt_m)
-    a_moon = DELTA_GRAV * tidal_acceleration(r, moon_position_ecef(dt), GM_MOON)
-    a_sun  = DELTA_GRAV * tidal_acceleration(r, sun_position_ecef(dt),  GM_SUN)
+    R_moon, R_sun = _ephemerides_ecef(*julian_date_split(dt))
+    a_moon = _tidal_acceleration_kernel(r, R_moon, DELTA_GRAV * GM_MOON)
+    a_sun  = _tidal_acceleration_kernel(r, R_sun,  DELTA_GRAV * GM_SUN)
 
-    gm = np.dot(a_moon, n_hat)
-    gs = np.dot(a_sun,  n_hat)
+    with _stage('projection', 1):
+        gm = n_hat @ a_moon
+        gs = n_hat @ a_sun
     gt = gm + gs
 
     return GravityResult(g_total=g_static + gt,
@@ -903,7 +1714,8 @@ def compute_g(dt, lat_deg, lon_deg, alt_m,
 
 def compute_timeseries(start, end, lat_deg, lon_deg, alt_m,
                        zenith_deg=0.0, azimuth_deg=0.0,
-                       interval_minutes=10.0, n_samples=None):
+                       interval_minutes=10.0, n_samples=None,
+                       ephemeris=None, workers=None):
     """Compute a normal-gravity + body-tide timeseries.
 
     Parameters
@@ -918,69 +1730,281 @@ def compute_timeseries(start, end, lat_deg, lon_deg, alt_m,
         Geodetic longitude in degrees.
     alt_m : float
         Altitude above the WGS84 ellipsoid in meters.
-    zenith_deg : float
-        Zenith angle of the measurement axis (0 = vertical).
-    azimuth_deg : float
+    zenith_deg : float or array_like
+        Zenith angle of the measurement axis (0 = vertical).  A (K,)
+        array, broadcast against *azimuth_deg*, projects one tidal
+        evaluation onto K axes.
+    azimuth_deg : float or array_like
         Azimuth of the measurement axis (clockwise from north).
     interval_minutes : float
         Time step in minutes (default 10).  Ignored if *n_samples* is set.
     n_samples : int, optional
         Number of evenly spaced samples between *start* and *end*
         (inclusive).  When given, overrides *interval_minutes*.
+    ephemeris : object, optional
+        Ephemeris backend such as :class:`pytheas.ephem.ChebyshevEphemeris`.
+        Defaults to the configured backend (see
+        :func:`pytheas.ephem.set_ephemeris`), else the direct Meeus series.
+    workers : int, optional
+        Number of worker processes.  Above 1, the epochs are split across
+        a process pool writing into shared memory; the result is
+        identical to the serial one.
 
     Returns
     -------
     TimeSeries
         Frozen dataclass with fields: times, g_total, g_static, g_normal,
-        cos_zenith, g_tidal, g_tidal_moon, g_tidal_sun.
+        cos_zenith, g_tidal, g_tidal_moon, g_tidal_sun.  With K axes the
+        per-epoch fields are (N, K) and cos_zenith is (K,).
         Use ``dataclasses.asdict(result)`` for dict access.
+
+    Notes
+    -----
+    For the full ENU tidal vectors rather than their projections, use
+    :meth:`LabFrame.timeseries`.
     """
+    _check_workers(workers)
+    site = _site(lat_deg, lon_deg, alt_m, zenith_deg, azimuth_deg)
+    times, ns = _time_grid(start, end, interval_minutes, n_samples)
+    if ephemeris is None:
+        ephemeris = _active_ephemeris(*_ns_to_jd_split(ns))
+    return _site_timeseries(site, times, ns, ephemeris, workers)
+
+
+def iter_timeseries(start, end, lat_deg, lon_deg, alt_m,
+                    zenith_deg=0.0, azimuth_deg=0.0,
+                    interval_minutes=10.0, n_samples=None,
+                    chunk_size=_CHUNK_SIZE, ephemeris=None):
+    """Compute a timeseries in chunks of bounded size.
+
+    Takes the same arguments as :func:`compute_timeseries` and yields
+    consecutive :class:`TimeSeries` chunks of at most *chunk_size* epochs.
+    Only one chunk is held in memory at a time, so the span is unbounded.
+    Concatenating the chunks reproduces the one-shot result exactly.
+
+    Parameters
+    ----------
+    start, end, lat_deg, lon_deg, alt_m, zenith_deg, azimuth_deg,
+    interval_minutes, n_samples, ephemeris
+        As for :func:`compute_timeseries`.
+    chunk_size : int, optional
+        Maximum epochs per chunk (default 65536).
+
+    Returns
+    -------
+    iterator of TimeSeries
+        Chunks in time order.  Arguments are validated before the first
+        chunk is requested.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be >= 1")
+    n, step_us = _grid_spec(start, end, interval_minutes, n_samples)
+    site = _site(lat_deg, lon_deg, alt_m, zenith_deg, azimuth_deg)
+
+    # Evaluate windows aligned to the ephemeris blocks of a one-shot call
+    # (see _ephemerides_ecef) and cut the requested chunks out of them,
+    # carrying any remainder over into the next window.
+    window = -(-chunk_size // _SERIES_BLOCK) * _SERIES_BLOCK
+
+    def chunks():
+        pending, n_pending = [], 0
+        for w_lo in range(0, n, window):
+            times, ns = _grid_slice(start, step_us, w_lo,
+                                    min(w_lo + window, n))
+            ts = _site_timeseries(site, times, ns, ephemeris)
+            lo = 0
+            while lo < len(times):
+                take = min(chunk_size - n_pending, len(times) - lo)
+                pending.append(_slice_timeseries(ts, slice(lo, lo + take)))
+                n_pending += take
+                lo += take
+                if n_pending == chunk_size:
+                    yield _concat_timeseries(pending)
+                    pending, n_pending = [], 0
+        if pending:
+            yield _concat_timeseries(pending)
+
+    return chunks()
+
+
+def _slice_timeseries(ts, index):
+    """Epoch slice of a :class:`TimeSeries`."""
+    return TimeSeries(times=ts.times[index], g_total=ts.g_total[index],
+                      g_static=ts.g_static[index], g_normal=ts.g_normal,
+                      cos_zenith=ts.cos_zenith, g_tidal=ts.g_tidal[index],
+                      g_tidal_moon=ts.g_tidal_moon[index],
+                      g_tidal_sun=ts.g_tidal_sun[index])
+
+
+def _concat_timeseries(parts):
+    """Join consecutive :class:`TimeSeries` pieces of one site."""
+    if len(parts) == 1:
+        return parts[0]
+    return TimeSeries(
+        times=[t for p in parts for t in p.times],
+        g_total=np.concatenate([p.g_total for p in parts]),
+        g_static=np.concatenate([p.g_static for p in parts]),
+        g_normal=parts[0].g_normal, cos_zenith=parts[0].cos_zenith,
+        g_tidal=np.concatenate([p.g_tidal for p in parts]),
+        g_tidal_moon=np.concatenate([p.g_tidal_moon for p in parts]),
+        g_tidal_sun=np.concatenate([p.g_tidal_sun for p in parts]))
+
+
+def _site(lat_deg, lon_deg, alt_m, zenith_deg, azimuth_deg):
+    """Static (g0, n_hat, cos_z, r) of a single measurement site.
+
+    *n_hat* is (3,) for one axis or (K, 3) for 1-D angle arrays, and
+    *cos_z* is then (K,).
+    """
+    if np.ndim(zenith_deg) == 0 and np.ndim(azimuth_deg) == 0:
+        return _site_scalar(lat_deg, lon_deg, alt_m, zenith_deg, azimuth_deg)
     g0    = normal_gravity(lat_deg, alt_m)
     n_hat = measurement_axis(lat_deg, lon_deg, zenith_deg, azimuth_deg)
+    if n_hat.ndim > 2:
+        raise ValueError("zenith_deg and azimuth_deg must be scalars or 1-D")
     e_up  = enu_basis(lat_deg, lon_deg)[2]
-    cos_z = np.dot(e_up, n_hat)
-    g_static_val = g0 * cos_z
+    cos_z = n_hat @ e_up
     r = geodetic_to_ecef(lat_deg, lon_deg, alt_m)
+    return g0, n_hat, cos_z, r
 
-    if end < start:
-        raise ValueError("end must be >= start")
-    if n_samples is not None:
-        if n_samples < 1:
-            raise ValueError("n_samples must be >= 1")
-        total_sec = (end - start).total_seconds()
-        if n_samples == 1:
-            times = [start]
-        else:
-            step_sec = total_sec / (n_samples - 1)
-            times = [start + timedelta(seconds=i * step_sec)
-                     for i in range(n_samples)]
-    else:
-        if interval_minutes <= 0:
-            raise ValueError(
-                "interval_minutes must be > 0 when n_samples is not set")
-        step = timedelta(minutes=interval_minutes)
-        times = []
-        t = start
-        while t <= end:
-            times.append(t)
-            t += step
 
+def _site_scalar(lat_deg, lon_deg, alt_m, zenith_deg, azimuth_deg):
+    """:func:`_site` for one axis in scalar arithmetic.
+
+    Same formulas as :func:`geodetic_to_ecef` and
+    :func:`measurement_axis` without their broadcasting overhead.
+    """
+    phi, lam = math.radians(lat_deg), math.radians(lon_deg)
+    zen, azi = math.radians(zenith_deg), math.radians(azimuth_deg)
+    sp, cp = math.sin(phi), math.cos(phi)
+    sl, cl = math.sin(lam), math.cos(lam)
+    cz, sz = math.cos(zen), math.sin(zen)
+    ca, sa = math.cos(azi), math.sin(azi)
+    e_up = (cp * cl, cp * sl, sp)
+    n_hat = np.array((cz * cp * cl + sz * (ca * -sp * cl + sa * -sl),
+                      cz * cp * sl + sz * (ca * -sp * sl + sa * cl),
+                      cz * sp + sz * ca * cp))
+    cos_z = (n_hat[0] * e_up[0] + n_hat[1] * e_up[1]) + n_hat[2] * e_up[2]
+
+    N = A_WGS84 / math.sqrt(1.0 - E2 * sp ** 2)
+    r = np.array(((N + alt_m) * cp * cl, (N + alt_m) * cp * sl,
+                  (N * (1.0 - E2) + alt_m) * sp))
+    return normal_gravity(lat_deg, alt_m), n_hat, cos_z, r
+
+
+def _site_columns(ns, site, ephemeris):
+    """(g_tidal_moon, g_tidal_sun) on the axes of *site* at epochs *ns*.
+
+    Columns are (N,), or (N, K) for K axes: one (N, 3) @ (3, K) product.
+    """
+    g0, n_hat, cos_z, r = site
+
+    # All epochs at once: (N,) split Julian dates -> (N, 3) body positions
+    R_moon, R_sun = _ephemerides_ecef(*_ns_to_jd_split(ns), ephemeris)
+    am  = _tidal_acceleration_kernel(r, R_moon, DELTA_GRAV * GM_MOON)
+    asn = _tidal_acceleration_kernel(r, R_sun,  DELTA_GRAV * GM_SUN)
+    with _stage('projection', len(am)):
+        return am @ n_hat.T, asn @ n_hat.T
+
+
+def _site_timeseries(site, times, ns, ephemeris, workers=None):
+    """:class:`TimeSeries` of a site from :func:`_site` at epochs *ns*."""
+    g0, n_hat, cos_z, r = site
+    g_static_val = g0 * cos_z
     n = len(times)
-    g_total      = np.empty(n)
-    g_tidal      = np.empty(n)
-    g_tidal_moon = np.empty(n)
-    g_tidal_sun  = np.empty(n)
-
-    for i, t in enumerate(times):
-        am  = DELTA_GRAV * tidal_acceleration(r, moon_position_ecef(t), GM_MOON)
-        asn = DELTA_GRAV * tidal_acceleration(r, sun_position_ecef(t),  GM_SUN)
-        g_tidal_moon[i] = np.dot(am, n_hat)
-        g_tidal_sun[i]  = np.dot(asn, n_hat)
-        g_tidal[i]      = g_tidal_moon[i] + g_tidal_sun[i]
-        g_total[i]      = g_static_val + g_tidal[i]
+
+    axes = np.shape(cos_z)
+    g_tidal_moon, g_tidal_sun = _map_epochs(
+        _site_columns, ns, [axes, axes], (site, ephemeris), workers)
+    g_tidal      = g_tidal_moon + g_tidal_sun
+    g_total      = g_static_val + g_tidal
 
     return TimeSeries(times=times, g_total=g_total,
-                      g_static=np.full(n, g_static_val),
+                      g_static=np.full((n,) + axes, g_static_val),
                       g_normal=g0, cos_zenith=cos_z,
                       g_tidal=g_tidal,
                       g_tidal_moon=g_tidal_moon, g_tidal_sun=g_tidal_sun)
+
+
+def _network_columns(r, n_hat, R_moon, R_sun):
+    """(S, N) lunar and solar tides on the axes of stations at *r*.
+
+    The (S, N, 3) accelerations are formed in blocks of epochs so
+    temporaries stay bounded for large networks.
+    """
+    S, n = len(r), len(R_moon)
+    g_tidal_moon = np.empty((S, n))
+    g_tidal_sun = np.empty((S, n))
+    step = max(1, _NETWORK_BLOCK // S)
+    for i in range(0, n, step):
+        blk = slice(i, i + step)
+        am = _tidal_acceleration_kernel(r[:, None, :], R_moon[None, blk],
+                                        DELTA_GRAV * GM_MOON)
+        asn = _tidal_acceleration_kernel(r[:, None, :], R_sun[None, blk],
+                                         DELTA_GRAV * GM_SUN)
+        with _stage('projection', am.size // 3):
+            g_tidal_moon[:, blk] = np.einsum('snk,sk->sn', am, n_hat)
+            g_tidal_sun[:, blk] = np.einsum('snk,sk->sn', asn, n_hat)
+    return g_tidal_moon, g_tidal_sun
+
+
+def _network_sites(stations):
+    """Static (g0, n_hat, cos_z, r) arrays of a station sequence."""
+    lat, lon, alt, zen, azi = (
+        np.array([getattr(st, name) for st in stations], dtype=float)
+        for name in ('lat_deg', 'lon_deg', 'alt_m',
+                     'zenith_deg', 'azimuth_deg'))
+    g0 = normal_gravity(lat, alt)                                 # (S,)
+    r = geodetic_to_ecef(lat, lon, alt)                           # (S, 3)
+    n_hat = measurement_axis(lat, lon, zen, azi)                  # (S, 3)
+    cos_z = np.einsum('sk,sk->s', enu_basis(lat, lon)[2], n_hat)
+    return g0, n_hat, cos_z, r
+
+
+def compute_network_timeseries(times, stations, ephemeris=None):
+    """Compute normal-gravity + body-tide timeseries for many stations.
+
+    The Moon and Sun are evaluated once per epoch and shared by every
+    station; the tidal accelerations are then formed on the (S, N, 3)
+    broadcast of station positions against body positions, in blocks of
+    epochs so temporaries stay bounded for large networks.
+
+    Parameters
+    ----------
+    times : sequence of datetime or datetime64 array_like
+        UTC epochs, in any form accepted by :func:`julian_date_split`
+        except plain-number Julian Dates.
+    stations : sequence of Station or tuple
+        Sites as :class:`Station` objects or tuples
+        ``(lat_deg, lon_deg, alt_m[, zenith_deg, azimuth_deg])``.
+    ephemeris : object, optional
+        Ephemeris backend such as :class:`pytheas.ephem.ChebyshevEphemeris`.
+        Defaults to the configured backend (see
+        :func:`pytheas.ephem.set_ephemeris`), else the direct Meeus series.
+
+    Returns
+    -------
+    NetworkTimeSeries
+        Frozen dataclass with (S, N) arrays g_total, g_static, g_tidal,
+        g_tidal_moon, g_tidal_sun and (S,) arrays g_normal, cos_zenith.
+    """
+    stations = tuple(st if isinstance(st, Station) else Station(*st)
+                     for st in stations)
+    if not stations:
+        raise ValueError("stations must not be empty")
+    ns = np.atleast_1d(_epochs_to_ns(times)).reshape(-1)
+    S, n = len(stations), ns.size
+
+    g0, n_hat, cos_z, r = _network_sites(stations)
+
+    R_moon, R_sun = _ephemerides_ecef(*_ns_to_jd_split(ns), ephemeris)
+    g_tidal_moon, g_tidal_sun = _network_columns(r, n_hat, R_moon, R_sun)
+    g_tidal = g_tidal_moon + g_tidal_sun
+    g_static = np.broadcast_to((g0 * cos_z)[:, None], (S, n))
+
+    return NetworkTimeSeries(times=ns.astype('datetime64[ns]'),
+                             stations=stations,
+                             g_total=g_static + g_tidal, g_static=g_static,
+                             g_normal=g0, cos_zenith=cos_z,
+                             g_tidal=g_tidal, g_tidal_moon=g_tidal_moon,
+                             g_tidal_sun=g_tidal_sun)
@@ -0,0 +1,253 @@
+"""
+Streaming writers for the command-line time series output.
+
+The CLI feeds chunks from :func:`pytheas.iter_timeseries` (or a station
+network) to one of these writers, so a run never holds the whole table in
+memory.  Formats:
+
+``csv``
+    Text with ISO 8601 UTC and local times, formatted one block at a time.
+``npy``
+    One structured array of length N: ``t_ns`` (int64 UTC nanoseconds
+    since 1970) and the float64 fields of :data:`FIELDS`.  The length is
+    known up front, so records are appended straight after the header.
+``npz``
+    Uncompressed archive of one array per column (``t_ns.npy``,
+    ``g_total.npy``, ...).  Records are spooled to a temporary file and
+    split into columns on close.
+``raw``
+    Headerless little-endian records of the ``npy`` dtype, for
+    ``numpy.fromfile(path, dtype=record_dtype())`` or any C/Fortran reader.
+
+With *stations*, every float field holds one value per station: a
+``(S,)`` subarray per record in the binary formats (``(N, S)`` columns in
+``npz``, plus a ``station`` array of ids) and one CSV row per station and
+epoch, ordered by epoch.
+"""
+
+import os
+import tempfile
+import zipfile
+
+import numpy as np
+
+FIELDS = ('g_total', 'g_static', 'g_tidal', 'g_tidal_moon', 'g_tidal_sun')
+FORMATS = ('csv', 'npy', 'npz', 'raw')
+
+_NS_PER_S = 1_000_000_000
+_NS_PER_HOUR = 3600 * _NS_PER_S
+
+
+def record_dtype(n_stations=None):
+    """Record dtype of the ``npy`` and ``raw`` formats."""
+    shape = () if n_stations is None else (n_stations,)
+    return np.dtype([('t_ns', '<i8')] + [(f, '<f8', shape) for f in FIELDS])
+
+
+def format_from_path(path, default='csv'):
+    """Output format implied by the file extension of *path*."""
+    ext = os.path.splitext(path)[1].lower().lstrip('.')
+    if ext in FORMATS:
+        return ext
+    return 'raw' if ext in ('bin', 'dat') else default
+
+
+def open_writer(path, fmt, n_rows, utc_offset_h=0, stations=None,
+                start_ns=0, step_ns=0):
+    """Open a streaming writer.
+
+    Parameters
+    ----------
+    path : str
+        Output file.
+    fmt : str
+        One of :data:`FORMATS`.
+    n_rows : int
+        Number of epochs that will be written (needed by ``npy``).
+    utc_offset_h : int or sequence of int, optional
+        Offset of the CSV local-time column in hours; one per station
+        with *stations*.
+    stations : sequence of str, optional
+        Station ids for network output.
+    start_ns, step_ns : int, optional
+        First epoch and spacing of the grid, in UTC ns.  The CSV times
+        carry whole seconds when both are whole seconds, else
+        microseconds, in every row of the file.
+
+    Returns
+    -------
+    writer
+        Context manager with ``write(ns, columns)``: *ns* is an (m,) int64
+        chunk of epochs and *columns* the matching :data:`FIELDS` arrays,
+        shaped (m,) or (m, S).
+    """
+    if fmt == 'csv':
+        return _CsvWriter(path, utc_offset_h, stations, start_ns, step_ns)
+    if fmt == 'npy':
+        return _NpyWriter(path, n_rows, stations)
+    if fmt == 'npz':
+        return _NpzWriter(path, stations)
+    if fmt == 'raw':
+        return _RawWriter(path, stations)
+    raise ValueError(f"unknown output format {fmt!r}; "
+                     f"expected one of {', '.join(FORMATS)}")
+
+
+class _Writer:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# =====================================================================
+# Binary formats
+# =====================================================================
+
+class _RawWriter(_Writer):
+    def __init__(self, path, stations=None):
+        self.dtype = record_dtype(None if stations is None
+                                  else len(stations))
+        self.count = 0
+        self._file = (tempfile.TemporaryFile() if path is None
+                      else open(path, 'wb'))
+        self._start()
+
+    def _start(self):
+        pass
+
+    def write(self, ns, columns):
+        rec = np.empty(len(ns), dtype=self.dtype)
+        rec['t_ns'] = ns
+        for name, values in zip(FIELDS, columns):
+            rec[name] = values
+        rec.tofile(self._file)
+        self.count += len(ns)
+
+    def close(self):
+        self._file.close()
+
+
+class _NpyWriter(_RawWriter):
+    def __init__(self, path, n_rows, stations=None):
+        self.n_rows = int(n_rows)
+        super().__init__(path, stations)
+
+    def _start(self):
+        np.lib.format.write_array_header_1_0(self._file, {
+            'descr': np.lib.format.dtype_to_descr(self.dtype),
+            'fortran_order': False,
+            'shape': (self.n_rows,),
+        })
+
+    def write(self, ns, columns):
+        if self.count + len(ns) > self.n_rows:
+            raise ValueError(f"more than the {self.n_rows} declared rows")
+        super().write(ns, columns)
+
+
+class _NpzWriter(_RawWriter):
+    """Spools records to one temporary file, split into columns on close."""
+
+    def __init__(self, path, stations=None):
+        self.path = path
+        self.stations = None if stations is None else list(stations)
+        super().__init__(None, stations)
+
+    def _start(self):
+        pass
+
+    def close(self):
+        block = max(1, (1 << 24) // self.dtype.itemsize)
+        try:
+            self._file.flush()
+            records = (np.memmap(self._file, dtype=self.dtype, mode='r',
+                                 shape=(self.count,))
+                       if self.count else np.empty(0, self.dtype))
+            with zipfile.ZipFile(self.path, 'w', zipfile.ZIP_STORED,
+                                 allowZip64=True) as zf:
+                for name in self.dtype.names:
+                    column = records[name]
+                    header = {'descr': np.lib.format.dtype_to_descr(
+                                  column.dtype),
+                              'fortran_order': False,
+                              'shape': column.shape}
+                    with zf.open(name + '.npy', 'w', force_zip64=True) as f:
+                        np.lib.format.write_array_header_1_0(f, header)
+                        for lo in range(0, self.count, block):
+                            f.write(np.ascontiguousarray(
+                                column[lo:lo + block]).tobytes())
+                if self.stations is not None:
+                    with zf.open('station.npy', 'w') as f:
+                        np.lib.format.write_array(
+                            f, np.array(self.stations, dtype=str))
+            del records, column
+        finally:
+            self._file.close()
+
+
+# =====================================================================
+# CSV
+# =====================================================================
+
+class _CsvWriter(_Writer):
+    def __init__(self, path, utc_offset_h=0, stations=None, start_ns=0,
+                 step_ns=0):
+        # Same text as datetime.isoformat(): seconds unless fractional.
+        # Fixed per file, so a chunk boundary cannot change the format.
+        self._unit = 's' if not (start_ns % _NS_PER_S
+                                 or step_ns % _NS_PER_S) else 'us'
+        self.stations = None if stations is None else np.asarray(
+            stations, dtype=str)
+        if self.stations is None:
+            sign = '+' if utc_offset_h >= 0 else '-'
+            local = f'time_local_UTC{sign}{abs(int(utc_offset_h)):d}'
+        else:
+            # One offset per station; the column is local to each row
+            utc_offset_h = np.broadcast_to(utc_offset_h, self.stations.shape)
+            local = 'time_local'
+        self._offset = (np.asarray(utc_offset_h, dtype=np.int64)
+                        * _NS_PER_HOUR).astype('timedelta64[ns]')
+        self.count = 0
+        self._file = open(path, 'w')
+        self._file.write(
+            ('station,' if stations is not None else '')
+            + f'time_utc,{local},'
+            'g_total_m_s2,g_static_m_s2,g_tidal_m_s2,'
+            'g_tidal_moon_m_s2,g_tidal_sun_m_s2\n')
+        self._row = ('%s,' if stations is not None else '') + \
+            '%s,%s' + ',%s' * len(FIELDS) + '\n'
+
+    def write(self, ns, columns):
+        ns = np.asarray(ns, dtype=np.int64)
+        t = ns.astype('datetime64[ns]')
+        unit = self._unit
+        utc = np.datetime_as_string(t, unit=unit)
+        columns = [np.asarray(c) for c in columns]
+
+        if self.stations is None:
+            local = np.datetime_as_string(t + self._offset, unit=unit)
+            cols = [utc, local] + columns
+        else:
+            s = len(self.stations)
+            local = np.datetime_as_string(t[:, None] + self._offset, unit=unit)
+            cols = [np.tile(self.stations, len(ns)),
+                    np.repeat(utc, s), local.reshape(-1)] + [
+                c.reshape(-1) for c in columns]
+        self._file.write(''.join(map(self._row.__mod__,
+                                     zip(*map(self._values, cols)))))
+        self.count += len(ns)
+
+    @staticmethod
+    def _values(col):
+        # Float formatting dominates; a constant column (g_static of a
+        # fixed site) is formatted once and repeated as text.
+        if col.dtype.kind != 'f':
+            return col.tolist()
+        if col.size and np.all(col == col[0]):
+            return ['%.12e' % col[0]] * col.size
+        return list(map('%.12e'.__mod__, col.tolist()))
+
+    def close(self):
+        self._file.close()
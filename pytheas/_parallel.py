@@ -0,0 +1,87 @@
+"""
+Process-pool evaluation of per-epoch columns into shared memory.
+
+Used by the ``workers=`` option of :func:`pytheas.compute_timeseries` and
+:meth:`pytheas.LabFrame.timeseries`.  The epoch grid is cut into spans
+aligned to the ephemeris blocks of a serial call (see
+``_core._ephemerides_ecef``), so every worker performs exactly the
+arithmetic the serial path would and the results are bit-identical.
+Workers write their span straight into ``multiprocessing.shared_memory``
+output arrays; only the epoch slice and a small task description are
+pickled.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from ._core import _SERIES_BLOCK
+
+_TASKS_PER_WORKER = 4   # spans per worker, for load balancing
+
+
+def _spans(n, workers):
+    """Contiguous (lo, hi) ranges starting at multiples of _SERIES_BLOCK."""
+    n_blocks = -(-n // _SERIES_BLOCK)
+    n_tasks = min(n_blocks, workers * _TASKS_PER_WORKER)
+    per_task = -(-n_blocks // n_tasks) * _SERIES_BLOCK
+    return [(lo, min(lo + per_task, n)) for lo in range(0, n, per_task)]
+
+
+def _worker(fn, args, ns, lo, hi, outputs):
+    """Evaluate ``fn(ns[lo:hi], *args)`` and store it in the shared outputs."""
+    results = fn(ns, *args)
+    for (name, shape), values in zip(outputs, results):
+        shm = shared_memory.SharedMemory(name=name)
+        try:
+            out = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+            out[lo:hi] = values
+            del out
+        finally:
+            shm.close()
+
+
+def map_epochs(fn, ns, shapes, args=(), workers=2):
+    """Evaluate per-epoch columns over a process pool.
+
+    Parameters
+    ----------
+    fn : callable
+        Module-level function ``fn(ns, *args)`` returning one array per
+        entry of *shapes*, each with leading length ``len(ns)``.
+    ns : numpy.ndarray
+        (N,) int64 UTC nanoseconds.
+    shapes : sequence of tuple
+        Trailing shape of each output column, e.g. ``()`` or ``(3, 3)``.
+    args : tuple, optional
+        Extra picklable arguments for *fn*.
+    workers : int, optional
+        Number of worker processes.
+
+    Returns
+    -------
+    list of numpy.ndarray
+        Output columns of shape ``(N,) + shape``, in the order of *shapes*.
+    """
+    n = ns.size
+    blocks = []
+    try:
+        for shape in shapes:
+            full = (n,) + tuple(shape)
+            nbytes = max(1, int(np.prod(full)) * 8)
+            blocks.append((shared_memory.SharedMemory(create=True,
+                                                      size=nbytes), full))
+        outputs = [(shm.name, full) for shm, full in blocks]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_worker, fn, args, ns[lo:hi], lo, hi,
+                                   outputs)
+                       for lo, hi in _spans(n, workers)]
+            for future in futures:
+                future.result()
+        return [np.ndarray(full, dtype=np.float64, buffer=shm.buf).copy()
+                for shm, full in blocks]
+    finally:
+        for shm, _ in blocks:
+            shm.close()
+            shm.unlink()
@@ -0,0 +1,260 @@
+"""
+Opt-in per-stage timing of the computation hot path.
+
+The stages of :mod:`pytheas._core` (time conversion, lunar and solar
+series, ECI->ECEF rotation, tidal kernels, projection) are marked with
+:func:`profiled` or :func:`stage`.  While no :func:`profiling` block is
+active these cost one global lookup per call; inside one, every stage
+records its wall time, call count and sample count.
+
+Usage::
+
+    with pytheas.profiling() as prof:
+        pytheas.compute_timeseries(start, end, 48.14, 11.58, 500.0)
+    print(prof.report())
+    prof.save_chrome_trace("trace.json")    # chrome://tracing, Perfetto
+
+Stages run by worker processes (``workers=``) are not recorded.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+
+__all__ = ["profiling", "Profile", "StageStats"]
+
+# The Profile recording stages, or None (checked on every stage entry)
+_active = None
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    __slots__ = ('profile', 'name', 'samples', 'start', 'stack', 'child')
+
+    def __init__(self, profile, name, samples):
+        self.profile = profile
+        self.name = name
+        self.samples = samples
+
+    def __enter__(self):
+        self.stack = self.profile._stack()
+        self.child = 0
+        self.stack.append(self)
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter_ns()
+        self.stack.pop()
+        duration = end - self.start
+        if self.stack:
+            self.stack[-1].child += duration
+        self.profile._record(self.name, self.samples, self.start, duration,
+                             duration - self.child)
+        return False
+
+
+def stage(name, samples=0):
+    """Context manager timing *name* when profiling is active."""
+    profile = _active
+    if profile is None:
+        return _NULL_STAGE
+    return _Stage(profile, name, samples)
+
+
+def _count(x, *args, **kwargs):
+    """Number of epochs in a scalar, array or sequence first argument."""
+    size = getattr(x, 'size', None)
+    if size is not None:
+        return int(size)
+    try:
+        return len(x)
+    except TypeError:
+        return 1
+
+
+def profiled(name, samples=_count):
+    """Decorator timing every call of a function as stage *name*.
+
+    *samples* maps the call arguments to a sample count (default: the
+    size or length of the first argument).  A stage already open on
+    the calling thread is not timed again, so recursive or nested uses of
+    one stage are counted once.
+    """
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profile = _active
+            if profile is None or profile._open(name):
+                return fn(*args, **kwargs)
+            with _Stage(profile, name, samples(*args, **kwargs)):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@dataclass(frozen=True)
+class StageStats:
+    """Accumulated timings of one stage."""
+    name: str
+    calls: int
+    samples: int          # epochs (or epoch x site pairs) processed
+    total_s: float        # wall time including nested stages [s]
+    self_s: float         # wall time excluding nested stages [s]
+
+    @property
+    def per_sample_s(self):
+        return self.total_s / self.samples if self.samples else float('nan')
+
+
+class Profile:
+    """Stage timings recorded by :func:`profiling`.
+
+    Attributes
+    ----------
+    wall_s : float
+        Wall time of the ``with`` block in seconds.
+    events : list of tuple
+        ``(name, thread_id, start_ns, duration_ns, samples)`` per stage
+        call when *trace* is on, at most *max_events* of them.
+    dropped_events : int
+        Events not kept because *max_events* was reached.
+    """
+
+    def __init__(self, trace=True, max_events=1_000_000):
+        self.trace = trace
+        self.max_events = max_events
+        self.wall_s = 0.0
+        self.events = []
+        self.dropped_events = 0
+        self._totals = {}       # name -> [calls, samples, total_ns, self_ns]
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._t0 = None
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _open(self, name):
+        return any(s.name == name for s in self._stack())
+
+    def _record(self, name, samples, start, duration, own):
+        with self._lock:
+            t = self._totals.get(name)
+            if t is None:
+                t = self._totals[name] = [0, 0, 0, 0]
+            t[0] += 1
+            t[1] += samples
+            t[2] += duration
+            t[3] += own
+            if self.trace:
+                if len(self.events) < self.max_events:
+                    self.events.append((name, threading.get_ident(), start,
+                                        duration, samples))
+                else:
+                    self.dropped_events += 1
+
+    @property
+    def stages(self):
+        """dict of :class:`StageStats` by stage name, slowest first."""
+        items = sorted(self._totals.items(), key=lambda kv: -kv[1][2])
+        return {name: StageStats(name, calls, samples, total / 1e9, own / 1e9)
+                for name, (calls, samples, total, own) in items}
+
+    @property
+    def untracked_s(self):
+        """Wall time spent outside every stage (single-threaded use)."""
+        own = sum(t[3] for t in self._totals.values()) / 1e9
+        return max(0.0, self.wall_s - own)
+
+    def report(self):
+        """Table of stage timings as text."""
+        lines = [f"{'stage':16s} {'calls':>8s} {'samples':>11s} "
+                 f"{'total ms':>10s} {'self ms':>10s} {'self %':>7s} "
+                 f"{'ns/sample':>10s}"]
+        wall = self.wall_s or float('nan')
+        for s in self.stages.values():
+            per = (f"{s.self_s / s.samples * 1e9:10.1f}" if s.samples
+                   else f"{'-':>10s}")
+            lines.append(f"{s.name:16s} {s.calls:8d} {s.samples:11d} "
+                         f"{s.total_s * 1e3:10.3f} {s.self_s * 1e3:10.3f} "
+                         f"{100 * s.self_s / wall:6.1f}% {per}")
+        lines.append(f"{'(untracked)':16s} {'':8s} {'':11s} {'':10s} "
+                     f"{self.untracked_s * 1e3:10.3f} "
+                     f"{100 * self.untracked_s / wall:6.1f}%")
+        lines.append(f"{'(wall)':16s} {'':8s} {'':11s} "
+                     f"{self.wall_s * 1e3:10.3f}")
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """Trace-event JSON object (``"X"`` complete events, microseconds)."""
+        pid = os.getpid()
+        t0 = self._t0 or 0
+        events = [{"name": name, "cat": "pytheas", "ph": "X", "pid": pid,
+                   "tid": tid, "ts": (start - t0) / 1e3, "dur": dur / 1e3,
+                   "args": {"samples": samples}}
+                  for name, tid, start, dur, samples in self.events]
+        return {"traceEvents": events, "displayTimeUnit": "ms",
+                "otherData": {"wall_s": self.wall_s,
+                              "dropped_events": self.dropped_events}}
+
+    def save_chrome_trace(self, path):
+        """Write :meth:`chrome_trace` to *path* for chrome://tracing."""
+        with open(path, 'w') as f:
+            json.dump(self.chrome_trace(), f)
+
+
+class profiling:
+    """Record per-stage timings of Pytheas calls in a ``with`` block.
+
+    Parameters
+    ----------
+    trace : bool, optional
+        Keep one event per stage call for :meth:`Profile.chrome_trace`
+        (default True).  Totals are recorded either way.
+    max_events : int, optional
+        Cap on kept trace events (default 1,000,000).
+
+    Returns
+    -------
+    Profile
+        Bound by ``with profiling() as prof``; filled in as the block runs.
+        Blocks do not nest: an inner block records on its own and the
+        outer one resumes afterwards.
+    """
+
+    def __init__(self, trace=True, max_events=1_000_000):
+        self.profile = Profile(trace, max_events)
+        self._outer = None
+
+    def __enter__(self):
+        global _active
+        self._outer = _active
+        self.profile._t0 = time.perf_counter_ns()
+        _active = self.profile
+        return self.profile
+
+    def __exit__(self, *exc):
+        global _active
+        _active = self._outer
+        self.profile.wall_s = (time.perf_counter_ns()
+                               - self.profile._t0) / 1e9
+        return False
@@ -0,0 +1,217 @@
+"""
+Real-time tide prediction stream aligned to the wall clock.
+
+:func:`realtime` returns an async iterator that yields one
+:class:`RealtimeSample` per cadence tick.  Predictions for a lookahead
+window are computed in a background executor with the batched
+:class:`~pytheas.LabFrame` kernels, so the event loop only sleeps until
+each tick and hands out a precomputed result.
+
+Usage::
+
+    async for sample in pytheas.realtime(Station(48.14, 11.58, 500.0),
+                                         cadence=1.0):
+        correct(feed.latest(), sample.result.g_tidal)
+
+asyncio is imported on first use so ``import pytheas`` stays light.
+"""
+
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from ._core import (
+    GravityResult, LabFrame, Station,
+    _datetime_to_ns, _ephemerides_ecef, _ns_to_jd_split,
+)
+
+
+@dataclass(frozen=True)
+class RealtimeSample:
+    """One prediction from a :func:`realtime` stream."""
+    time: datetime          # scheduled epoch (naive UTC)
+    result: GravityResult   # prediction at *time*
+    latency: float          # delivery time minus *time* [s]
+
+
+@dataclass(frozen=True)
+class RealtimeMetrics:
+    """Delivery statistics of a :func:`realtime` stream.
+
+    *jitter* is the RFC 3550 interarrival jitter: a running mean of the
+    change in latency between consecutive samples, smoothed over ~16
+    samples.  A sample is *late* when its latency exceeds one cadence.
+    """
+    samples: int
+    latency_mean: float     # [s]
+    latency_max: float      # [s]
+    jitter: float           # [s]
+    late: int
+
+
+class RealtimeStream:
+    """Async iterator returned by :func:`realtime`; see there."""
+
+    def __init__(self, station, cadence=1.0, lookahead=60.0, start=None,
+                 count=None, executor=None, clock=time.time):
+        if not isinstance(station, Station):
+            station = Station(*station)
+        if isinstance(cadence, timedelta):
+            cadence = cadence.total_seconds()
+        self._cadence_us = int(round(cadence * 1e6))
+        if self._cadence_us < 1:
+            raise ValueError("cadence must be >= 1 microsecond")
+        self.station = station
+        self.cadence = self._cadence_us / 1e6
+        self._window = max(1, int(lookahead / self.cadence))
+        self._count = count
+        self._executor = executor
+        self._clock = clock
+
+        self._lab = LabFrame(station.lat_deg, station.lon_deg, station.alt_m)
+        zen = np.radians(station.zenith_deg)
+        azi = np.radians(station.azimuth_deg)
+        self._axis = np.array([np.sin(zen) * np.sin(azi),
+                               np.sin(zen) * np.cos(azi),
+                               np.cos(zen)])          # ENU
+
+        if start is None:
+            now_us = int(clock() * 1e6)
+            first = -(-now_us // self._cadence_us) * self._cadence_us
+        else:
+            first = _datetime_to_ns(start) // 1000
+        self._fetch_us = first        # first epoch not yet requested
+        self._buffer = deque()
+        self._pending = None
+        self._delivered = 0
+
+        self._lat_sum = 0.0
+        self._lat_max = 0.0
+        self._jitter = 0.0
+        self._last_latency = None
+        self._late = 0
+
+    # -- prediction (runs in the executor) ----------------------------------
+
+    def _predict(self, first_us, n):
+        """Predictions for *n* ticks starting at *first_us* (UTC us)."""
+        us = first_us + self._cadence_us * np.arange(n, dtype=np.int64)
+        R_moon, R_sun = _ephemerides_ecef(*_ns_to_jd_split(us * 1000))
+        _, _, a_moon, a_sun = self._lab._tidal_enu(R_moon, R_sun, order=0)
+        g_moon = a_moon @ self._axis
+        g_sun = a_sun @ self._axis
+        g_normal = self._lab._g_normal
+        cos_z = float(self._axis[2])
+        g_static = g_normal * cos_z
+
+        times = us.astype('datetime64[us]').tolist()
+        out = []
+        for t, gm, gs in zip(times, g_moon.tolist(), g_sun.tolist()):
+            gt = gm + gs
+            out.append((t, GravityResult(
+                g_total=g_static + gt, g_static=g_static, g_normal=g_normal,
+                cos_zenith=cos_z, g_tidal=gt,
+                g_tidal_moon=gm, g_tidal_sun=gs)))
+        return out
+
+    def _request(self, loop):
+        self._pending = loop.run_in_executor(
+            self._executor, self._predict, self._fetch_us, self._window)
+        self._fetch_us += self._window * self._cadence_us
+
+    # -- async iteration ----------------------------------------------------
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        import asyncio
+
+        if self._count is not None and self._delivered >= self._count:
+            raise StopAsyncIteration
+        loop = asyncio.get_running_loop()
+
+        if self._pending is None and len(self._buffer) <= self._window // 2:
+            self._request(loop)
+        if self._pending is not None and (not self._buffer
+                                          or self._pending.done()):
+            self._buffer.extend(await self._pending)
+            self._pending = None
+
+        t, result = self._buffer.popleft()
+        due = _datetime_to_ns(t) / 1e9
+        delay = due - self._clock()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        latency = self._clock() - due
+
+        self._delivered += 1
+        self._record(latency)
+        return RealtimeSample(time=t, result=result, latency=latency)
+
+    async def aclose(self):
+        """Stop the stream and cancel any prediction in flight."""
+        if self._pending is not None:
+            self._pending.cancel()
+            self._pending = None
+        self._count = self._delivered
+
+    # -- metrics ------------------------------------------------------------
+
+    def _record(self, latency):
+        self._lat_sum += latency
+        self._lat_max = max(self._lat_max, latency)
+        if latency > self.cadence:
+            self._late += 1
+        if self._last_latency is not None:
+            d = abs(latency - self._last_latency)
+            self._jitter += (d - self._jitter) / 16.0
+        self._last_latency = latency
+
+    @property
+    def metrics(self):
+        """:class:`RealtimeMetrics` over the samples delivered so far."""
+        n = self._delivered
+        return RealtimeMetrics(samples=n,
+                               latency_mean=self._lat_sum / n if n else 0.0,
+                               latency_max=self._lat_max,
+                               jitter=self._jitter, late=self._late)
+
+
+def realtime(station, cadence=1.0, lookahead=60.0, start=None, count=None,
+             executor=None, clock=time.time):
+    """Stream tide predictions on a wall-clock schedule.
+
+    Parameters
+    ----------
+    station : Station or tuple
+        Site and measurement axis, as for
+        :func:`pytheas.compute_network_timeseries`.
+    cadence : float or timedelta, optional
+        Interval between samples in seconds (default 1).  Epochs fall on
+        whole multiples of the cadence since 1970 unless *start* is given.
+    lookahead : float, optional
+        Seconds of predictions computed per background batch (default 60).
+        A new batch is requested when half of the current one is used.
+    start : datetime, optional
+        First epoch (UTC; naive datetimes are taken as UTC, aware ones are
+        converted).  Epochs already in the past are yielded immediately and
+        show up as latency.
+    count : int, optional
+        Stop after this many samples (default: never).
+    executor : concurrent.futures.Executor, optional
+        Where predictions are computed (default: the loop's executor).
+    clock : callable, optional
+        Returns the current POSIX time in seconds (default ``time.time``).
+
+    Returns
+    -------
+    RealtimeStream
+        Async iterator of :class:`RealtimeSample`; its ``metrics``
+        property reports latency and jitter.
+    """
+    return RealtimeStream(station, cadence, lookahead, start, count,
+                          executor, clock)
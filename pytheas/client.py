@@ -0,0 +1,135 @@
+"""
+Blocking client for the ``pytheas serve`` prediction server.
+
+Usage::
+
+    from pytheas.client import Client
+
+    with Client() as c:                       # localhost:8765
+        r = c.compute_g(datetime(2025, 3, 20, 12), 48.14, 11.58, 500.0)
+        rs = c.compute_many([(t, 48.14, 11.58, 500.0) for t in epochs])
+
+Requests sent by :meth:`Client.compute_many` are pipelined on one
+connection, so the server can coalesce them into a single batch.  See
+:mod:`pytheas.server` for the wire protocol.
+
+The client uses only the standard library: importing it loads neither
+NumPy nor the computational core.
+"""
+
+import json
+import socket
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+__all__ = ["Client", "Prediction", "ServerError"]
+
+DEFAULT_ADDRESS = ('127.0.0.1', 8765)
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+
+def _datetime_to_ns(dt):
+    """UTC nanoseconds since 1970 for a datetime (naive = UTC)."""
+    if dt.tzinfo is None or dt.utcoffset() is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return ((dt - _UNIX_EPOCH) // _ONE_US) * 1000
+
+
+@dataclass(frozen=True)
+class Prediction:
+    """Server answer to one request: the fields of
+    :class:`pytheas.GravityResult`, as plain floats."""
+    g_total: float       # total g on axis [m/s²]
+    g_static: float      # normal gravity projected on axis [m/s²]
+    g_normal: float      # normal gravity magnitude [m/s²]
+    cos_zenith: float    # projection factor
+    g_tidal: float       # elastic-Earth tidal perturbation on axis [m/s²]
+    g_tidal_moon: float  # lunar contribution on axis [m/s²]
+    g_tidal_sun: float   # solar contribution on axis [m/s²]
+
+
+class ServerError(RuntimeError):
+    """The server rejected a request."""
+
+
+class Client:
+    """Connection to a prediction server.
+
+    Parameters
+    ----------
+    address : tuple or str, optional
+        (host, port) for TCP or a Unix socket path
+        (default ``('127.0.0.1', 8765)``).
+    timeout : float, optional
+        Socket timeout in seconds (default 10).
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, timeout=10.0):
+        if isinstance(address, str):
+            self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self._sock.settimeout(timeout)
+        self._sock.connect(address if isinstance(address, str)
+                           else tuple(address))
+        self._file = self._sock.makefile('rb')
+        self._next_id = 0
+
+    def close(self):
+        self._file.close()
+        self._sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def compute_g(self, dt, lat_deg, lon_deg, alt_m=0.0,
+                  zenith_deg=0.0, azimuth_deg=0.0):
+        """Remote :func:`pytheas.compute_g`; returns a :class:`Prediction`."""
+        return self.compute_many(
+            [(dt, lat_deg, lon_deg, alt_m, zenith_deg, azimuth_deg)])[0]
+
+    def compute_many(self, requests):
+        """Evaluate many requests over one round trip.
+
+        Parameters
+        ----------
+        requests : iterable of tuple
+            ``(dt, lat_deg, lon_deg[, alt_m, zenith_deg, azimuth_deg])``.
+
+        Returns
+        -------
+        list of Prediction
+            In request order.
+
+        Raises
+        ------
+        ServerError
+            If the server rejects any request.
+        """
+        lines = []
+        for dt, *site in requests:
+            site = list(site) + [0.0] * (5 - len(site))
+            req = dict(id=self._next_id, t_ns=_datetime_to_ns(dt),
+                       lat=site[0], lon=site[1], alt=site[2],
+                       zenith=site[3], azimuth=site[4])
+            self._next_id += 1
+            lines.append(json.dumps(req).encode() + b'\n')
+        self._sock.sendall(b''.join(lines))
+
+        # Read every response before raising so the stream stays in step
+        responses = []
+        for _ in lines:
+            line = self._file.readline()
+            if not line:
+                raise ConnectionError("server closed the connection")
+            responses.append(json.loads(line))
+        for resp in responses:
+            if 'error' in resp:
+                raise ServerError(resp['error'])
+        return [Prediction(**{k: v for k, v in resp.items() if k != 'id'})
+                for resp in responses]
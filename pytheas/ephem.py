@@ -0,0 +1,351 @@
+"""
+Piecewise-Chebyshev ephemeris cache for long, dense timeseries.
+
+The Moon and Sun move smoothly in ECI over hours, so re-running the full
+Meeus series at every 1 Hz sample is wasted work.  :class:`ChebyshevEphemeris`
+fits both ECI positions with Chebyshev polynomials over fixed-length
+granules, validates the fit against the direct series, and then serves any
+epoch inside its window by polynomial evaluation.  The GMST rotation to
+ECEF is still applied exactly per epoch by the caller.
+
+Fits can be saved once as an ephemeris table -- a small header followed
+by the raw float64 coefficient array -- and reopened with ``numpy.memmap``,
+so any number of worker processes share the same pages without copying.
+A configured table is consulted transparently by the position functions.
+
+The table replaces only the series evaluation.  On a regular grid, where
+the Meeus series already takes its angle-addition path, the ECI positions
+come out about 10x faster (some 30x on irregular epochs), and the
+positions in ECEF, after the exact GMST rotation, about 3x.  A whole
+:func:`pytheas.compute_timeseries` run speeds up by less, about 1.8x over
+30 days at 10 s, as the time conversion, rotation and tidal kernels are
+unchanged; ``benchmarks/bench.py -k 30d_10s`` measures both.
+
+Usage::
+
+    eph = ChebyshevEphemeris(start, end)
+    data = compute_timeseries(start, end, lat, lon, alt,
+                              interval_minutes=1 / 60, ephemeris=eph)
+
+    eph.save("moon_sun_2020s.pyteph")          # or: pytheas build ...
+    set_ephemeris("moon_sun_2020s.pyteph")     # in every worker
+"""
+
+import os
+import struct
+
+import numpy as np
+
+from . import _core
+from ._core import _meeus_eci, julian_date_split
+from ._profiling import profiled
+
+__all__ = ["ChebyshevEphemeris", "set_ephemeris", "get_ephemeris"]
+
+# Table file layout (little-endian):
+#   magic, version, degree, n_granules, day0, t0, length_days,
+#   tol_m, max_error_moon_m, max_error_sun_m
+# padded to _HEADER_SIZE bytes, then float64 coefficients (G, degree+1, 6).
+_MAGIC = b"PYTHEPH\0"
+_VERSION = 1
+_HEADER = struct.Struct("<8sIIqdddddd")
+_HEADER_SIZE = 128
+
+
+def _cheb_nodes(n):
+    """Chebyshev-Gauss nodes on [-1, 1] for a degree-*n* fit."""
+    return np.cos(np.pi * (np.arange(n + 1) + 0.5) / (n + 1))
+
+
+def _cheb_fit_matrix(n):
+    """(n+1, n+1) matrix mapping values at the nodes to coefficients."""
+    k = np.arange(n + 1)[:, None]
+    j = np.arange(n + 1)[None, :]
+    M = (2.0 / (n + 1)) * np.cos(np.pi * k * (j + 0.5) / (n + 1))
+    M[0] *= 0.5
+    return M
+
+
+def _cheb_basis(x, n):
+    """(N, n+1) Chebyshev polynomials T_0..T_n evaluated at *x*."""
+    B = np.empty((x.size, n + 1))
+    B[:, 0] = 1.0
+    if n >= 1:
+        B[:, 1] = x
+    x2 = 2.0 * x
+    for k in range(2, n + 1):
+        np.multiply(x2, B[:, k - 1], out=B[:, k])
+        B[:, k] -= B[:, k - 2]
+    return B
+
+
+class ChebyshevEphemeris:
+    """Piecewise-Chebyshev approximation of the Meeus Moon/Sun ECI positions.
+
+    The window ``[start, end]`` is cut into granules of *granule_hours*.
+    The lowest polynomial degree whose error, checked against the direct
+    series on a denser validation grid in every granule, stays within
+    *tol_m* is selected.
+
+    Parameters
+    ----------
+    start, end : datetime or datetime64
+        UTC bounds of the window to cover (inclusive).
+    granule_hours : float, optional
+        Length of each polynomial piece (default 24 h).
+    tol_m : float, optional
+        Maximum allowed position error for either body in meters
+        (default 1 m, i.e. ~1e-14 m/s^2 of lunar tide).
+    max_degree : int, optional
+        Highest degree tried before giving up (default 32).
+
+    Attributes
+    ----------
+    degree : int
+        Selected polynomial degree.
+    max_error_m : tuple of float
+        (moon, sun) maximum validation error in meters.
+
+    Raises
+    ------
+    ValueError
+        If no degree up to *max_degree* meets *tol_m*; use shorter granules.
+    """
+
+    def __init__(self, start, end, granule_hours=24.0, tol_m=1.0,
+                 max_degree=32):
+        if granule_hours <= 0:
+            raise ValueError("granule_hours must be > 0")
+        if tol_m <= 0:
+            raise ValueError("tol_m must be > 0")
+        day0, frac0 = julian_date_split(start)
+        day1, frac1 = julian_date_split(end)
+        span = float((day1 - day0) + (frac1 - frac0))
+        if span < 0:
+            raise ValueError("end must be >= start")
+
+        self._day0 = float(day0)
+        self._t0 = float(frac0)               # window start, days past _day0
+        self._length = granule_hours / 24.0   # granule length in days
+        self._n_granules = max(1, int(np.ceil(span / self._length)))
+        self.granule_hours = granule_hours
+        self.tol_m = tol_m
+
+        for degree in range(4, max_degree + 1, 2):
+            coeffs = self._fit(degree)
+            err = self._check(coeffs, degree)
+            if max(err) <= tol_m:
+                break
+        else:
+            raise ValueError(
+                f"no Chebyshev degree <= {max_degree} reaches "
+                f"tol_m={tol_m} with {granule_hours} h granules "
+                f"(max error {max(err):.3g} m); use shorter granules")
+
+        self.degree = degree
+        self.max_error_m = err
+        self._coeffs = coeffs                 # (G, degree+1, 6)
+        self.path = None
+
+    # -- persistence --------------------------------------------------------
+
+    def save(self, path):
+        """Write the fit as an ephemeris table.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Output file.
+        """
+        header = _HEADER.pack(
+            _MAGIC, _VERSION, self.degree, self._n_granules,
+            self._day0, self._t0, self._length, self.tol_m,
+            *self.max_error_m)
+        with open(path, "wb") as f:
+            f.write(header.ljust(_HEADER_SIZE, b"\0"))
+            np.ascontiguousarray(self._coeffs, dtype="<f8").tofile(f)
+
+    @classmethod
+    def open(cls, path):
+        """Open an ephemeris table written by :meth:`save`.
+
+        The coefficients are memory-mapped read-only, so processes opening
+        the same file share its pages.
+
+        Parameters
+        ----------
+        path : str or os.PathLike
+            Table file.
+
+        Returns
+        -------
+        ChebyshevEphemeris
+
+        Raises
+        ------
+        ValueError
+            If the file is not a pytheas ephemeris table of this version.
+        """
+        with open(path, "rb") as f:
+            raw = f.read(_HEADER_SIZE)
+        if len(raw) < _HEADER.size or raw[:8] != _MAGIC:
+            raise ValueError(f"{path} is not a pytheas ephemeris table")
+        (_, version, degree, n_granules, day0, t0, length, tol_m,
+         err_moon, err_sun) = _HEADER.unpack_from(raw)
+        if version != _VERSION:
+            raise ValueError(
+                f"unsupported ephemeris table version {version}")
+
+        self = cls.__new__(cls)
+        self._day0 = day0
+        self._t0 = t0
+        self._length = length
+        self._n_granules = n_granules
+        self.granule_hours = length * 24.0
+        self.tol_m = tol_m
+        self.degree = degree
+        self.max_error_m = (err_moon, err_sun)
+        self._coeffs = np.memmap(path, dtype="<f8", mode="r",
+                                 offset=_HEADER_SIZE,
+                                 shape=(n_granules, degree + 1, 6))
+        self.path = os.fspath(path)
+        return self
+
+    def __reduce__(self):
+        # File-backed tables travel to worker processes by path and are
+        # re-mapped there instead of being pickled as a full array copy.
+        if self.path is not None:
+            return (type(self).open, (self.path,))
+        return super().__reduce__()
+
+    # -- fitting ------------------------------------------------------------
+
+    def _direct(self, t):
+        """Stacked (..., 6) Meeus ECI positions at *t* days past _day0."""
+        whole = np.floor(t)
+        moon, sun = _meeus_eci(self._day0 + whole, t - whole)
+        return np.concatenate((moon, sun), axis=-1)
+
+    def _granule_times(self, x):
+        """(G, len(x)) epochs in days for local coordinates *x*."""
+        starts = self._t0 + self._length * np.arange(self._n_granules)
+        return starts[:, None] + 0.5 * self._length * (x[None, :] + 1.0)
+
+    def _fit(self, degree):
+        values = self._direct(self._granule_times(_cheb_nodes(degree)))
+        return np.einsum('kj,gjc->gkc', _cheb_fit_matrix(degree), values)
+
+    def _check(self, coeffs, degree):
+        """(moon, sun) max error on a validation grid including endpoints."""
+        x = np.cos(np.pi * np.arange(2 * degree + 3) / (2 * degree + 2))
+        direct = self._direct(self._granule_times(x))
+        approx = np.einsum('jk,gkc->gjc', _cheb_basis(x, degree), coeffs)
+        diff = approx - direct
+        moon = float(np.max(np.linalg.norm(diff[..., :3], axis=-1)))
+        sun = float(np.max(np.linalg.norm(diff[..., 3:], axis=-1)))
+        return moon, sun
+
+    # -- evaluation ---------------------------------------------------------
+
+    def _locate(self, day, frac):
+        """Granule index and local coordinate in [-1, 1] for each epoch."""
+        t = ((np.asarray(day, dtype=float) - self._day0)
+             + np.asarray(frac, dtype=float)).reshape(-1)
+        u = (t - self._t0) / self._length
+        idx = np.floor(u).astype(np.int64)
+        # The window end may sit exactly on the last granule boundary
+        idx[(idx == self._n_granules) & (u <= self._n_granules)] -= 1
+        return idx, 2.0 * (u - idx) - 1.0
+
+    def covers(self, day, frac):
+        """True if every split Julian Date lies inside the fitted window."""
+        idx, _ = self._locate(day, frac)
+        return bool(idx.size == 0
+                    or (idx.min() >= 0 and idx.max() < self._n_granules))
+
+    @profiled('ephemeris_table', lambda self, day, frac: np.size(day))
+    def eci(self, day, frac):
+        """Moon and Sun ECI positions for split Julian Dates.
+
+        Parameters
+        ----------
+        day, frac : numpy.ndarray
+            (N,) split Julian Dates, as from :func:`julian_date_split`.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            (moon_eci, sun_eci), each (N, 3) in meters.
+
+        Raises
+        ------
+        ValueError
+            If any epoch lies outside the fitted window.
+        """
+        idx, x = self._locate(day, frac)
+        n = idx.size
+        if n and (idx.min() < 0 or idx.max() >= self._n_granules):
+            raise ValueError("epoch outside the ephemeris window")
+
+        out = np.empty((n, 6))
+        if n and np.all(idx[1:] >= idx[:-1]):
+            # Sorted epochs: one (n_k, d+1) @ (d+1, 6) product per granule
+            bounds = np.flatnonzero(np.diff(idx)) + 1
+            for lo, hi in zip(np.r_[0, bounds], np.r_[bounds, n]):
+                out[lo:hi] = (_cheb_basis(x[lo:hi], self.degree)
+                              @ self._coeffs[idx[lo]])
+        elif n:
+            basis = _cheb_basis(x, self.degree)
+            out[:] = np.einsum('nk,nkc->nc', basis, self._coeffs[idx])
+        shape = np.shape(day) + (3,)
+        return out[:, :3].reshape(shape), out[:, 3:].reshape(shape)
+
+    def validate(self, epochs):
+        """Maximum deviation from the direct Meeus series at *epochs*.
+
+        Parameters
+        ----------
+        epochs : sequence of datetime, datetime64 or numeric array_like
+            UTC epochs inside the fitted window.
+
+        Returns
+        -------
+        tuple of float
+            (moon, sun) maximum ECI position difference in meters.
+        """
+        day, frac = julian_date_split(epochs)
+        moon, sun = self.eci(day, frac)
+        moon_ref, sun_ref = _meeus_eci(day, frac)
+        return (float(np.max(np.linalg.norm(moon - moon_ref, axis=-1))),
+                float(np.max(np.linalg.norm(sun - sun_ref, axis=-1))))
+
+
+def set_ephemeris(ephemeris):
+    """Configure the process-wide default ephemeris backend.
+
+    Once set, :func:`pytheas.moon_position_ecef`,
+    :func:`pytheas.sun_position_ecef` and every function built on them use
+    the backend for epochs inside its window and fall back to the direct
+    Meeus series elsewhere.  An explicit ``ephemeris=`` argument still
+    takes precedence.
+
+    Parameters
+    ----------
+    ephemeris : ChebyshevEphemeris, str, os.PathLike or None
+        A backend, the path of an ephemeris table (opened memory-mapped),
+        or None to restore the direct series.
+
+    Returns
+    -------
+    ChebyshevEphemeris or None
+        The backend now in effect.
+    """
+    if isinstance(ephemeris, (str, os.PathLike)):
+        ephemeris = ChebyshevEphemeris.open(ephemeris)
+    _core._EPHEMERIS = ephemeris
+    return ephemeris
+
+
+def get_ephemeris():
+    """Return the configured default backend, or None for the direct series."""
+    return _core._EPHEMERIS
@@ -0,0 +1,160 @@
+"""
+Global grid mode: tidal gravity maps over latitude/longitude meshes.
+
+Instead of one :func:`pytheas.compute_g` call per grid node, the building
+blocks (normal gravity, ECEF position, ENU basis, measurement axis) are
+evaluated as arrays over the grid, and the Moon and Sun are evaluated once
+per epoch.  The grid is processed in tiles of at most *tile_size* nodes,
+so temporaries stay bounded and only the dense outputs scale with the grid:
+a 0.1 deg global grid (1801 x 3600 nodes) at one epoch needs ~310 MB.
+
+Usage::
+
+    lat, lon = global_grid(0.5)
+    maps = compute_grid(datetime(2025, 3, 20, 12), lat, lon)
+    maps.g_tidal.shape        # (361, 720)
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from ._core import (
+    DELTA_GRAV, GM_MOON, GM_SUN,
+    _ephemerides_ecef, _epochs_to_ns, _ns_to_jd_split,
+    _tidal_acceleration_kernel,
+    enu_basis, geodetic_to_ecef, measurement_axis, normal_gravity,
+)
+
+__all__ = ["GridResult", "compute_grid", "global_grid"]
+
+_TILE_SIZE = 1 << 16   # grid nodes per tile
+
+
+def global_grid(step_deg, lat_range=(-90.0, 90.0), lon_range=(-180.0, 180.0)):
+    """Regular latitude/longitude grid spec.
+
+    Parameters
+    ----------
+    step_deg : float
+        Node spacing in degrees, in both latitude and longitude.
+    lat_range : tuple of float, optional
+        (south, north) bounds in degrees, both included (default poles).
+    lon_range : tuple of float, optional
+        (west, east) bounds in degrees; the east bound is excluded when
+        the range spans 360 deg so the seam is not duplicated.
+
+    Returns
+    -------
+    tuple of numpy.ndarray
+        (lat, lon) shaped (n_lat, 1) and (1, n_lon); they broadcast to
+        the (n_lat, n_lon) grid without materializing it.
+    """
+    if step_deg <= 0:
+        raise ValueError("step_deg must be > 0")
+    n_lat = int(round((lat_range[1] - lat_range[0]) / step_deg)) + 1
+    span = lon_range[1] - lon_range[0]
+    n_lon = int(round(span / step_deg)) + (0 if span >= 360.0 else 1)
+    lat = lat_range[0] + step_deg * np.arange(n_lat)
+    lon = lon_range[0] + step_deg * np.arange(n_lon)
+    return lat[:, None], lon[None, :]
+
+
+@dataclass(frozen=True)
+class GridResult:
+    """Result of a grid gravity computation.
+
+    Returned by :func:`compute_grid`.  Grid-shaped arrays have the
+    broadcast shape G of the inputs; epoch-dependent arrays are (T, *G),
+    or G alone for a single epoch.
+    """
+    times: np.ndarray         # (T,) datetime64[ns] UTC
+    g_total: np.ndarray       # total g on axis [m/s²]
+    g_static: np.ndarray      # G normal gravity on axis [m/s²]
+    g_normal: np.ndarray      # G normal gravity magnitude [m/s²]
+    g_tidal: np.ndarray       # tidal perturbation on axis [m/s²]
+    g_tidal_moon: np.ndarray  # lunar contribution [m/s²]
+    g_tidal_sun: np.ndarray   # solar contribution [m/s²]
+
+
+def compute_grid(dt, lat_deg, lon_deg, alt_m=0.0, zenith_deg=0.0,
+                 azimuth_deg=0.0, tile_size=None, ephemeris=None):
+    """Compute normal gravity + body tide over a grid of sites.
+
+    Parameters
+    ----------
+    dt : datetime, sequence of datetime or datetime64 array_like
+        UTC epoch or epochs.
+    lat_deg, lon_deg : array_like
+        Geodetic latitude and longitude in degrees; broadcast together
+        with *alt_m*, *zenith_deg* and *azimuth_deg* to the grid shape G
+        (see :func:`global_grid`).
+    alt_m : float or array_like, optional
+        Altitude above the WGS84 ellipsoid in meters (default 0).
+    zenith_deg, azimuth_deg : float or array_like, optional
+        Measurement axis at every node (default vertical).
+    tile_size : int, optional
+        Grid nodes processed per tile (default 65536).  Peak temporary
+        memory is a few hundred bytes per node in a tile.
+    ephemeris : object, optional
+        Ephemeris backend such as :class:`pytheas.ephem.ChebyshevEphemeris`.
+        Defaults to the configured backend (see
+        :func:`pytheas.ephem.set_ephemeris`), else the direct Meeus series.
+
+    Returns
+    -------
+    GridResult
+        Dense g_total, g_tidal, g_tidal_moon, g_tidal_sun of shape
+        (T, *G) -- G for a scalar epoch -- and g_static, g_normal of
+        shape G.
+    """
+    tile_size = _TILE_SIZE if tile_size is None else int(tile_size)
+    if tile_size < 1:
+        raise ValueError("tile_size must be >= 1")
+
+    inputs = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (
+        lat_deg, lon_deg, alt_m, zenith_deg, azimuth_deg)))
+    shape = inputs[0].shape
+    size = inputs[0].size
+
+    ns = _epochs_to_ns(dt)
+    scalar_epoch = np.ndim(ns) == 0
+    ns = np.atleast_1d(ns).reshape(-1)
+    R_moon, R_sun = _ephemerides_ecef(*_ns_to_jd_split(ns), ephemeris)
+    n_t = ns.size
+
+    g_normal = np.empty(size)
+    g_static = np.empty(size)
+    g_tidal_moon = np.empty((n_t, size))
+    g_tidal_sun = np.empty((n_t, size))
+
+    for lo in range(0, size, tile_size):
+        hi = min(lo + tile_size, size)
+        # .flat slicing copies only this tile out of the broadcast views
+        lat, lon, alt, zen, azi = (x.flat[lo:hi] for x in inputs)
+
+        g0 = normal_gravity(lat, alt)
+        n_hat = measurement_axis(lat, lon, zen, azi)           # (n, 3)
+        e_up = enu_basis(lat, lon)[2]
+        g_normal[lo:hi] = g0
+        g_static[lo:hi] = g0 * np.einsum('nk,nk->n', e_up, n_hat)
+
+        r = geodetic_to_ecef(lat, lon, alt)                    # (n, 3)
+        for k in range(n_t):
+            a = _tidal_acceleration_kernel(r, R_moon[k],
+                                           DELTA_GRAV * GM_MOON)
+            g_tidal_moon[k, lo:hi] = np.einsum('nk,nk->n', a, n_hat)
+            a = _tidal_acceleration_kernel(r, R_sun[k], DELTA_GRAV * GM_SUN)
+            g_tidal_sun[k, lo:hi] = np.einsum('nk,nk->n', a, n_hat)
+
+    g_tidal = g_tidal_moon + g_tidal_sun
+    g_total = g_tidal + g_static
+
+    out_shape = shape if scalar_epoch else (n_t,) + shape
+    return GridResult(times=ns.astype('datetime64[ns]'),
+                      g_total=g_total.reshape(out_shape),
+                      g_static=g_static.reshape(shape),
+                      g_normal=g_normal.reshape(shape),
+                      g_tidal=g_tidal.reshape(out_shape),
+                      g_tidal_moon=g_tidal_moon.reshape(out_shape),
+                      g_tidal_sun=g_tidal_sun.reshape(out_shape))
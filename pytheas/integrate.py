@@ -0,0 +1,331 @@
+"""
+Trajectories of test masses in the rotating lab frame.
+
+Integrates the lab-frame equation of motion of :meth:`GravityField.eom`,
+
+    a = g + T @ dx - 2 * omega x v,
+
+for a whole ensemble of particles at once: every step is a handful of
+(N, 3) @ (3, 3) products, with no Python loop over particles.
+
+Two schemes are offered:
+
+``'verlet'``
+    Fixed-step velocity Verlet.  The Coriolis term is linear in v and is
+    taken implicitly in the closing half kick (solved with a precomputed
+    3x3 matrix), so the scheme stays explicit in cost, second order and
+    time-reversible, and the Coriolis force does no work.
+``'rk45'``
+    Adaptive Dormand-Prince 5(4) with error control over the whole
+    ensemble (``rtol``, ``atol``); steps are shortened to land exactly on
+    the saved samples and on field refreshes.
+
+The field is evaluated from the :class:`LabFrame` once per
+``refresh_interval`` -- all refresh epochs in one vectorized call -- and
+held constant over each interval at its value at the interval midpoint.
+Without ``refresh_interval`` a single field at the midpoint of the run is
+used, which suits the second-scale drops of atom interferometry.  For
+long runs with fine refreshes, pass a
+:class:`pytheas.interpolate.FieldInterpolator` instead of the lab: the
+refresh epochs are then served from its knots.
+
+Usage::
+
+    lab = LabFrame(48.14, 11.58, 500.0)
+    x0 = rng.normal(0, 1e-3, (100_000, 3))      # (N, 3) positions [m]
+    v0 = rng.normal(0, 1e-2, (100_000, 3))      # (N, 3) velocities [m/s]
+    traj = integrate(lab, datetime(2025, 3, 20, 12), x0, v0,
+                     duration=0.5, dt=1e-4, save_interval=1e-2)
+    traj.x.shape                                # (51, 100000, 3)
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from ._core import GravityField, LabFrame, _datetime_to_ns, _lab_columns
+from .interpolate import FieldInterpolator
+
+__all__ = ["Trajectory", "integrate"]
+
+METHODS = ('verlet', 'rk45')
+
+# Dormand-Prince 5(4) tableau (the field is constant within a step)
+_DP_A = [
+    [],
+    [1 / 5],
+    [3 / 40, 9 / 40],
+    [44 / 45, -56 / 15, 32 / 9],
+    [19372 / 6561, -25360 / 2187, 64448 / 6561, -212 / 729],
+    [9017 / 3168, -355 / 33, 46732 / 5247, 49 / 176, -5103 / 18656],
+    [35 / 384, 0.0, 500 / 1113, 125 / 192, -2187 / 6784, 11 / 84],
+]
+_DP_B = np.array(_DP_A[6] + [0.0])
+_DP_E = _DP_B - np.array([5179 / 57600, 0.0, 7571 / 16695, 393 / 640,
+                          -92097 / 339200, 187 / 2100, 1 / 40])
+
+
+@dataclass(frozen=True)
+class Trajectory:
+    """Saved states of an :func:`integrate` run.
+
+    Attributes
+    ----------
+    t : numpy.ndarray
+        (M,) sample times in seconds after *start*.
+    x, v : numpy.ndarray
+        (M, N, 3) positions [m] and velocities [m/s] in ENU, or (M, 3)
+        for a single particle given as (3,) vectors.
+    start : datetime
+        UTC epoch of t = 0.
+    steps : int
+        Accepted integration steps.
+    rejected_steps : int
+        Steps retried with a shorter step (``'rk45'`` only).
+    field_updates : int
+        Number of field segments used.
+    """
+    t: np.ndarray
+    x: np.ndarray
+    v: np.ndarray
+    start: datetime
+    steps: int
+    rejected_steps: int
+    field_updates: int
+
+    @property
+    def times(self):
+        """(M,) sample epochs as a list of datetime."""
+        return [self.start + timedelta(seconds=float(s)) for s in self.t]
+
+
+def _count(span, step, what):
+    """Whole number of *step* in *span*, or ValueError."""
+    n = int(round(span / step))
+    if n < 1 or abs(n * step - span) > 1e-9 * span:
+        raise ValueError(f"{what} must be a positive multiple of "
+                         f"{'save_interval' if what == 'duration' else 'dt'}")
+    return n
+
+
+def _fields(source, start, duration, refresh_interval, order, ephemeris):
+    """Piecewise-constant fields: (edges, g, T, B) for every segment.
+
+    *edges* are the (S+1,) segment boundaries in seconds, *g* (S, 3) and
+    *T* (S, 3, 3), and *B* (3, 3) maps velocities to the Coriolis term
+    (``v @ B = -2 omega x v``).
+    """
+    if isinstance(source, GravityField):
+        if refresh_interval is not None:
+            raise ValueError("refresh_interval needs a LabFrame or "
+                             "FieldInterpolator")
+        g, T, omega = source.g[None], source.T[None], source.omega
+        edges = np.array([0.0, duration])
+    elif isinstance(source, (LabFrame, FieldInterpolator)):
+        if refresh_interval is None:
+            refresh_interval = duration
+        elif refresh_interval <= 0:
+            raise ValueError("refresh_interval must be > 0")
+        n_seg = int(np.ceil(duration / refresh_interval * (1 - 1e-12)))
+        edges = np.minimum(np.arange(n_seg + 1) * refresh_interval, duration)
+        mid_ns = _datetime_to_ns(start) + np.rint(
+            (edges[:-1] + edges[1:]) / 2 * 1e9).astype(np.int64)
+        if isinstance(source, FieldInterpolator):
+            g, T, _, _ = source._fields(mid_ns)
+            omega = source.lab._omega
+        else:
+            g, T, _, _ = _lab_columns(mid_ns, source, order, ephemeris)
+            omega = source._omega
+    else:
+        raise TypeError("expected a LabFrame, FieldInterpolator or "
+                        "GravityField, got "
+                        f"{type(source).__name__}")
+    wx, wy, wz = 2.0 * omega
+    B = np.array([[0.0, -wz, wy], [wz, 0.0, -wx], [-wy, wx, 0.0]])
+    return edges, g, T, B
+
+
+def integrate(source, start, x0, v0, duration, dt, method='verlet',
+              save_interval=None, refresh_interval=None, order=1,
+              rtol=1e-9, atol=1e-12, out=None, ephemeris=None):
+    """Integrate particle trajectories in the rotating lab frame.
+
+    Parameters
+    ----------
+    source : LabFrame, FieldInterpolator or GravityField
+        Lab whose field drives the motion, an interpolator of it (whose
+        own order and ephemeris then apply), or one fixed field.
+    start : datetime
+        UTC epoch of the initial state.
+    x0, v0 : array_like
+        (N, 3) initial displacements from the lab origin [m] and
+        velocities [m/s] in ENU; (3,) for a single particle.
+    duration : float
+        Integration time [s].
+    dt : float
+        Step [s] for ``'verlet'``; first trial step for ``'rk45'``.
+    method : {'verlet', 'rk45'}, optional
+        Integration scheme (default ``'verlet'``).
+    save_interval : float, optional
+        Spacing of the saved samples [s] (default *dt*).  A multiple of
+        *dt* for ``'verlet'``; *duration* must be a multiple of it.
+    refresh_interval : float, optional
+        Re-evaluate the field every this many seconds (default: once).
+    order : int, optional
+        Field expansion order, as for :meth:`LabFrame.field` (default 1).
+    rtol, atol : float, optional
+        Relative and absolute error targets of ``'rk45'`` per step.
+    out : tuple of numpy.ndarray, optional
+        Preallocated ``(x, v)`` arrays of shape (M, N, 3) -- or (M, 3) --
+        to write the samples into, e.g. memory maps.
+    ephemeris : object, optional
+        Ephemeris backend for the field refreshes.
+
+    Returns
+    -------
+    Trajectory
+        Saved samples at t = 0, save_interval, ..., duration.
+    """
+    if method not in METHODS:
+        raise ValueError(f"unknown method {method!r}; expected one of "
+                         f"{', '.join(METHODS)}")
+    if duration <= 0 or dt <= 0:
+        raise ValueError("duration and dt must be > 0")
+    if save_interval is None:
+        save_interval = dt
+    n_save = _count(duration, save_interval, "duration")
+    save_every = (_count(save_interval, dt, "save_interval")
+                  if method == 'verlet' else None)
+
+    x = np.array(x0, dtype=float)
+    v = np.array(v0, dtype=float)
+    single = x.ndim == 1 and v.ndim == 1
+    x, v = np.broadcast_arrays(np.atleast_2d(x), np.atleast_2d(v))
+    x, v = x.copy(), v.copy()
+    shape = (n_save + 1,) + (x.shape[1:] if single else x.shape)
+    if out is None:
+        x_out, v_out = np.empty(shape), np.empty(shape)
+    else:
+        x_out, v_out = out
+        if x_out.shape != shape or v_out.shape != shape:
+            raise ValueError(f"out arrays must have shape {shape}")
+    # (M, N, 3) views of the sample arrays
+    xs, vs = ((x_out[:, None], v_out[:, None]) if single
+              else (x_out, v_out))
+
+    fields = _fields(source, start, n_save * save_interval, refresh_interval,
+                     order, ephemeris)
+    xs[0], vs[0] = x, v
+    if method == 'verlet':
+        steps, rejected = _verlet(x, v, dt, save_every, xs, vs, fields)
+    else:
+        steps, rejected = _rk45(x, v, dt, save_interval, xs, vs, fields,
+                                rtol, atol)
+
+    t = np.arange(n_save + 1) * save_interval
+    return Trajectory(t=t, x=x_out, v=v_out, start=start, steps=steps,
+                      rejected_steps=rejected,
+                      field_updates=len(fields[0]) - 1)
+
+
+# =====================================================================
+# Velocity Verlet
+# =====================================================================
+
+def _verlet(x, v, h, save_every, xs, vs, fields):
+    """Fixed-step velocity Verlet with an implicit Coriolis half kick."""
+    edges, g_seg, T_seg, B = fields
+    # v_new = v_half + h/2 (g + T x_new + v_new @ B), solved for v_new
+    closing = np.linalg.inv(np.eye(3) - 0.5 * h * B)
+    n_steps = save_every * (len(xs) - 1)
+    a, tmp = np.empty_like(x), np.empty_like(x)
+
+    seg = -1
+    for i in range(n_steps):
+        s = min(int(np.searchsorted(edges, i * h, side='right')) - 1,
+                len(g_seg) - 1)
+        if s != seg:
+            seg, g, Tt = s, g_seg[s], T_seg[s].T
+            np.matmul(x, Tt, out=a)
+            a += g
+            a += np.matmul(v, B, out=tmp)
+
+        np.multiply(a, 0.5 * h, out=tmp)
+        v += tmp                                  # half kick
+        np.multiply(v, h, out=tmp)
+        x += tmp                                  # drift
+        np.matmul(x, Tt, out=a)
+        a += g                                    # position-dependent part
+        np.multiply(a, 0.5 * h, out=tmp)
+        v += tmp
+        np.matmul(v, closing, out=tmp)            # implicit Coriolis
+        v[...] = tmp
+        a += np.matmul(v, B, out=tmp)
+
+        if (i + 1) % save_every == 0:
+            k = (i + 1) // save_every
+            xs[k], vs[k] = x, v
+    return n_steps, 0
+
+
+# =====================================================================
+# Adaptive Dormand-Prince 5(4)
+# =====================================================================
+
+def _rk45(x, v, h, save_interval, xs, vs, fields, rtol, atol):
+    """Adaptive Dormand-Prince 5(4) over the stacked (2, N, 3) state."""
+    edges, g_seg, T_seg, B = fields
+    y = np.stack((x, v))
+    k = np.empty((7,) + y.shape)
+    y_new, err = np.empty_like(y), np.empty_like(y)
+
+    def rhs(state, out):
+        out[0] = state[1]
+        np.matmul(state[0], Tt, out=out[1])
+        out[1] += g
+        out[1] += state[1] @ B
+
+    t, steps, rejected = 0.0, 0, 0
+    sample = 1
+    for s in range(len(g_seg)):
+        g, Tt = g_seg[s], T_seg[s].T
+        rhs(y, k[0])
+        t_end = edges[s + 1]
+        while t < t_end:
+            # Land exactly on the next sample, or else the field boundary
+            t_sample = sample * save_interval
+            at_sample = t_sample <= t_end * (1 + 1e-12)
+            t_stop = t_sample if at_sample else t_end
+            last = t + h >= t_stop * (1 - 1e-12)
+            step = t_stop - t if last else h
+
+            for j in range(1, 7):
+                y_new[...] = y
+                for i, a in enumerate(_DP_A[j]):
+                    if a:
+                        y_new += (step * a) * k[i]
+                rhs(y_new, k[j])
+            np.einsum('j,j...->...', step * _DP_E, k, out=err)
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+            norm = np.sqrt(np.mean((err / scale) ** 2))
+
+            factor = 5.0 if norm == 0 else 0.9 * norm ** -0.2
+            h_next = step * min(5.0, max(0.2, factor))
+            if norm <= 1.0:
+                t = t_stop if last else t + step
+                y[...] = y_new
+                k[0] = k[6]                       # first same as last
+                steps += 1
+                if last and at_sample:
+                    xs[sample], vs[sample] = y[0], y[1]
+                    sample += 1
+                # A step cut short to land on t_stop says little about h
+                h = max(h, h_next) if last else h_next
+            else:
+                rejected += 1
+                h = h_next
+            if h < 1e-12 * t_end:
+                raise RuntimeError(f"step size underflow at t = {t:g} s")
+    x[...], v[...] = y
+    return steps, rejected
@@ -0,0 +1,367 @@
+"""
+Gravity fields between samples, interpolated from coarse knots.
+
+Integrators and real-time correctors need the field of a :class:`LabFrame`
+at arbitrary instants, and :meth:`LabFrame.field` re-runs both
+ephemerides at every call.  :class:`FieldInterpolator` evaluates the
+direct model only at knots, on a fixed grid of segments aligned to the
+Unix epoch, and serves any instant by polynomial evaluation:
+
+``'hermite'``
+    Piecewise cubic Hermite: values and central-difference slopes at the
+    segment ends (default 10-minute segments).
+``'chebyshev'``
+    Chebyshev interpolation of *degree* at the Chebyshev nodes of each
+    segment (default 6-hour segments).
+
+Every segment is certified when it is built: the direct model is
+evaluated, in the same vectorized call as the knots, where the
+interpolation remainder peaks -- the segment midpoint for Hermite, the
+segment ends for Chebyshev -- and a segment whose error exceeds *tol*
+is rejected.  Built segments are kept in a least-recently-used cache
+holding at most *max_segments*, so a long-running corrector stays in
+bounded memory.
+
+Usage::
+
+    lab = LabFrame(48.14, 11.58, 500.0)
+    interp = FieldInterpolator(lab)
+    f = interp.field(datetime(2025, 3, 20, 12, 0, 0, 250_000))
+    interp.max_error                  # (acceleration, tensor) bounds so far
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import numpy as np
+
+from ._core import (GravityField, GravityFieldSeries, _datetime_to_ns,
+                    _lab_columns, _time_grid)
+
+__all__ = ["FieldInterpolator", "FieldResidual", "CacheInfo"]
+
+METHODS = ('hermite', 'chebyshev')
+
+_NS = 1_000_000_000
+_DEFAULT_INTERVAL = {'hermite': 600.0, 'chebyshev': 6 * 3600.0}
+_SLOPE_STEP_NS = 4 * _NS        # central-difference half-width for slopes
+
+# Column layout of the interpolated channels
+_G, _MOON, _SUN, _T = slice(0, 3), slice(3, 6), slice(6, 9), slice(9, 18)
+_ACC = slice(0, 9)
+
+
+@dataclass(frozen=True)
+class FieldResidual:
+    """Interpolated minus direct field over a window."""
+    g_rms: float               # [m/s²]
+    g_max: float               # largest gravity-vector error [m/s²]
+    T_max: float               # largest gradient-tensor error [s⁻²]
+    samples: int
+
+
+@dataclass(frozen=True)
+class CacheInfo:
+    """Segment cache statistics of a :class:`FieldInterpolator`."""
+    hits: int                  # segment lookups served from the cache
+    misses: int                # segments built
+    evictions: int             # segments dropped to respect max_segments
+    segments: int              # segments currently held
+    max_segments: int
+
+
+class FieldInterpolator:
+    """Gravity field of a :class:`LabFrame` interpolated between knots.
+
+    Parameters
+    ----------
+    lab : LabFrame
+        Lab frame whose field is interpolated.
+    knot_interval : float, optional
+        Segment length in seconds (default 600 for ``'hermite'``, 21600
+        for ``'chebyshev'``).
+    method : {'hermite', 'chebyshev'}, optional
+        Interpolation scheme (default ``'hermite'``).
+    degree : int, optional
+        Polynomial degree for ``'chebyshev'`` (default 8).
+    order : int, optional
+        Expansion order, as for :meth:`LabFrame.field` (default 1).
+    tol : float or None, optional
+        Largest allowed error of the acceleration vectors (g and the lunar
+        and solar tides) at the check points of each segment [m/s^2]
+        (default 1e-12, i.e. 0.1 nGal).  None disables the check.
+    max_segments : int, optional
+        Most segments kept in the cache (default 4096).
+    ephemeris : object, optional
+        Ephemeris backend for the knots, as for :meth:`LabFrame.timeseries`.
+
+    Attributes
+    ----------
+    max_error : tuple of float
+        (acceleration [m/s^2], tensor [s^-2]) largest error found at the
+        check points of every segment built so far.
+
+    Raises
+    ------
+    ValueError
+        From the evaluation methods, when a segment misses *tol*; use a
+        shorter *knot_interval* or a higher *degree*.
+    """
+
+    def __init__(self, lab, knot_interval=None, method='hermite', degree=8,
+                 order=1, tol=1e-12, max_segments=4096, ephemeris=None):
+        if method not in METHODS:
+            raise ValueError(f"unknown method {method!r}; "
+                             f"expected one of {METHODS}")
+        if knot_interval is None:
+            knot_interval = _DEFAULT_INTERVAL[method]
+        step_ns = int(round(knot_interval * 1e9))
+        if step_ns <= 0:
+            raise ValueError("knot_interval must be > 0")
+        if method == 'chebyshev' and degree < 1:
+            raise ValueError("degree must be >= 1")
+        if max_segments < 1:
+            raise ValueError("max_segments must be >= 1")
+
+        self.lab = lab
+        self.method = method
+        self.knot_interval = step_ns / 1e9
+        self.degree = 3 if method == 'hermite' else degree
+        self.order = order
+        self.tol = tol
+        self.max_segments = max_segments
+        self.ephemeris = ephemeris
+        self.max_error = (0.0, 0.0)
+
+        self._step_ns = step_ns
+        self._segments = OrderedDict()       # index -> (degree+1, C) coeffs
+        self._hits = self._misses = self._evictions = 0
+        if method == 'chebyshev':
+            # Nodes on [0, 1] and the matrix taking node values to
+            # Chebyshev coefficients (discrete cosine transform)
+            n = degree + 1
+            theta = np.pi * (np.arange(n) + 0.5) / n
+            self._nodes = (1.0 + np.cos(theta)) / 2
+            self._dct = 2.0 / n * np.cos(np.outer(np.arange(n), theta))
+            self._dct[0] /= 2
+
+    # -- public API -----------------------------------------------------------
+
+    def field(self, dt, readonly=False):
+        """Interpolated gravity field at a given time.
+
+        Parameters
+        ----------
+        dt : datetime
+            UTC date and time.
+        readonly : bool, optional
+            Make the arrays of the field read-only (default False).
+
+        Returns
+        -------
+        GravityField
+        """
+        ns = _datetime_to_ns(dt)
+        key, offset = divmod(ns, self._step_ns)
+        coeffs = self._segments.get(key)
+        if coeffs is None:
+            cols = self._columns(np.array([ns]))[0]
+        else:
+            # Cached segment: skip the run bookkeeping of _columns
+            self._hits += 1
+            self._segments.move_to_end(key)
+            cols = self._basis(np.array([offset / self._step_ns]))[0] @ coeffs
+        if readonly:
+            cols.flags.writeable = False
+        T = cols[_T].reshape(3, 3) if self.order >= 1 else self.lab._T_earth
+        return GravityField._view(cols[_G], self.lab._omega, T,
+                                  self.lab._g_normal, cols[_MOON], cols[_SUN])
+
+    def timeseries(self, start, end, interval_minutes=10.0, n_samples=None):
+        """Interpolated counterpart of :meth:`LabFrame.timeseries`.
+
+        Parameters
+        ----------
+        start, end : datetime
+            Window bounds (UTC).
+        interval_minutes : float, optional
+            Time step in minutes (default 10).  Ignored if *n_samples* is set.
+        n_samples : int, optional
+            Number of evenly spaced samples (inclusive).
+
+        Returns
+        -------
+        GravityFieldSeries
+        """
+        times, ns = _time_grid(start, end, interval_minutes, n_samples)
+        g, T, a_moon, a_sun = self._fields(ns)
+        return GravityFieldSeries(times=times, g=g, T=T, g_tidal_moon=a_moon,
+                                  g_tidal_sun=a_sun,
+                                  omega=self.lab._omega.copy(),
+                                  g_normal=self.lab._g_normal)
+
+    def validate(self, start, end, interval_minutes=1.0):
+        """:class:`FieldResidual` against the direct model on a window."""
+        _, ns = _time_grid(start, end, interval_minutes)
+        g, T, _, _ = self._fields(ns)
+        g_ref, T_ref, _, _ = _lab_columns(ns, self.lab, self.order,
+                                          self.ephemeris)
+        err = np.abs(g - g_ref).max(axis=1)
+        return FieldResidual(g_rms=float(np.sqrt(np.mean(err ** 2))),
+                             g_max=float(err.max()),
+                             T_max=float(np.abs(T - T_ref).max()),
+                             samples=len(ns))
+
+    def cache_info(self):
+        """Current :class:`CacheInfo`."""
+        return CacheInfo(hits=self._hits, misses=self._misses,
+                         evictions=self._evictions,
+                         segments=len(self._segments),
+                         max_segments=self.max_segments)
+
+    def clear(self):
+        """Drop every cached segment (statistics are kept)."""
+        self._segments.clear()
+
+    # -- internals ------------------------------------------------------------
+
+    def _fields(self, ns):
+        """(g, T, g_tidal_moon, g_tidal_sun) at epochs *ns*, as
+        :func:`_lab_columns` returns them."""
+        cols = self._columns(ns)
+        if self.order >= 1:
+            T = cols[:, _T].reshape(-1, 3, 3)
+        else:
+            T = np.broadcast_to(self.lab._T_earth, (len(ns), 3, 3))
+        return cols[:, _G], T, cols[:, _MOON], cols[:, _SUN]
+
+    def _direct(self, ns):
+        """Channels of the direct model at epochs *ns*: (N, C)."""
+        g, T, a_moon, a_sun = _lab_columns(ns, self.lab, self.order,
+                                           self.ephemeris)
+        parts = [g, a_moon, a_sun]
+        if self.order >= 1:
+            parts.append(T.reshape(-1, 9))
+        return np.concatenate(parts, axis=1)
+
+    def _columns(self, ns):
+        """Interpolated channels at int64 epochs *ns*: (N, C)."""
+        index = ns // self._step_ns
+        s = (ns - index * self._step_ns) / self._step_ns
+        order = None
+        if np.any(index[1:] < index[:-1]):
+            order = np.argsort(index, kind='stable')
+            index, s = index[order], s[order]
+        bounds = np.concatenate(
+            ([0], np.flatnonzero(index[1:] != index[:-1]) + 1, [len(index)]))
+        keys = index[bounds[:-1]].tolist()
+
+        segments = self._segments
+        missing = [k for k in keys if k not in segments]
+        self._hits += len(keys) - len(missing)
+        if missing:
+            self._build(np.array(missing, dtype=np.int64))
+        table = []
+        for k in keys:
+            segments.move_to_end(k)
+            table.append(segments[k])
+        # Evict only now, so a query spanning more than max_segments works
+        while len(segments) > self.max_segments:
+            segments.popitem(last=False)
+            self._evictions += 1
+
+        out = self._evaluate(table, bounds, s)
+        if order is None:
+            return out
+        unsorted = np.empty_like(out)
+        unsorted[order] = out
+        return unsorted
+
+    def _basis(self, s):
+        """(N, degree+1) polynomial basis at segment fractions *s*."""
+        basis = np.empty((len(s), self.degree + 1))
+        basis[:, 0] = 1.0
+        if self.method == 'hermite':
+            # Powers of the segment fraction
+            for k in range(1, 4):
+                np.multiply(basis[:, k - 1], s, out=basis[:, k])
+        else:
+            # Chebyshev polynomials of x = 2s - 1
+            x = 2.0 * s - 1.0
+            basis[:, 1] = x
+            for k in range(2, self.degree + 1):
+                basis[:, k] = 2.0 * x * basis[:, k - 1] - basis[:, k - 2]
+        return basis
+
+    def _evaluate(self, table, bounds, s):
+        """Piecewise polynomials at *s* in [0, 1]: (N, C).
+
+        Points ``bounds[j]:bounds[j+1]`` lie in the segment with
+        coefficients ``table[j]`` (degree+1, C); each run is one
+        (m, degree+1) @ (degree+1, C) product.
+        """
+        basis = self._basis(s)
+        out = np.empty((len(s), table[0].shape[1]))
+        for j, c in enumerate(table):
+            run = slice(bounds[j], bounds[j + 1])
+            np.matmul(basis[run], c, out=out[run])
+        return out
+
+    def _build(self, keys):
+        """Fit and certify segments *keys*, then add them to the cache.
+
+        Knots and check points of all segments go through one direct-model
+        call.  Check points sit where the remainder term peaks: the
+        midpoint for Hermite, the ends for Chebyshev.
+        """
+        step = self._step_ns
+        start = keys * step
+        one_each = np.arange(len(keys) + 1)     # one point per segment
+        if self.method == 'hermite':
+            knots = np.union1d(start, start + step)
+            ns = np.concatenate([
+                (knots[:, None] + [-_SLOPE_STEP_NS, 0, _SLOPE_STEP_NS]).ravel(),
+                start + step // 2])
+            direct = self._direct(ns)
+            n = len(knots)
+            at = direct[:3 * n].reshape(n, 3, -1)
+            f = at[:, 1]
+            d = (at[:, 2] - at[:, 0]) * (step / (2 * _SLOPE_STEP_NS))
+            i0 = np.searchsorted(knots, start)
+            f0, f1, d0, d1 = f[i0], f[i0 + 1], d[i0], d[i0 + 1]
+            coeffs = np.stack([f0, d0, 3 * (f1 - f0) - 2 * d0 - d1,
+                               2 * (f0 - f1) + d0 + d1], axis=1)
+            check = direct[3 * n:]
+            err = np.abs(self._evaluate(coeffs, one_each, np.full(
+                len(keys), (step // 2) / step)) - check)
+        else:
+            n = self.degree + 1
+            edges = np.union1d(start, start + step)
+            offsets = np.rint(self._nodes * step).astype(np.int64)
+            ns = np.concatenate([(start[:, None] + offsets).ravel(), edges])
+            direct = self._direct(ns)
+            values = direct[:len(keys) * n].reshape(len(keys), n, -1)
+            coeffs = np.einsum('kj,sjc->skc', self._dct, values)
+            i0 = np.searchsorted(edges, start)
+            check = direct[len(keys) * n:]
+            err = np.maximum(
+                np.abs(self._evaluate(coeffs, one_each, np.zeros(len(keys)))
+                       - check[i0]),
+                np.abs(self._evaluate(coeffs, one_each, np.ones(len(keys)))
+                       - check[i0 + 1]))
+
+        acc = float(err[:, _ACC].max())
+        tensor = float(err[:, _T].max()) if self.order >= 1 else 0.0
+        if self.tol is not None and acc > self.tol:
+            worst = int(keys[np.argmax(err[:, _ACC].max(axis=1))])
+            epoch = np.datetime64(worst * step, 'ns')
+            raise ValueError(
+                f"interpolation error {acc:.3g} m/s^2 exceeds tol={self.tol}"
+                f" in the segment starting {epoch}; use a shorter "
+                "knot_interval" + (" or a higher degree"
+                                   if self.method == 'chebyshev' else ""))
+        self.max_error = (max(self.max_error[0], acc),
+                          max(self.max_error[1], tensor))
+        self._misses += len(keys)
+        for k, c in zip(keys.tolist(), coeffs):
+            self._segments[k] = c
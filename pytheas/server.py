@@ -0,0 +1,318 @@
+"""
+Local prediction server with request coalescing.
+
+A long-lived process answers :func:`pytheas.compute_g`-style requests over
+localhost TCP or a Unix socket, so callers skip interpreter start-up and
+NumPy import.  The protocol is JSON lines: one request object per line,
+answered by one response object per line in the same order on each
+connection.
+
+Request::
+
+    {"id": 7, "t_ns": 1742472000000000000, "lat": 48.14, "lon": 11.58,
+     "alt": 500.0, "zenith": 0.0, "azimuth": 0.0}
+
+``t_ns`` is int64 UTC nanoseconds since 1970; ``"time": "2025-03-20T12:00"``
+(ISO 8601, naive = UTC) is accepted instead.  ``id``, ``alt``, ``zenith``
+and ``azimuth`` are optional.
+
+Response -- the :class:`~pytheas.GravityResult` fields plus the echoed id::
+
+    {"id": 7, "g_total": 9.80..., "g_static": ..., "g_normal": ...,
+     "cos_zenith": ..., "g_tidal": ..., "g_tidal_moon": ...,
+     "g_tidal_sun": ...}
+
+or ``{"id": 7, "error": "..."}`` for a bad request.
+
+Requests arriving from all connections within *batch_window* seconds are
+coalesced: all sites go through the vectorized building blocks in one
+batch, and the ephemerides are evaluated once per distinct epoch.  Epochs
+are first snapped to a grid of *epoch_tolerance* seconds (default 1 ms),
+so requests stamped a few microseconds apart share one evaluation; the
+tide moves by at most ~0.03 nGal per millisecond.  Set it to 0 to merge
+only identical epochs.
+
+Run with ``pytheas serve`` or :func:`serve`; see :mod:`pytheas.client`.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+
+import numpy as np
+
+from ._core import (
+    DELTA_GRAV, GM_MOON, GM_SUN,
+    _datetime_to_ns, _ephemerides_ecef, _ns_to_jd_split,
+    _tidal_acceleration_kernel,
+    enu_basis, geodetic_to_ecef, measurement_axis, normal_gravity,
+)
+
+__all__ = ["PredictionServer", "serve"]
+
+DEFAULT_PORT = 8765
+_FIELDS = ('g_total', 'g_static', 'g_normal', 'cos_zenith',
+           'g_tidal', 'g_tidal_moon', 'g_tidal_sun')
+_INT64 = np.iinfo(np.int64)
+
+
+def _parse(line):
+    """Decode one request line to (id, ns, lat, lon, alt, zenith, azimuth)."""
+    req = json.loads(line)
+    if not isinstance(req, dict):
+        raise ValueError("request must be a JSON object")
+    rid = req.get('id')
+    try:
+        if 't_ns' in req:
+            ns = int(req['t_ns'])
+        elif 'time' in req:
+            ns = _datetime_to_ns(datetime.fromisoformat(req['time']))
+        else:
+            raise ValueError("request needs 't_ns' or 'time'")
+        if not _INT64.min <= ns <= _INT64.max:
+            raise ValueError("t_ns out of int64 range")
+        site = (float(req['lat']), float(req['lon']),
+                float(req.get('alt', 0.0)), float(req.get('zenith', 0.0)),
+                float(req.get('azimuth', 0.0)))
+        if not np.all(np.isfinite(site)):
+            raise ValueError("lat, lon, alt, zenith and azimuth must be "
+                             "finite")
+    except KeyError as e:
+        raise _RequestError(rid, f"missing field {e.args[0]!r}") from None
+    except (TypeError, ValueError, OverflowError) as e:
+        raise _RequestError(rid, str(e)) from None
+    return (rid, ns) + site
+
+
+class _RequestError(ValueError):
+    def __init__(self, rid, message):
+        super().__init__(message)
+        self.id = rid
+
+
+def _evaluate(requests, ephemeris=None, snap_ns=0):
+    """Evaluate parsed requests as one vectorized batch.
+
+    Parameters
+    ----------
+    requests : sequence of tuple
+        (id, ns, lat, lon, alt, zenith, azimuth) as from the protocol.
+    ephemeris : object, optional
+        Ephemeris backend, as for :func:`pytheas.compute_timeseries`.
+    snap_ns : int, optional
+        Round epochs to the nearest multiple of this many nanoseconds
+        before merging them (default 0: merge identical epochs only).
+
+    Returns
+    -------
+    responses : list of dict
+        Response objects in request order.
+    n_epochs : int
+        Distinct epochs the ephemerides were evaluated at.
+    """
+    ids = [r[0] for r in requests]
+    ns = np.array([r[1] for r in requests], dtype=np.int64)
+    lat, lon, alt, zen, azi = np.array([r[2:] for r in requests],
+                                       dtype=float).T
+
+    # Ephemerides once per distinct (snapped) epoch
+    if snap_ns > 1:
+        ns = (ns + snap_ns // 2) // snap_ns * snap_ns
+    epochs, inverse = np.unique(ns, return_inverse=True)
+    R_moon, R_sun = _ephemerides_ecef(*_ns_to_jd_split(epochs), ephemeris)
+
+    g0 = normal_gravity(lat, alt)
+    n_hat = measurement_axis(lat, lon, zen, azi)
+    cos_z = np.einsum('nk,nk->n', enu_basis(lat, lon)[2], n_hat)
+    r = geodetic_to_ecef(lat, lon, alt)
+    am = _tidal_acceleration_kernel(r, R_moon[inverse], DELTA_GRAV * GM_MOON)
+    asn = _tidal_acceleration_kernel(r, R_sun[inverse], DELTA_GRAV * GM_SUN)
+    gm = np.einsum('nk,nk->n', am, n_hat)
+    gs = np.einsum('nk,nk->n', asn, n_hat)
+    gt = gm + gs
+    g_static = g0 * cos_z
+
+    rows = np.column_stack((g_static + gt, g_static, g0, cos_z,
+                            gt, gm, gs)).tolist()
+    return [{'id': rid, **dict(zip(_FIELDS, row))}
+            for rid, row in zip(ids, rows)], len(epochs)
+
+
+def _evaluate_isolated(requests, ephemeris=None, snap_ns=0):
+    """Like :func:`_evaluate`, but a failure stays with its own request.
+
+    The batch is evaluated at once; if that raises, each request is
+    evaluated alone so only the offending ones get an error response.
+    """
+    try:
+        return _evaluate(requests, ephemeris, snap_ns)
+    except Exception:
+        pass
+    responses, n_epochs = [], 0
+    for req in requests:
+        try:
+            (response,), n = _evaluate([req], ephemeris, snap_ns)
+        except Exception as e:   # keep serving; report to this caller
+            response, n = {'id': req[0], 'error': str(e)}, 0
+        responses.append(response)
+        n_epochs += n
+    return responses, n_epochs
+
+
+class PredictionServer:
+    """Asyncio JSON-lines server coalescing requests into batches.
+
+    Parameters
+    ----------
+    host : str, optional
+        Interface for TCP (default ``127.0.0.1``).
+    port : int, optional
+        TCP port (default 8765; 0 picks a free one).
+    path : str, optional
+        Unix socket path; when given, TCP is not used.
+    batch_window : float, optional
+        Seconds to wait for more requests after the first one of a batch
+        (default 0.002).
+    max_batch : int, optional
+        Largest batch evaluated at once (default 4096).
+    ephemeris : object, optional
+        Ephemeris backend for every batch.
+    epoch_tolerance : float, optional
+        Seconds: epochs of a batch are snapped to this grid before the
+        ephemerides are shared (default 0.001; 0 merges identical epochs
+        only).
+
+    Attributes
+    ----------
+    address : tuple or str
+        Bound (host, port) or socket path, once started.
+    requests, batches, epochs : int
+        Counters of answered requests, evaluated batches and distinct
+        ephemeris epochs.
+    """
+
+    def __init__(self, host='127.0.0.1', port=DEFAULT_PORT, path=None,
+                 batch_window=0.002, max_batch=4096, ephemeris=None,
+                 epoch_tolerance=0.001):
+        if epoch_tolerance < 0:
+            raise ValueError("epoch_tolerance must be >= 0")
+        self.host = host
+        self.port = port
+        self.path = path
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.ephemeris = ephemeris
+        self.epoch_tolerance = epoch_tolerance
+        self.address = None
+        self.requests = 0
+        self.batches = 0
+        self.epochs = 0
+        self._server = None
+        self._queue = None
+        self._batcher = None
+
+    async def start(self):
+        """Bind the socket and start the batching task."""
+        self._queue = asyncio.Queue()
+        self._batcher = asyncio.ensure_future(self._batch_loop())
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(
+                self._handle, path=self.path)
+            self.address = self.path
+        else:
+            self._server = await asyncio.start_server(
+                self._handle, self.host, self.port)
+            self.address = self._server.sockets[0].getsockname()[:2]
+        return self.address
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def close(self):
+        """Stop accepting connections and cancel the batching task."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+
+    async def _handle(self, reader, writer):
+        loop = asyncio.get_running_loop()
+        pending = asyncio.Queue()
+        sender = asyncio.ensure_future(self._send(pending, writer))
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                future = loop.create_future()
+                try:
+                    self._queue.put_nowait((_parse(line), future))
+                except _RequestError as e:
+                    future.set_result({'id': e.id, 'error': str(e)})
+                except ValueError as e:
+                    future.set_result({'id': None, 'error': str(e)})
+                pending.put_nowait(future)
+        finally:
+            pending.put_nowait(None)
+            await sender
+            writer.close()
+
+    async def _send(self, pending, writer):
+        """Write responses in request order as their batches complete."""
+        while True:
+            future = await pending.get()
+            if future is None:
+                break
+            writer.write(json.dumps(await future).encode() + b'\n')
+            if pending.empty():
+                await writer.drain()
+
+    async def _batch_loop(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(),
+                                                        timeout))
+                except asyncio.TimeoutError:
+                    break
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            requests = [req for req, _ in batch]
+            results, n_epochs = await loop.run_in_executor(
+                None, _evaluate_isolated, requests, self.ephemeris,
+                int(round(self.epoch_tolerance * 1e9)))
+            for (_, future), result in zip(batch, results):
+                if not future.cancelled():
+                    future.set_result(result)
+            self.requests += len(batch)
+            self.batches += 1
+            self.epochs += n_epochs
+
+
+def serve(host='127.0.0.1', port=DEFAULT_PORT, path=None, batch_window=0.002,
+          max_batch=4096, ephemeris=None, epoch_tolerance=0.001):
+    """Run a :class:`PredictionServer` until interrupted."""
+    server = PredictionServer(host, port, path, batch_window, max_batch,
+                              ephemeris, epoch_tolerance)
+
+    async def run():
+        print(f"pytheas serve: listening on {await server.start()}",
+              flush=True)
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,57 @@
+"""Tests for the benchmark runner in benchmarks/bench.py."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+BENCH = Path(__file__).resolve().parents[1] / "benchmarks" / "bench.py"
+
+
+@pytest.fixture(scope="module")
+def bench():
+    spec = importlib.util.spec_from_file_location("bench", BENCH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class TestBench:
+    def test_covers_entry_points(self, bench):
+        names = " ".join(bench.CASES)
+        for entry in ("compute_g", "compute_timeseries", "labframe_field",
+                      "labframe_timeseries_order0",
+                      "labframe_timeseries_order1", "moon_position_ecef",
+                      "sun_position_ecef", "cli"):
+            assert entry in names
+
+    def test_compare_flags_slowdowns(self, bench):
+        base = {"a": {"median_s": 1.0}, "b": {"median_s": 1.0},
+                "c": {"median_s": 1.0}}
+        results = {"a": {"median_s": 1.3}, "b": {"median_s": 0.7},
+                   "c": {"median_s": 1.1}, "d": {"median_s": 1.0}}
+        status = {row[0]: row[4]
+                  for row in bench.compare(results, base, 0.25)}
+        assert status == {"a": "REGRESSION", "b": "faster", "c": "ok",
+                          "d": "new"}
+
+    def test_run_writes_json_and_checks(self, bench, tmp_path):
+        out = tmp_path / "results.json"
+        baseline = tmp_path / "baseline.json"
+        args = ["-k", "sun_position_ecef", "--repeat", "2",
+                "--min-time", "0.001", "--baseline", str(baseline)]
+        assert bench.main(args + ["--save-baseline"]) == 0
+        saved = json.loads(baseline.read_text())
+        assert set(saved["results"]) == {"sun_position_ecef",
+                                          "sun_position_ecef_array"}
+        assert saved["metadata"]["numpy"]
+
+        # A baseline 100x faster than reality must be flagged
+        for res in saved["results"].values():
+            res["median_s"] /= 100
+        baseline.write_text(json.dumps(saved))
+        assert bench.main(args + ["-o", str(out), "--check"]) == 1
+        doc = json.loads(out.read_text())
+        assert doc["regressions"] == ["sun_position_ecef",
+                                      "sun_position_ecef_array"]
@@ -0,0 +1,217 @@
+"""Tests for the pytheas command line (python -m pytheas)."""
+
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from pytheas import compute_network_timeseries, compute_timeseries
+from pytheas.__main__ import main
+from pytheas._core import _network_columns
+from pytheas._output import FIELDS, record_dtype
+
+SITE = ["--lat", "48.14", "--lon", "11.58", "--alt", "500"]
+START = datetime(2025, 3, 20)
+
+
+@pytest.fixture(scope="module")
+def reference():
+    return compute_timeseries(START, datetime(2025, 3, 23), 48.14, 11.58,
+                              500.0, interval_minutes=7)
+
+
+def run(tmp_path, name, *extra):
+    path = tmp_path / name
+    main(SITE + ["--start", "2025-03-20", "--hours", "72", "--interval", "7",
+                 "-o", str(path)] + list(extra))
+    return path
+
+
+class TestOutputFormats:
+    def test_npy(self, tmp_path, reference):
+        data = np.load(run(tmp_path, "out.npy"))
+        assert data.dtype == record_dtype()
+        assert len(data) == len(reference.times)
+        np.testing.assert_array_equal(
+            data['t_ns'],
+            np.array(reference.times, dtype='datetime64[ns]').view(np.int64))
+        for name in FIELDS:
+            np.testing.assert_array_equal(data[name],
+                                          getattr(reference, name))
+
+    def test_npz_columns(self, tmp_path, reference):
+        with np.load(run(tmp_path, "out.npz")) as z:
+            assert set(z.files) == {'t_ns'} | set(FIELDS)
+            assert z['t_ns'].dtype == np.int64
+            np.testing.assert_array_equal(z['g_tidal'], reference.g_tidal)
+
+    def test_raw_matches_npy(self, tmp_path):
+        raw = np.fromfile(run(tmp_path, "out.bin", "--format", "raw"),
+                          dtype=record_dtype())
+        np.testing.assert_array_equal(raw, np.load(run(tmp_path, "out.npy")))
+
+    def test_csv_text(self, tmp_path, reference):
+        lines = run(tmp_path, "out.csv").read_text().splitlines()
+        assert lines[0].startswith("time_utc,time_local_UTC+1,g_total_m_s2")
+        assert len(lines) == len(reference.times) + 1
+        t = reference.times[3]
+        assert lines[4] == (
+            f"{t.isoformat()},{t.replace(hour=t.hour + 1).isoformat()},"
+            + ",".join(f"{getattr(reference, name)[3]:.12e}"
+                       for name in FIELDS))
+
+    def test_streams_in_chunks(self, tmp_path, monkeypatch, capsys,
+                               reference):
+        """Several chunks concatenate to the one-shot series."""
+        import pytheas._core as core
+        monkeypatch.setattr(
+            "pytheas.__main__.iter_timeseries",
+            lambda *a: core.iter_timeseries(*a, chunk_size=100))
+        data = np.load(run(tmp_path, "out.npy"))
+        np.testing.assert_array_equal(data['g_total'], reference.g_total)
+        out = capsys.readouterr().out
+        assert f"{np.std(reference.g_tidal) * 1e6:.4f} um/s^2" in out
+        assert reference.times[-1].strftime('%Y-%m-%d %H:%M') in out
+
+    def test_csv_time_unit_fixed_per_file(self, tmp_path, monkeypatch):
+        """Chunks of whole seconds keep the microseconds of the grid."""
+        import pytheas._core as core
+        monkeypatch.setattr(
+            "pytheas.__main__.iter_timeseries",
+            lambda *a: core.iter_timeseries(*a, chunk_size=1))
+        path = tmp_path / "out.csv"
+        main(SITE + ["--start", "2025-03-20", "--hours", "0.001",
+                     "--interval", "0.01", "-o", str(path)])
+        times = [line.split(",")[0]
+                 for line in path.read_text().splitlines()[1:]]
+        assert times[:3] == ["2025-03-20T00:00:00.000000",
+                             "2025-03-20T00:00:00.600000",
+                             "2025-03-20T00:00:01.200000"]
+        assert times[5] == "2025-03-20T00:00:03.000000"
+
+    def test_csv_option_kept(self, tmp_path, capsys):
+        path = tmp_path / "legacy.csv"
+        main(SITE + ["--start", "2025-03-20", "--hours", "1",
+                     "--csv", str(path)])
+        assert path.read_text().startswith("time_utc,")
+        assert "Saved:" in capsys.readouterr().out
+
+    def test_summary_matches_full_series(self, capsys, reference):
+        main(SITE + ["--start", "2025-03-20", "--hours", "72",
+                     "--interval", "7"])
+        out = capsys.readouterr().out
+        assert f"{np.ptp(reference.g_tidal) * 1e6:.4f} um/s^2" in out
+        assert f"{np.std(reference.g_tidal) * 1e6:.4f} um/s^2" in out
+        assert out.count(" ...\n") == 1
+
+
+STATIONS = """id,lat,lon,alt,zenith,azimuth
+MUC,48.14,11.58,500,0,0
+ULM,48.42,9.96,620,90,0
+CPT,-33.9,18.4,,,
+"""
+NETWORK = [(48.14, 11.58, 500.0), (48.42, 9.96, 620.0, 90.0, 0.0),
+           (-33.9, 18.4, 0.0)]
+
+
+@pytest.fixture
+def station_file(tmp_path):
+    path = tmp_path / "stations.csv"
+    path.write_text(STATIONS)
+    return path
+
+
+def run_network(station_file, output, *extra):
+    main(["--stations", str(station_file), "--start", "2025-03-20",
+          "--hours", "24", "-o", str(output)] + list(extra))
+
+
+class TestStations:
+    def test_combined_matches_network(self, tmp_path, station_file):
+        run_network(station_file, tmp_path / "net.npz")
+        with np.load(tmp_path / "net.npz") as z:
+            ref = compute_network_timeseries(
+                z['t_ns'].view('datetime64[ns]'), NETWORK)
+            assert list(z['station']) == ['MUC', 'ULM', 'CPT']
+            for name in FIELDS:
+                np.testing.assert_array_equal(z[name],
+                                              getattr(ref, name).T)
+
+    def test_per_station_files(self, tmp_path, station_file):
+        run_network(station_file, tmp_path / "{id}.npy")
+        muc = np.load(tmp_path / "MUC.npy")
+        single = np.load(run(tmp_path, "single.npy", "--hours", "24",
+                                 "--interval", "10"))
+        np.testing.assert_array_equal(muc['t_ns'], single['t_ns'])
+        # Network projection sums in a different order: ulp-level only
+        for name in FIELDS:
+            np.testing.assert_allclose(muc[name], single[name],
+                                       rtol=1e-15, atol=1e-21)
+        assert np.load(tmp_path / "ULM.npy")['g_static'][0] < 1e-15
+
+    def test_template_keeps_other_braces(self, tmp_path, station_file):
+        run_network(station_file, tmp_path / "{run}_{id}.npy", "--hours", "1")
+        assert sorted(p.name for p in tmp_path.glob("*.npy")) == [
+            "{run}_CPT.npy", "{run}_MUC.npy", "{run}_ULM.npy"]
+
+    def test_template_without_id_rejected(self, tmp_path, station_file,
+                                          capsys):
+        with pytest.raises(SystemExit):
+            run_network(station_file, tmp_path / "{station}.npy")
+        assert "{id}" in capsys.readouterr().err
+        assert not list(tmp_path.glob("*.npy"))
+
+    def test_jobs_and_chunks_identical(self, tmp_path, station_file,
+                                       monkeypatch):
+        monkeypatch.setattr("pytheas.__main__._CHUNK_SIZE", 8192)
+        extra = ["--interval", "0.05"]            # 28801 epochs, 4 chunks
+        # of the ephemeris, each cut into 8192 // 3 epoch tide slices
+        run_network(station_file, tmp_path / "a.npy", *extra)
+        run_network(station_file, tmp_path / "b.npy", "--jobs", "2", *extra)
+        a, b = np.load(tmp_path / "a.npy"), np.load(tmp_path / "b.npy")
+        np.testing.assert_array_equal(a, b)
+        ref = compute_network_timeseries(a['t_ns'].view('datetime64[ns]'),
+                                         NETWORK)
+        np.testing.assert_array_equal(a['g_tidal'], ref.g_tidal.T)
+
+    def test_chunk_elements_bounded(self, tmp_path, station_file,
+                                    monkeypatch):
+        monkeypatch.setattr("pytheas.__main__._CHUNK_SIZE", 8192)
+        shapes = []
+
+        def columns(r, n_hat, R_moon, R_sun):
+            shapes.append(len(r) * len(R_moon))
+            return _network_columns(r, n_hat, R_moon, R_sun)
+
+        monkeypatch.setattr("pytheas.__main__._network_columns", columns)
+        run_network(station_file, tmp_path / "a.npy", "--interval", "0.05")
+        assert max(shapes) <= 8192
+        assert sum(shapes) == 3 * 28801
+
+    def test_combined_csv_rows(self, tmp_path, station_file):
+        run_network(station_file, tmp_path / "net.csv", "--hours", "1")
+        lines = (tmp_path / "net.csv").read_text().splitlines()
+        assert lines[0].startswith("station,time_utc,time_local,")
+        assert len(lines) == 1 + 7 * 3
+        assert lines[2].startswith("ULM,2025-03-20T00:00:00,"
+                                   "2025-03-20T01:00:00,")
+        assert lines[3].startswith("CPT,2025-03-20T00:00:00,"
+                                   "2025-03-20T01:00:00,")
+
+    def test_axis_options_fill_missing_columns(self, tmp_path,
+                                               station_file):
+        """--alt/--zenith/--azimuth apply to rows that leave them out."""
+        run_network(station_file, tmp_path / "net.npz", "--hours", "1",
+                    "--alt", "10", "--zenith", "30", "--azimuth", "45")
+        with np.load(tmp_path / "net.npz") as z:
+            ref = compute_network_timeseries(
+                z['t_ns'].view('datetime64[ns]'),
+                NETWORK[:2] + [(-33.9, 18.4, 10.0, 30.0, 45.0)])
+            np.testing.assert_array_equal(z['g_tidal'], ref.g_tidal.T)
+
+    def test_bad_station_file(self, tmp_path, capsys):
+        path = tmp_path / "bad.csv"
+        path.write_text("id,lat\nA,10\n")
+        with pytest.raises(SystemExit):
+            main(["--stations", str(path)])
+        assert "bad station row" in capsys.readouterr().err
@@ -0,0 +1,143 @@
+"""Tests for pytheas.ephem -- Chebyshev ephemeris cache and tables."""
+
+import pickle
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from pytheas import (compute_timeseries, julian_date_split, LabFrame,
+                     moon_position_ecef, sun_position_ecef)
+from pytheas.__main__ import main
+from pytheas.ephem import ChebyshevEphemeris, get_ephemeris, set_ephemeris
+
+
+START = datetime(2025, 3, 20)
+END = datetime(2025, 3, 24)
+
+
+@pytest.fixture(scope="module")
+def eph():
+    return ChebyshevEphemeris(START, END, granule_hours=24.0, tol_m=1.0)
+
+
+class TestChebyshevEphemeris:
+    def test_fit_meets_tolerance(self, eph):
+        """Validation error on the fit grid is within tol_m."""
+        assert max(eph.max_error_m) <= eph.tol_m
+
+    def test_random_epochs_within_tolerance(self, eph):
+        """Error bound holds at arbitrary epochs, not just check nodes."""
+        rng = np.random.default_rng(3)
+        offsets = np.sort(rng.uniform(0, 4 * 86400e9, 500)).astype(np.int64)
+        epochs = np.datetime64(START, 'ns') + offsets.astype('timedelta64[ns]')
+        moon_err, sun_err = eph.validate(epochs)
+        assert moon_err < 2 * eph.tol_m
+        assert sun_err < 2 * eph.tol_m
+
+    def test_unsorted_epochs(self, eph):
+        """Unsorted queries give the same positions as sorted ones."""
+        epochs = np.datetime64(START, 'ns') + np.array(
+            [3, 1, 2, 0], dtype='timedelta64[D]')
+        moon, sun = eph.eci(*julian_date_split(epochs))
+        moon_s, sun_s = eph.eci(*julian_date_split(np.sort(epochs)))
+        np.testing.assert_allclose(moon[[3, 1, 2, 0]], moon_s, atol=1e-6)
+        np.testing.assert_allclose(sun[[3, 1, 2, 0]], sun_s, atol=1e-6)
+
+    def test_window_end_inclusive(self, eph):
+        """The window end itself is served."""
+        eph.validate([END])
+
+    def test_outside_window_raises(self, eph):
+        with pytest.raises(ValueError, match="outside the ephemeris window"):
+            eph.validate([END + timedelta(days=1)])
+
+    def test_unreachable_tolerance_raises(self):
+        with pytest.raises(ValueError, match="use shorter granules"):
+            ChebyshevEphemeris(START, END, granule_hours=240.0, tol_m=1e-3,
+                               max_degree=6)
+
+    def test_timeseries_sub_ngal(self, eph):
+        """compute_timeseries with the cache agrees with the direct series."""
+        kwargs = dict(zenith_deg=20.0, azimuth_deg=60.0, interval_minutes=7.0)
+        direct = compute_timeseries(START, END, 48.14, 11.58, 500.0, **kwargs)
+        cached = compute_timeseries(START, END, 48.14, 11.58, 500.0,
+                                    ephemeris=eph, **kwargs)
+        assert np.max(np.abs(direct.g_tidal - cached.g_tidal)) < 1e-11
+
+    def test_labframe_timeseries(self, eph):
+        """LabFrame.timeseries accepts the cache and stays sub-nGal."""
+        lab = LabFrame(48.14, 11.58, 500.0)
+        direct = lab.timeseries(START, END, interval_minutes=180.0)
+        cached = lab.timeseries(START, END, interval_minutes=180.0,
+                                ephemeris=eph)
+        np.testing.assert_allclose(cached.g, direct.g, rtol=0, atol=1e-11)
+        np.testing.assert_allclose(cached.T, direct.T, rtol=0, atol=1e-20)
+
+
+@pytest.fixture
+def table(eph, tmp_path):
+    path = tmp_path / "ephem.pyteph"
+    eph.save(path)
+    return path
+
+
+@pytest.fixture
+def configured():
+    yield
+    set_ephemeris(None)
+
+
+class TestEphemerisTable:
+    def test_round_trip(self, eph, table):
+        """A reopened table is memory-mapped and serves identical positions."""
+        loaded = ChebyshevEphemeris.open(table)
+        assert isinstance(loaded._coeffs, np.memmap)
+        assert loaded.degree == eph.degree
+        assert loaded.max_error_m == eph.max_error_m
+        day, frac = julian_date_split([START, START + timedelta(hours=37.5)])
+        for a, b in zip(loaded.eci(day, frac), eph.eci(day, frac)):
+            np.testing.assert_array_equal(a, b)
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "junk.bin"
+        path.write_bytes(b"not an ephemeris" * 16)
+        with pytest.raises(ValueError, match="not a pytheas ephemeris table"):
+            ChebyshevEphemeris.open(path)
+
+    def test_pickles_by_path(self, table):
+        """File-backed tables pickle as a path, not as the coefficients."""
+        loaded = ChebyshevEphemeris.open(table)
+        blob = pickle.dumps(loaded)
+        assert len(blob) < loaded._coeffs.nbytes
+        clone = pickle.loads(blob)
+        assert isinstance(clone._coeffs, np.memmap)
+        day, frac = julian_date_split([END])
+        np.testing.assert_array_equal(clone.eci(day, frac)[0],
+                                      loaded.eci(day, frac)[0])
+
+    def test_configured_table_is_consulted(self, table, configured):
+        """Position functions use the table inside its window only."""
+        inside = datetime(2025, 3, 21, 7, 30)
+        outside = datetime(2025, 6, 1)
+        direct_in = moon_position_ecef(inside)
+        direct_out = sun_position_ecef(outside)
+
+        eph = set_ephemeris(str(table))
+        assert get_ephemeris() is eph
+        tabled = moon_position_ecef(inside)
+        assert not np.array_equal(tabled, direct_in)
+        np.testing.assert_allclose(tabled, direct_in, rtol=0, atol=2.0)
+        np.testing.assert_array_equal(sun_position_ecef(outside), direct_out)
+
+        set_ephemeris(None)
+        np.testing.assert_array_equal(moon_position_ecef(inside), direct_in)
+
+    def test_cli_build(self, tmp_path, capsys):
+        path = tmp_path / "cli.pyteph"
+        main(["build", "--start", "2025-03-20", "--end", "2025-03-21",
+              "--granule-hours", "12", "-o", str(path)])
+        assert "Saved" in capsys.readouterr().out
+        loaded = ChebyshevEphemeris.open(path)
+        assert loaded.granule_hours == 12.0
+        assert max(loaded.max_error_m) <= 1.0
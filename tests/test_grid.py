@@ -0,0 +1,89 @@
+"""Tests for pytheas.grid -- tiled global grid mode."""
+
+import numpy as np
+import pytest
+from datetime import datetime
+
+from pytheas import compute_g
+from pytheas.grid import compute_grid, global_grid
+
+
+EPOCH = datetime(2025, 3, 20, 12)
+
+
+class TestGlobalGrid:
+    def test_shape_and_seam(self):
+        lat, lon = global_grid(0.5)
+        assert lat.shape == (361, 1)
+        assert lon.shape == (1, 720)
+        assert lat[0, 0] == -90.0 and lat[-1, 0] == 90.0
+        assert lon[0, 0] == -180.0 and lon[0, -1] == 179.5
+
+    def test_regional_bounds_inclusive(self):
+        lat, lon = global_grid(0.25, lat_range=(45, 50), lon_range=(5, 15))
+        assert lat.shape == (21, 1)
+        assert lon.shape == (1, 41)
+
+    def test_invalid_step_raises(self):
+        with pytest.raises(ValueError, match="step_deg must be > 0"):
+            global_grid(0.0)
+
+
+class TestComputeGrid:
+    def test_matches_compute_g(self):
+        """Grid nodes reproduce the scalar computation."""
+        lat, lon = global_grid(30.0)
+        maps = compute_grid(EPOCH, lat, lon, 250.0, zenith_deg=20.0,
+                            azimuth_deg=45.0)
+        assert maps.g_tidal.shape == (7, 12)
+        for i in range(lat.shape[0]):
+            for j in range(lon.shape[1]):
+                ref = compute_g(EPOCH, lat[i, 0], lon[0, j], 250.0, 20.0, 45.0)
+                assert abs(maps.g_tidal[i, j] - ref.g_tidal) < 1e-18
+                assert abs(maps.g_total[i, j] - ref.g_total) < 4e-15
+                assert maps.g_normal[i, j] == pytest.approx(ref.g_normal,
+                                                            rel=1e-15)
+
+    def test_tiles_are_seamless(self):
+        """The tile size does not change any value."""
+        lat, lon = global_grid(10.0)
+        full = compute_grid(EPOCH, lat, lon)
+        tiled = compute_grid(EPOCH, lat, lon, tile_size=37)
+        np.testing.assert_array_equal(tiled.g_total, full.g_total)
+        np.testing.assert_array_equal(tiled.g_static, full.g_static)
+
+    def test_epoch_array(self):
+        """An epoch array adds a leading time axis."""
+        epochs = np.array(['2025-03-20T00', '2025-03-20T06',
+                           '2025-03-20T12'], dtype='datetime64[ns]')
+        lat, lon = global_grid(45.0)
+        maps = compute_grid(epochs, lat, lon)
+        assert maps.g_tidal.shape == (3, 5, 8)
+        assert maps.g_static.shape == (5, 8)
+        single = compute_grid(EPOCH, lat, lon)
+        np.testing.assert_allclose(maps.g_tidal[2], single.g_tidal,
+                                   rtol=0, atol=1e-18)
+
+    def test_scattered_sites(self):
+        """Flat coordinate arrays work as well as meshes."""
+        maps = compute_grid(EPOCH, [48.14, -33.9], [11.58, 18.4], [500.0, 10.0])
+        assert maps.g_total.shape == (2,)
+        ref = compute_g(EPOCH, -33.9, 18.4, 10.0)
+        assert abs(maps.g_total[1] - ref.g_total) < 4e-15
+
+    def test_invalid_tile_size_raises(self):
+        with pytest.raises(ValueError, match="tile_size must be >= 1"):
+            compute_grid(EPOCH, 0.0, 0.0, tile_size=0)
+
+
+class TestVectorizedBuildingBlocks:
+    def test_shapes(self):
+        from pytheas import (enu_basis, geodetic_to_ecef, measurement_axis,
+                             normal_gravity)
+        lat, lon = global_grid(45.0)
+        assert normal_gravity(lat, 0.0).shape == (5, 1)
+        assert geodetic_to_ecef(lat, lon, 0.0).shape == (5, 8, 3)
+        assert all(v.shape == (5, 8, 3) for v in enu_basis(lat, lon))
+        assert measurement_axis(lat, lon, 30.0, lon).shape == (5, 8, 3)
+        np.testing.assert_array_equal(geodetic_to_ecef(lat, lon, 0.0)[2, 3],
+                                      geodetic_to_ecef(0.0, -45.0, 0.0))
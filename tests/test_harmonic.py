@@ -0,0 +1,106 @@
+"""Tests for pytheas.harmonic -- constituent fit and synthesis."""
+
+import numpy as np
+import pytest
+from datetime import datetime
+
+from pytheas import compute_timeseries
+from pytheas.harmonic import fit_harmonics
+
+
+SITE = (48.14, 11.58, 500.0)
+START, END = datetime(2020, 1, 1), datetime(2021, 1, 1)
+
+
+@pytest.fixture(scope="module")
+def model():
+    return fit_harmonics(*SITE, start=START, end=END)
+
+
+@pytest.fixture(scope="module")
+def nodal_model():
+    return fit_harmonics(*SITE, start=START, interval_minutes=180.0)
+
+
+class TestFit:
+    def test_major_constituents(self, model):
+        names = [c.name for c in model.constituents[:4]]
+        assert names == ['K1', 'M2', 'O1', 'S2']
+        m2 = next(c for c in model.constituents if c.name == 'M2')
+        assert m2.frequency == pytest.approx(1.9322736, abs=1e-6)
+        assert m2.amplitude_sun < 1e-3 * m2.amplitude_moon
+
+    def test_residual_small(self, model):
+        assert model.residual.samples == 8785
+        assert model.residual.rms < 7e-9
+        assert model.residual.max < 4e-8
+
+    def test_nodal_window_residual(self, nodal_model):
+        """The default 19-year window keeps every line, well under 1 uGal."""
+        assert len(nodal_model) == 201
+        assert nodal_model.residual.rms < 2e-9
+        assert nodal_model.residual.max < 1e-8
+        res = nodal_model.validate(datetime(2040, 1, 1), datetime(2041, 1, 1))
+        assert res.rms < 3e-9
+        assert res.max < 1.2e-8
+
+    def test_third_degree_lines(self, nodal_model):
+        lines = {c.doodson: c for c in nodal_model.constituents}
+        m1 = lines[(1, 0, 0, 0, 0, 0)]
+        assert m1.name == '155.555'
+        assert 1e-9 < m1.amplitude < lines[(1, 0, 0, 1, 0, 0)].amplitude
+        assert lines[(1, 5, 0, -2, 0, 0)].name == '1X5.355'
+
+    def test_truncation_increases_residual(self):
+        rms = [fit_harmonics(*SITE, start=START, end=END,
+                             n_constituents=n).residual.rms
+               for n in (4, 10, 30)]
+        assert rms[0] > rms[1] > rms[2]
+
+    def test_rayleigh_criterion(self, model):
+        f = np.sort([c.frequency for c in model.constituents])
+        assert np.all(np.diff(f) >= 1.0 / 366.0)
+        assert not any(c.name.endswith(('+N', '-N'))
+                       for c in model.constituents)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError, match="start"):
+            fit_harmonics(*SITE)
+        with pytest.raises(ValueError, match="n_constituents"):
+            fit_harmonics(*SITE, start=START, end=END, n_constituents=0)
+        with pytest.raises(ValueError, match="too short"):
+            fit_harmonics(*SITE, start=START, end=datetime(2020, 1, 1, 1))
+
+
+class TestSynthesis:
+    def test_timeseries_matches_direct(self, model):
+        t0, t1 = datetime(2020, 6, 1), datetime(2020, 6, 3)
+        ts = model.timeseries(t0, t1, interval_minutes=1)
+        ref = compute_timeseries(t0, t1, *SITE, interval_minutes=1)
+        assert ts.times == ref.times
+        np.testing.assert_allclose(ts.g_static, ref.g_static, rtol=1e-15)
+        np.testing.assert_allclose(ts.g_tidal, ref.g_tidal,
+                                   atol=model.residual.max)
+
+    def test_uniform_grid_matches_predict(self, model):
+        """The block-table synthesis equals direct cosine summation."""
+        ts = model.timeseries(datetime(2020, 3, 1), datetime(2020, 4, 1),
+                              interval_minutes=0.5)
+        g = model.predict(np.array(ts.times, dtype='datetime64[ns]'))
+        np.testing.assert_allclose(ts.g_tidal, g, rtol=0, atol=1e-17)
+
+    def test_n_samples_grid(self, model):
+        ts = model.timeseries(START, datetime(2020, 1, 2), n_samples=7)
+        assert len(ts.times) == 7
+        g = model.predict(np.array(ts.times, dtype='datetime64[ns]'))
+        np.testing.assert_allclose(ts.g_tidal, g, rtol=0, atol=1e-17)
+
+    def test_predict_scalar(self, model):
+        t = datetime(2020, 6, 1, 12)
+        ts = model.timeseries(t, t)
+        assert model.predict(t) == pytest.approx(ts.g_tidal[0], abs=1e-17)
+
+    def test_validate_outside_window(self, model):
+        res = model.validate(datetime(2021, 6, 1), datetime(2021, 7, 1))
+        assert res.samples == 721
+        assert res.rms < 5e-8
@@ -0,0 +1,157 @@
+"""Tests for pytheas.integrate -- lab-frame trajectory integration."""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from pytheas import GravityField, LabFrame
+from pytheas.integrate import integrate
+
+
+EPOCH = datetime(2025, 3, 20, 12)
+
+
+@pytest.fixture(scope="module")
+def lab():
+    return LabFrame(48.14, 11.58, 500.0)
+
+
+@pytest.fixture(scope="module")
+def field(lab):
+    return lab.field(EPOCH)
+
+
+def _reference(field, x, v, duration, h=2e-5):
+    """Classical RK4 on GravityField.eom with a small step."""
+    x, v = np.array(x, dtype=float), np.array(v, dtype=float)
+    def f(x, v):
+        return v, field.eom(x, v)
+
+    for _ in range(int(round(duration / h))):
+        k1x, k1v = f(x, v)
+        k2x, k2v = f(x + h / 2 * k1x, v + h / 2 * k1v)
+        k3x, k3v = f(x + h / 2 * k2x, v + h / 2 * k2v)
+        k4x, k4v = f(x + h * k3x, v + h * k3v)
+        x = x + h / 6 * (k1x + 2 * k2x + 2 * k3x + k4x)
+        v = v + h / 6 * (k1v + 2 * k2v + 2 * k3v + k4v)
+    return x, v
+
+
+class TestSchemes:
+    def test_uniform_field_is_exact(self):
+        """Without gradient or rotation: x = v0 t + g t² / 2 exactly."""
+        f = GravityField(g=[0.1, 0.0, -9.8], omega=np.zeros(3),
+                         T=np.zeros((3, 3)), g_normal=9.8,
+                         g_tidal_moon=np.zeros(3), g_tidal_sun=np.zeros(3))
+        v0 = np.array([1.0, 2.0, 3.0])
+        for method in ('verlet', 'rk45'):
+            tr = integrate(f, EPOCH, np.zeros(3), v0, 1.0, 0.01,
+                           method=method, save_interval=0.25)
+            t = tr.t[:, None]
+            np.testing.assert_allclose(tr.x, v0 * t + 0.5 * f.g * t ** 2,
+                                       rtol=1e-12, atol=1e-12)
+            np.testing.assert_allclose(tr.v, v0 + f.g * t, rtol=1e-12)
+
+    @pytest.mark.parametrize("method, tol", [('verlet', 1e-9),
+                                             ('rk45', 1e-12)])
+    def test_matches_eom_reference(self, field, method, tol):
+        """A 0.2 s drop with Coriolis and gradient matches a fine RK4 loop."""
+        x0, v0 = [0.0, 0.0, 0.1], [0.01, 0.0, 0.5]
+        tr = integrate(field, EPOCH, x0, v0, 0.2, 1e-4, method=method,
+                       save_interval=0.1)
+        x_ref, v_ref = _reference(field, x0, v0, 0.2)
+        assert tr.x.shape == (3, 3)
+        np.testing.assert_allclose(tr.x[-1], x_ref, rtol=0, atol=tol)
+        np.testing.assert_allclose(tr.v[-1], v_ref, rtol=0, atol=10 * tol)
+
+    def test_verlet_second_order(self, field):
+        x0, v0 = [0.0, 0.0, 0.0], [0.02, 0.0, 1.0]
+        x_ref, _ = _reference(field, x0, v0, 0.2)
+        err = [np.abs(integrate(field, EPOCH, x0, v0, 0.2, h).x[-1]
+                      - x_ref).max() for h in (2e-3, 1e-3)]
+        assert 3.5 < err[0] / err[1] < 4.5
+
+    def test_coriolis_deflection(self, field):
+        """A 10 cm drop from rest at 48°N is deflected ~0.47 µm east."""
+        tr = integrate(field, EPOCH, [0, 0, 0.1], [0, 0, 0], 0.142, 1e-4,
+                       method='rk45', save_interval=0.142)
+        assert tr.x[-1, 2] == pytest.approx(0.0, abs=2e-3)
+        assert tr.x[-1, 0] * 1e6 == pytest.approx(0.47, abs=0.02)
+
+
+class TestEnsemble:
+    @pytest.mark.parametrize("method", ['verlet', 'rk45'])
+    def test_batch_matches_single(self, field, method):
+        rng = np.random.default_rng(3)
+        x0 = rng.normal(0, 1e-3, (20, 3))
+        v0 = rng.normal(0, 1e-2, (20, 3))
+        tr = integrate(field, EPOCH, x0, v0, 0.05, 1e-3, method=method,
+                       save_interval=0.01, rtol=1e-12, atol=1e-15)
+        assert tr.x.shape == (6, 20, 3)
+        for i in (0, 7, 19):
+            one = integrate(field, EPOCH, x0[i], v0[i], 0.05, 1e-3,
+                            method=method, save_interval=0.01,
+                            rtol=1e-12, atol=1e-15)
+            np.testing.assert_allclose(tr.x[:, i], one.x, rtol=0,
+                                       atol=1e-12)
+
+    def test_out_arrays_written_in_place(self, field):
+        x_out, v_out = np.zeros((11, 4, 3)), np.zeros((11, 4, 3))
+        tr = integrate(field, EPOCH, np.zeros((4, 3)), np.ones(3), 0.1,
+                       1e-3, save_interval=0.01, out=(x_out, v_out))
+        assert tr.x is x_out and tr.v is v_out
+        np.testing.assert_array_equal(v_out[0], 1.0)
+        assert np.all(x_out[-1, :, 2] > 0.0)
+        with pytest.raises(ValueError, match="shape"):
+            integrate(field, EPOCH, np.zeros((4, 3)), np.ones(3), 0.1, 1e-3,
+                      save_interval=0.01, out=(x_out[:5], v_out[:5]))
+
+
+class TestFieldRefresh:
+    def test_single_field_at_midpoint(self, lab):
+        """Without refresh the lab field at mid-run drives the motion."""
+        args = ([0, 0, 0], [0, 0, 2.0], 0.4, 1e-3)
+        tr = integrate(lab, EPOCH, *args)
+        mid = lab.field(EPOCH + timedelta(seconds=0.2))
+        ref = integrate(mid, EPOCH, *args)
+        assert tr.field_updates == 1
+        np.testing.assert_allclose(tr.x, ref.x, rtol=0, atol=1e-15)
+
+    @pytest.mark.parametrize("method", ['verlet', 'rk45'])
+    def test_refresh_cadence(self, lab, method):
+        """Refreshes over a long run follow the changing tide."""
+        args = (np.zeros(3), np.zeros(3), 600.0, 0.5)
+        tr = integrate(lab, EPOCH, *args, method=method, save_interval=60.0,
+                       refresh_interval=60.0)
+        assert tr.field_updates == 10
+        assert len(tr.t) == 11 and len(tr.times) == 11
+        once = integrate(lab, EPOCH, *args, method=method, save_interval=60.0)
+        drift = np.abs(tr.x[-1] - once.x[-1])
+        assert 0 < drift.max() < 1e-3 * np.abs(tr.x[-1]).max()
+
+    def test_schemes_agree_with_refresh(self, lab):
+        x0 = np.array([[0, 0, 0], [0.01, 0, 0]])
+        kw = dict(save_interval=0.5, refresh_interval=0.25)
+        a = integrate(lab, EPOCH, x0, [0, 0, 3.0], 1.0, 1e-4, **kw)
+        b = integrate(lab, EPOCH, x0, [0, 0, 3.0], 1.0, 1e-4,
+                      method='rk45', **kw)
+        assert b.rejected_steps >= 0 and b.steps < a.steps
+        np.testing.assert_allclose(a.x, b.x, rtol=0, atol=1e-8)
+
+
+class TestValidation:
+    def test_bad_arguments(self, lab, field):
+        with pytest.raises(ValueError, match="unknown method"):
+            integrate(lab, EPOCH, np.zeros(3), np.zeros(3), 1.0, 0.1,
+                      method='euler')
+        with pytest.raises(ValueError, match="multiple of dt"):
+            integrate(lab, EPOCH, np.zeros(3), np.zeros(3), 1.0, 0.1,
+                      save_interval=0.25)
+        with pytest.raises(ValueError, match="multiple of save_interval"):
+            integrate(lab, EPOCH, np.zeros(3), np.zeros(3), 1.0, 0.1,
+                      save_interval=0.3)
+        with pytest.raises(ValueError, match="needs a LabFrame"):
+            integrate(field, EPOCH, np.zeros(3), np.zeros(3), 1.0, 0.1,
+                      refresh_interval=0.5)
+        with pytest.raises(TypeError):
+            integrate(None, EPOCH, np.zeros(3), np.zeros(3), 1.0, 0.1)
@@ -0,0 +1,134 @@
+"""Tests for pytheas.interpolate -- knot-interpolated lab fields."""
+
+import numpy as np
+import pytest
+from datetime import datetime, timedelta
+
+from pytheas import LabFrame
+from pytheas.integrate import integrate
+from pytheas.interpolate import FieldInterpolator
+
+
+EPOCH = datetime(2025, 3, 20, 12)
+
+
+@pytest.fixture(scope="module")
+def lab():
+    return LabFrame(48.14, 11.58, 500.0)
+
+
+class TestAccuracy:
+    @pytest.mark.parametrize("method", ['hermite', 'chebyshev'])
+    def test_field_matches_direct(self, lab, method):
+        interp = FieldInterpolator(lab, method=method)
+        for seconds in (0.0, 123.456, 4321.0, 86399.9):
+            dt = EPOCH + timedelta(seconds=seconds)
+            f, ref = interp.field(dt), lab.field(dt)
+            np.testing.assert_allclose(f.g, ref.g, rtol=0, atol=1e-12)
+            np.testing.assert_allclose(f.g_tidal_moon, ref.g_tidal_moon,
+                                       rtol=0, atol=1e-12)
+            np.testing.assert_allclose(f.T, ref.T, rtol=0, atol=1e-18)
+            assert f.omega is lab.field(dt).omega
+
+    @pytest.mark.parametrize("method", ['hermite', 'chebyshev'])
+    def test_certified_bound_holds(self, lab, method):
+        """Dense validation stays within the check-point error and tol."""
+        interp = FieldInterpolator(lab, method=method)
+        res = interp.validate(EPOCH, EPOCH + timedelta(days=2), 1.0)
+        assert res.samples == 2881
+        assert 0 < interp.max_error[0] <= interp.tol
+        assert res.g_max <= 1.5 * interp.max_error[0]
+        assert res.T_max <= 1.5 * interp.max_error[1]
+
+    def test_timeseries_matches_labframe(self, lab):
+        end = EPOCH + timedelta(hours=3)
+        series = FieldInterpolator(lab).timeseries(EPOCH, end, 1.0)
+        ref = lab.timeseries(EPOCH, end, 1.0)
+        assert series.times == ref.times
+        np.testing.assert_allclose(series.g, ref.g, rtol=0, atol=1e-12)
+        np.testing.assert_allclose(series.T, ref.T, rtol=0, atol=1e-18)
+        np.testing.assert_array_equal(series.omega, ref.omega)
+
+    def test_unsorted_epochs(self, lab):
+        interp = FieldInterpolator(lab)
+        rng = np.random.default_rng(1)
+        ns = np.int64(1742472000 * 10 ** 9) + rng.integers(0, 86400 * 10 ** 9,
+                                                           500)
+        order = np.argsort(ns)
+        np.testing.assert_array_equal(interp._columns(ns)[order],
+                                      interp._columns(ns[order]))
+
+    def test_order_zero(self, lab):
+        f = FieldInterpolator(lab, order=0).field(EPOCH)
+        ref = lab.field(EPOCH, order=0)
+        np.testing.assert_array_equal(f.T, ref.T)
+        np.testing.assert_allclose(f.g, ref.g, rtol=0, atol=1e-12)
+
+    def test_readonly(self, lab):
+        interp = FieldInterpolator(lab)
+        assert interp.field(EPOCH).g.flags.writeable
+        f = interp.field(EPOCH, readonly=True)
+        assert not f.g.flags.writeable and not f.T.flags.writeable
+
+
+class TestCertification:
+    def test_coarse_knots_rejected(self, lab):
+        interp = FieldInterpolator(lab, knot_interval=6 * 3600.0)
+        with pytest.raises(ValueError, match="shorter knot_interval"):
+            interp.field(EPOCH)
+        assert interp.cache_info().segments == 0
+
+    def test_tol_none_reports_error(self, lab):
+        interp = FieldInterpolator(lab, knot_interval=6 * 3600.0, tol=None)
+        interp.field(EPOCH)
+        assert interp.max_error[0] > 1e-10
+
+    def test_bad_arguments(self, lab):
+        with pytest.raises(ValueError, match="unknown method"):
+            FieldInterpolator(lab, method='spline')
+        with pytest.raises(ValueError, match="knot_interval"):
+            FieldInterpolator(lab, knot_interval=0)
+        with pytest.raises(ValueError, match="max_segments"):
+            FieldInterpolator(lab, max_segments=0)
+
+
+class TestCache:
+    def test_lru_eviction(self, lab):
+        interp = FieldInterpolator(lab, max_segments=3)
+        for minutes in (0, 10, 20, 0, 30):
+            interp.field(EPOCH + timedelta(minutes=minutes))
+        info = interp.cache_info()
+        assert (info.hits, info.misses, info.evictions) == (1, 4, 1)
+        assert info.segments == 3
+        # The least recently used segment (+10 min) was dropped, not +0
+        interp.field(EPOCH)
+        assert interp.cache_info().misses == 4
+        interp.field(EPOCH + timedelta(minutes=10))
+        assert interp.cache_info().misses == 5
+
+    def test_query_wider_than_cache(self, lab):
+        interp = FieldInterpolator(lab, max_segments=2)
+        end = EPOCH + timedelta(hours=1)
+        series = interp.timeseries(EPOCH, end, 1.0)
+        ref = lab.timeseries(EPOCH, end, 1.0)
+        np.testing.assert_allclose(series.g, ref.g, rtol=0, atol=1e-12)
+        info = interp.cache_info()
+        assert info.segments == 2 and info.evictions == info.misses - 2
+
+    def test_clear(self, lab):
+        interp = FieldInterpolator(lab)
+        interp.field(EPOCH)
+        interp.clear()
+        assert interp.cache_info().segments == 0
+        interp.field(EPOCH)
+        assert interp.cache_info().misses == 2
+
+
+def test_integrate_from_interpolator(lab):
+    args = (np.zeros(3), np.zeros(3), 600.0, 0.5)
+    kw = dict(save_interval=60.0, refresh_interval=1.0)
+    tr = integrate(FieldInterpolator(lab), EPOCH, *args, **kw)
+    ref = integrate(lab, EPOCH, *args, **kw)
+    assert tr.field_updates == 600
+    # 1e-13 m/s^2 over 600 s is at most ~2e-8 m
+    np.testing.assert_allclose(tr.x, ref.x, rtol=0, atol=2e-8)
@@ -0,0 +1,55 @@
+"""Tests for the workers= option -- process-pool evaluation."""
+
+import numpy as np
+import pytest
+from datetime import datetime
+
+from pytheas import compute_timeseries, LabFrame
+from pytheas._core import _SERIES_BLOCK
+from pytheas._parallel import _spans
+
+
+START = datetime(2025, 3, 20)
+END = datetime(2025, 3, 20, 6)          # 21601 epochs at 1 Hz, 3 blocks
+
+
+class TestSpans:
+    @pytest.mark.parametrize("n, workers", [(1, 4), (8192, 2), (20000, 2),
+                                            (10 ** 6, 64)])
+    def test_aligned_cover(self, n, workers):
+        spans = _spans(n, workers)
+        assert spans[0][0] == 0 and spans[-1][1] == n
+        assert all(hi == lo for (_, hi), (lo, _) in zip(spans, spans[1:]))
+        assert all(lo % _SERIES_BLOCK == 0 for lo, _ in spans)
+
+
+class TestWorkers:
+    def test_timeseries_identical_to_serial(self):
+        args = (START, END, 48.14, 11.58, 500.0, 20.0, 60.0)
+        serial = compute_timeseries(*args, interval_minutes=1 / 60)
+        parallel = compute_timeseries(*args, interval_minutes=1 / 60,
+                                      workers=2)
+        assert parallel.times == serial.times
+        for name in ('g_total', 'g_tidal_moon', 'g_tidal_sun', 'g_static'):
+            np.testing.assert_array_equal(getattr(parallel, name),
+                                          getattr(serial, name))
+
+    def test_labframe_identical_to_serial(self):
+        lab = LabFrame(48.14, 11.58, 500.0)
+        serial = lab.timeseries(START, END, interval_minutes=1 / 60)
+        parallel = lab.timeseries(START, END, interval_minutes=1 / 60,
+                                  workers=3)
+        np.testing.assert_array_equal(parallel.g, serial.g)
+        np.testing.assert_array_equal(parallel.T, serial.T)
+        np.testing.assert_array_equal(parallel.g_tidal_sun,
+                                      serial.g_tidal_sun)
+
+    def test_short_grid_runs_serially(self):
+        ts = compute_timeseries(START, END, 48.14, 11.58, 500.0, workers=8)
+        assert len(ts.times) == 37
+
+    @pytest.mark.parametrize("workers", [0, -1, 1.5])
+    def test_invalid_workers_raises(self, workers):
+        with pytest.raises(ValueError, match="workers must be a positive"):
+            compute_timeseries(START, END, 48.14, 11.58, 500.0,
+                               workers=workers)
@@ -0,0 +1,97 @@
+"""Tests for pytheas.profiling stage instrumentation."""
+
+import json
+from datetime import datetime
+
+import pytheas
+from pytheas import LabFrame, compute_g, compute_timeseries, profiling
+from pytheas.ephem import ChebyshevEphemeris
+
+START = datetime(2025, 3, 20)
+END = datetime(2025, 3, 21)
+
+
+class TestProfiling:
+    def test_timeseries_stages(self):
+        with profiling() as prof:
+            ts = compute_timeseries(START, END, 48.14, 11.58, 500.0,
+                                    interval_minutes=1)
+        n = len(ts.times)
+        stages = prof.stages
+        for name in ('time', 'moon_series', 'sun_series', 'rotation',
+                     'tidal', 'projection'):
+            assert name in stages
+        assert stages['moon_series'].samples == n
+        assert stages['sun_series'].calls == 1
+        assert stages['tidal'].samples == 2 * n
+        assert stages['projection'].samples == n
+        assert 0 < prof.wall_s
+        assert sum(s.self_s for s in stages.values()) <= prof.wall_s
+
+    def test_disabled_records_nothing(self):
+        with profiling() as prof:
+            pass
+        compute_g(START, 48.14, 11.58, 500.0)
+        assert prof.stages == {}
+        assert pytheas._profiling._active is None
+
+    def test_labframe_order1_gradient(self):
+        lab = LabFrame(48.14, 11.58, 500.0)
+        with profiling() as prof:
+            lab.field(START, order=1)
+        assert prof.stages['tidal_gradient'].calls == 2
+        with profiling() as prof:
+            lab.field(START, order=0)
+        assert 'tidal_gradient' not in prof.stages
+
+    def test_ephemeris_table_stage(self):
+        eph = ChebyshevEphemeris(START, END)
+        with profiling() as prof:
+            compute_timeseries(START, END, 48.14, 11.58, 500.0,
+                               ephemeris=eph)
+        assert prof.stages['ephemeris_table'].samples == 145
+        assert 'moon_series' not in prof.stages
+
+    def test_nested_stage_counted_once(self):
+        """julian_date_split converts through two 'time' helpers."""
+        with profiling() as prof:
+            pytheas.julian_date_split([START, END])
+        assert prof.stages['time'].calls == 1
+
+    def test_report(self):
+        with profiling() as prof:
+            compute_g(START, 48.14, 11.58, 500.0)
+        text = prof.report()
+        assert text.splitlines()[0].split()[:3] == ['stage', 'calls',
+                                                    'samples']
+        assert 'moon_series' in text and '(wall)' in text
+
+    def test_chrome_trace(self, tmp_path):
+        with profiling() as prof:
+            compute_g(START, 48.14, 11.58, 500.0)
+        path = tmp_path / "trace.json"
+        prof.save_chrome_trace(path)
+        trace = json.loads(path.read_text())
+        events = trace['traceEvents']
+        assert len(events) == sum(s.calls for s in prof.stages.values())
+        assert {e['ph'] for e in events} == {'X'}
+        assert all(e['ts'] >= 0 and e['dur'] >= 0 for e in events)
+        assert {e['name'] for e in events} == set(prof.stages)
+
+    def test_event_cap(self):
+        with profiling(max_events=3) as prof:
+            compute_g(START, 48.14, 11.58, 500.0)
+        assert len(prof.events) == 3
+        assert prof.dropped_events == sum(
+            s.calls for s in prof.stages.values()) - 3
+
+    def test_no_trace(self):
+        with profiling(trace=False) as prof:
+            compute_g(START, 48.14, 11.58, 500.0)
+        assert prof.events == [] and prof.stages['moon_series'].calls == 1
+
+    def test_results_unchanged(self):
+        ref = compute_timeseries(START, END, 48.14, 11.58, 500.0)
+        with profiling():
+            ts = compute_timeseries(START, END, 48.14, 11.58, 500.0)
+        assert (ts.g_total == ref.g_total).all()
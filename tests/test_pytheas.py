@@ -8,8 +8,12 @@ from datetime import datetime, timedelta, timezone
 from pytheas import (
     compute_g,
     compute_timeseries,
+    iter_timeseries,
+    compute_network_timeseries,
     GravityResult,
     TimeSeries,
+    NetworkTimeSeries,
+    Station,
     normal_gravity,
     sun_position_ecef,
     moon_position_ecef,
@@ -18,8 +22,10 @@ from pytheas import (
     measurement_axis,
     tidal_acceleration,
     julian_date,
+    julian_date_split,
     gmst_rad,
     GravityField,
+    GravityFieldSeries,
     LabFrame,
     GM_MOON,
     GM_SUN,
@@ -127,6 +133,74 @@ class TestTime:
         assert abs(result_aware.g_total - result_utc.g_total) < 1e-15
 
 
+    def test_epoch_types_agree(self):
+        """datetime, datetime64 and viewed int64 ns epochs give the same JD."""
+        times = [datetime(2025, 3, 20, 10, 30, 15, 250000),
+                 datetime(1999, 12, 31, 23, 59, 59)]
+        as_dt64 = np.array(times, dtype='datetime64[ns]')
+        as_ns = as_dt64.astype(np.int64)
+        ref = np.array([julian_date(t) for t in times])
+        np.testing.assert_array_equal(julian_date(times), ref)
+        np.testing.assert_array_equal(julian_date(as_dt64), ref)
+        np.testing.assert_array_equal(
+            julian_date(as_ns.view('datetime64[ns]')), ref)
+        np.testing.assert_allclose(gmst_rad(as_dt64),
+                                   [gmst_rad(t) for t in times], atol=1e-15)
+
+    def test_integer_julian_dates(self):
+        """Plain integers are Julian Dates, exactly like floats."""
+        assert julian_date(2451545) == 2451545.0
+        assert julian_date(np.int64(2451545)) == 2451545.0
+        jd = np.array([2451545, 2451546])
+        np.testing.assert_array_equal(julian_date(jd), jd.astype(float))
+        np.testing.assert_array_equal(sun_position_ecef(jd),
+                                      sun_position_ecef(jd.astype(float)))
+        np.testing.assert_array_equal(moon_position_ecef(jd),
+                                      moon_position_ecef(jd.astype(float)))
+
+    def test_plain_numbers_rejected_where_jd_unsupported(self):
+        with pytest.raises(TypeError, match="datetime64"):
+            compute_network_timeseries(np.array([1742472000 * 10 ** 9]),
+                                       [(48.14, 11.58, 500.0)])
+
+    def test_julian_date_includes_microseconds(self):
+        """Sub-second datetime fields contribute to the Julian Date."""
+        day0, frac0 = julian_date_split(datetime(2025, 3, 20, 12, 0, 0))
+        day1, frac1 = julian_date_split(datetime(2025, 3, 20, 12, 0, 0, 500))
+        assert day0 == day1
+        assert abs((frac1 - frac0) * 86400.0 - 500e-6) < 1e-10
+
+    def test_split_resolves_nanoseconds_over_decades(self):
+        """Split JD resolves 1 us steps where a float JD cannot."""
+        base = np.datetime64('2045-06-01T12:00:00', 'ns')
+        epochs = base + np.arange(4) * np.timedelta64(1, 'us')
+        day, frac = julian_date_split(epochs)
+        assert np.all(day == day[0])
+        np.testing.assert_allclose(np.diff(frac) * 86400e6, 1.0, atol=1e-4)
+        # A single float JD collapses these onto ~40 us quanta
+        assert len(np.unique(julian_date(epochs))) < 4
+
+    def test_split_day_is_half_integer(self):
+        """Day part is the JD of 0h UTC and the fraction lies in [0, 1)."""
+        day, frac = julian_date_split(datetime(2000, 1, 1, 18, 0, 0))
+        assert day == 2451544.5
+        assert abs(frac - 0.75) < 1e-15
+
+    def test_float_jd_round_trip(self):
+        """Float Julian Dates are accepted and split consistently."""
+        day, frac = julian_date_split(np.array([2451545.0, 2460754.25]))
+        np.testing.assert_array_equal(day, [2451544.5, 2460753.5])
+        np.testing.assert_allclose(frac, [0.5, 0.75], atol=1e-9)
+
+    def test_gmst_continuous_across_midnight(self):
+        """GMST advances smoothly across the day boundary of the split."""
+        epochs = (np.datetime64('2025-03-20T23:59:59', 'ns')
+                  + np.arange(3) * np.timedelta64(1, 's'))
+        step = np.diff(np.unwrap(gmst_rad(epochs)))
+        np.testing.assert_allclose(step, 2 * np.pi * 1.0027379 / 86400,
+                                   rtol=1e-6)
+
+
 # =========================================================================
 # Coordinate transforms
 # =========================================================================
@@ -194,15 +268,27 @@ class TestCoordinates:
         y_eci = np.cos(dec) * np.sin(ra)
         z_eci = np.sin(dec)
 
-        x_ecef, y_ecef, z_ecef = _eci_to_ecef(x_eci, y_eci, z_eci, dt)
+        r_ecef = _eci_to_ecef(np.array([x_eci, y_eci, z_eci]), dt)
 
         expected = np.array([
             np.cos(dec) * np.cos(phi),
             np.cos(dec) * np.sin(phi),
             np.sin(dec),
         ])
-        np.testing.assert_allclose(
-            np.array([x_ecef, y_ecef, z_ecef]), expected, atol=1e-12)
+        np.testing.assert_allclose(r_ecef, expected, atol=1e-12)
+
+    def test_eci_to_ecef_batched(self):
+        """Bulk rotation over N epochs matches per-epoch rotation."""
+        from pytheas._core import _eci_to_ecef
+
+        times = [datetime(2025, 3, 20) + timedelta(minutes=37 * i)
+                 for i in range(12)]
+        r_eci = np.random.default_rng(7).standard_normal((12, 3))
+        bulk = _eci_to_ecef(r_eci, times)
+        assert bulk.shape == (12, 3)
+        for i, t in enumerate(times):
+            np.testing.assert_allclose(bulk[i], _eci_to_ecef(r_eci[i], t),
+                                       atol=1e-14)
 
 
 # =========================================================================
@@ -232,6 +318,79 @@ class TestEphemeris:
         # Perigee-apogee range: ~40000-50000 km
         assert np.ptp(dists) > 3e7  # > 30000 km
 
+    def test_moon_batch_matches_scalar(self):
+        """Batched lunar ephemeris returns (N, 3) matching per-epoch calls."""
+        times = [datetime(2024, 1, 1) + timedelta(hours=7 * i)
+                 for i in range(40)]
+        batch = moon_position_ecef(times)
+        assert batch.shape == (40, 3)
+        for i, t in enumerate(times):
+            np.testing.assert_allclose(batch[i], moon_position_ecef(t),
+                                       rtol=0, atol=1e-6)
+
+    def test_single_epoch_paths_match_arrays(self):
+        """Scalar fast paths agree with the array evaluation."""
+        times = [datetime(2031, 7, 4, 5, 6, 7, 891) + timedelta(hours=5 * i)
+                 for i in range(20)]
+        day, frac = julian_date_split(np.array(times, dtype='datetime64[ns]'))
+        sun = sun_position_ecef(times)
+        for i, t in enumerate(times):
+            assert julian_date_split(t) == (day[i], frac[i])
+            np.testing.assert_allclose(sun_position_ecef(t), sun[i],
+                                       rtol=1e-14, atol=0)
+            np.testing.assert_allclose(
+                moon_position_ecef(day[i] + frac[i]),
+                moon_position_ecef(np.array([day[i] + frac[i]]))[0],
+                rtol=0, atol=1e-6)
+
+    @pytest.mark.parametrize("step_s", [1, 60, 3600])
+    def test_moon_uniform_grid_matches_direct(self, step_s, monkeypatch):
+        """Angle-addition evaluation on even grids equals the direct sum."""
+        from pytheas import _core
+        times = (np.datetime64('2031-05-17T03:00') +
+                 np.arange(5000) * np.timedelta64(step_s, 's'))
+        T = _core._centuries(*julian_date_split(times))
+        assert _core._uniform_series_sums(T) is not None
+        fast = moon_position_ecef(times)
+        monkeypatch.setattr(_core, '_UNIFORM_SERIES', False)
+        np.testing.assert_allclose(fast, moon_position_ecef(times),
+                                   rtol=0, atol=1e-3)
+
+    def test_moon_uniform_grid_fallback(self):
+        """Uneven, short or coarse grids take the direct series."""
+        from pytheas._core import _uniform_series_sums
+        T = np.linspace(0.25, 0.26, 1000)
+        assert _uniform_series_sums(T[:10]) is None
+        assert _uniform_series_sums(T ** 1.01) is None
+        assert _uniform_series_sums(np.linspace(0.2, 0.3, 1000)) is None
+
+    def test_moon_series_matrix_covers_tables(self):
+        """Merged argument matrix reproduces every Meeus coefficient."""
+        from pytheas._core import (
+            _LON_TERMS, _DIST_TERMS, _LAT_TERMS, _LON_EXTRA, _LAT_EXTRA,
+            _SIN_COEFF, _COS_COEFF,
+        )
+        sin_c = _SIN_COEFF.reshape(-1, 2, 3)
+        assert sin_c[:, 0].sum() == (sum(t[-1] for t in _LON_TERMS)
+                                     + sum(t[-1] for t in _LON_EXTRA))
+        assert sin_c[:, 1].sum() == (sum(t[-1] for t in _LAT_TERMS)
+                                     + sum(t[-1] for t in _LAT_EXTRA))
+        assert _COS_COEFF.sum() == sum(t[-1] for t in _DIST_TERMS)
+
+    def test_sun_batch_epoch_types(self):
+        """Sun accepts datetimes, datetime64[ns] and Julian Dates alike."""
+        times = [datetime(2025, 3, 20) + timedelta(hours=5 * i)
+                 for i in range(10)]
+        ref = np.array([sun_position_ecef(t) for t in times])
+        as_dt64 = np.array(times, dtype='datetime64[ns]')
+        as_jd = np.array([julian_date(t) for t in times])
+        # A float JD is quantized at ~40 us (~0.4 km of Earth rotation at 1 AU)
+        for epochs, rtol in ((times, 1e-12), (as_dt64, 1e-12),
+                             (as_jd, 1e-8)):
+            pos = sun_position_ecef(epochs)
+            assert pos.shape == (10, 3)
+            np.testing.assert_allclose(pos, ref, rtol=rtol)
+
     def test_sun_equinox_declination(self):
         """Near equinox, Sun declination ~ 0."""
         dt = datetime(2025, 3, 20, 12, 0, 0)
@@ -273,6 +432,34 @@ class TestTidalAcceleration:
         a = tidal_acceleration(r, R, GM_MOON)
         np.testing.assert_allclose(a, [0.0, 0.0, 0.0], atol=1e-20)
 
+    def test_batch_matches_reference_formula(self):
+        """Broadcast (S, N, 3) evaluation matches the textbook expression."""
+        rng = np.random.default_rng(9)
+        r = rng.normal(size=(4, 1, 3)) * 6.4e6
+        R = rng.normal(size=(1, 50, 3)) * 3.8e8
+        a = tidal_acceleration(r, R, GM_MOON)
+        assert a.shape == (4, 50, 3)
+        d = R - r
+        ref = GM_MOON * (d / np.linalg.norm(d, axis=-1, keepdims=True) ** 3
+                         - R / np.linalg.norm(R, axis=-1, keepdims=True) ** 3)
+        # Cancellation between the two ~1e-5 terms leaves ~1e-21 of rounding
+        np.testing.assert_allclose(a, ref, rtol=1e-12, atol=1e-19)
+
+    def test_gradient_tensor_batch(self):
+        """(N, 3, 3) gradient tensors match the scalar outer-product form."""
+        from pytheas._core import _tidal_gradient_tensor
+        rng = np.random.default_rng(10)
+        r = geodetic_to_ecef(48.14, 11.58, 500.0)
+        R = rng.normal(size=(20, 3)) * 3.8e8
+        T = _tidal_gradient_tensor(r, R, GM_MOON)
+        assert T.shape == (20, 3, 3)
+        for i in range(20):
+            d = R[i] - r
+            dn = np.linalg.norm(d)
+            ref = GM_MOON * (-np.eye(3) / dn ** 3
+                             + 3.0 * np.outer(d, d) / dn ** 5)
+            np.testing.assert_allclose(T[i], ref, rtol=1e-12, atol=1e-28)
+
 
 # =========================================================================
 # Full pipeline: compute_g
@@ -313,6 +500,20 @@ class TestComputeG:
         assert abs(result.g_total - result.g_static
                    - result.g_tidal) < 1e-15
 
+    def test_multiple_axes(self):
+        """Arrays of angles give one (K,) reading per axis."""
+        dt = datetime(2025, 3, 20, 12, 0, 0)
+        zen, azi = [0.0, 90.0, 30.0], [0.0, 90.0, 40.0]
+        result = compute_g(dt, 48.14, 11.58, 500.0, zen, azi)
+        assert result.g_tidal.shape == (3,)
+        assert result.cos_zenith.shape == (3,)
+        for k in range(3):
+            ref = compute_g(dt, 48.14, 11.58, 500.0, zen[k], azi[k])
+            assert result.g_tidal_moon[k] == pytest.approx(
+                ref.g_tidal_moon, rel=0, abs=1e-20)
+            assert result.g_total[k] == pytest.approx(ref.g_total,
+                                                      rel=0, abs=1e-15)
+
     def test_gravimetric_amplification(self):
         """Tidal signal should be amplified by delta ~ 1.16 vs rigid Earth."""
         dt = datetime(2025, 3, 20, 12, 0, 0)
@@ -380,6 +581,51 @@ class TestTimeseries:
         )
         assert np.ptp(data.g_static) == 0.0
 
+    def test_matches_compute_g(self):
+        """Batched timeseries reproduces compute_g epoch by epoch."""
+        data = compute_timeseries(
+            datetime(2025, 3, 20), datetime(2025, 3, 22),
+            48.14, 11.58, 500.0, zenith_deg=30.0, azimuth_deg=40.0,
+            n_samples=37,
+        )
+        for i, t in enumerate(data.times):
+            ref = compute_g(t, 48.14, 11.58, 500.0, 30.0, 40.0)
+            assert abs(data.g_tidal_moon[i] - ref.g_tidal_moon) < 1e-18
+            assert abs(data.g_tidal_sun[i] - ref.g_tidal_sun) < 1e-18
+            assert abs(data.g_total[i] - ref.g_total) < 1e-15
+
+    def test_multiple_axes_match_single(self):
+        """One (N, K) evaluation equals K single-axis timeseries."""
+        zen, azi = np.array([0.0, 90.0, 90.0, 30.0]), np.array([0, 0, 90, 40])
+        args = (datetime(2025, 3, 20), datetime(2025, 3, 22),
+                48.14, 11.58, 500.0)
+        data = compute_timeseries(*args, zen, azi, n_samples=37)
+        assert data.g_total.shape == data.g_static.shape == (37, 4)
+        assert data.cos_zenith.shape == (4,)
+        for k in range(4):
+            ref = compute_timeseries(*args, zen[k], azi[k], n_samples=37)
+            np.testing.assert_allclose(data.g_tidal_moon[:, k],
+                                       ref.g_tidal_moon, rtol=0, atol=1e-20)
+            np.testing.assert_allclose(data.g_tidal_sun[:, k],
+                                       ref.g_tidal_sun, rtol=0, atol=1e-20)
+            np.testing.assert_allclose(data.g_total[:, k], ref.g_total,
+                                       rtol=0, atol=1e-15)
+
+    def test_axes_broadcast(self):
+        """A scalar zenith broadcasts against an azimuth sweep."""
+        data = compute_timeseries(
+            datetime(2025, 3, 20), datetime(2025, 3, 21),
+            48.14, 11.58, 500.0, zenith_deg=90.0,
+            azimuth_deg=np.arange(0, 360, 45), n_samples=5)
+        assert data.g_tidal.shape == (5, 8)
+        # Opposite horizontal axes read opposite tides
+        np.testing.assert_allclose(data.g_tidal[:, :4], -data.g_tidal[:, 4:],
+                                   rtol=1e-9, atol=1e-20)
+        with pytest.raises(ValueError, match="1-D"):
+            compute_timeseries(datetime(2025, 3, 20), datetime(2025, 3, 21),
+                               48.14, 11.58, 500.0,
+                               zenith_deg=np.zeros((2, 2)))
+
     def test_invalid_interval_raises(self):
         with pytest.raises(ValueError, match="interval_minutes must be > 0"):
             compute_timeseries(
@@ -393,6 +639,133 @@ class TestTimeseries:
                 48.14, 11.58, 500.0)
 
 
+# =========================================================================
+# Chunked timeseries
+# =========================================================================
+
+class TestIterTimeseries:
+    ARGS = (datetime(2025, 3, 20), datetime(2025, 3, 21, 3),
+            48.14, 11.58, 500.0, 20.0, 60.0)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 100, 10_000])
+    def test_chunks_match_one_shot(self, chunk_size):
+        """Concatenated chunks equal compute_timeseries bit for bit."""
+        full = compute_timeseries(*self.ARGS, interval_minutes=3.0)
+        chunks = list(iter_timeseries(*self.ARGS, interval_minutes=3.0,
+                                      chunk_size=chunk_size))
+        assert all(isinstance(c, TimeSeries) for c in chunks)
+        assert max(len(c.times) for c in chunks) <= chunk_size
+        assert sum(len(c.times) for c in chunks) == len(full.times)
+        assert [t for c in chunks for t in c.times] == full.times
+        for name in ('g_total', 'g_tidal_moon', 'g_tidal_sun', 'g_static'):
+            np.testing.assert_array_equal(
+                np.concatenate([getattr(c, name) for c in chunks]),
+                getattr(full, name))
+
+    def test_long_span_across_blocks(self):
+        """Chunks straddling internal ephemeris blocks stay exact."""
+        args = (datetime(2025, 3, 20), datetime(2025, 3, 20, 6),
+                48.14, 11.58, 500.0)
+        full = compute_timeseries(*args, interval_minutes=1 / 60)
+        chunks = list(iter_timeseries(*args, interval_minutes=1 / 60,
+                                      chunk_size=5000))
+        assert [len(c.times) for c in chunks] == [5000] * 4 + [1601]
+        np.testing.assert_array_equal(
+            np.concatenate([c.g_total for c in chunks]), full.g_total)
+
+    def test_n_samples(self):
+        full = compute_timeseries(*self.ARGS, n_samples=50)
+        chunks = list(iter_timeseries(*self.ARGS, n_samples=50, chunk_size=8))
+        assert [t for c in chunks for t in c.times] == full.times
+        np.testing.assert_array_equal(
+            np.concatenate([c.g_tidal for c in chunks]), full.g_tidal)
+
+    def test_validates_eagerly(self):
+        """Bad arguments raise at the call, not at the first chunk."""
+        with pytest.raises(ValueError, match="end must be >= start"):
+            iter_timeseries(datetime(2025, 3, 21), datetime(2025, 3, 20),
+                            48.14, 11.58, 500.0)
+        with pytest.raises(ValueError, match="chunk_size must be >= 1"):
+            iter_timeseries(*self.ARGS, chunk_size=0)
+
+
+# =========================================================================
+# Station network
+# =========================================================================
+
+NETWORK = [
+    Station(48.14, 11.58, 500.0, name="munich"),
+    Station(-33.9, 18.4, 10.0, zenith_deg=90.0, azimuth_deg=0.0),
+    (64.1, -21.9, 30.0, 30.0, 120.0),
+]
+
+
+class TestNetworkTimeseries:
+    def test_matches_single_station(self):
+        """Each row reproduces compute_timeseries for that station."""
+        start, end = datetime(2025, 3, 20), datetime(2025, 3, 21)
+        sites = [st if isinstance(st, Station) else Station(*st)
+                 for st in NETWORK]
+        single = [compute_timeseries(start, end, st.lat_deg, st.lon_deg,
+                                     st.alt_m, st.zenith_deg, st.azimuth_deg,
+                                     interval_minutes=30.0)
+                  for st in sites]
+        net = compute_network_timeseries(single[0].times, NETWORK)
+        assert isinstance(net, NetworkTimeSeries)
+        assert net.g_total.shape == (3, 49)
+        for s, ref in enumerate(single):
+            np.testing.assert_allclose(net.g_tidal_moon[s], ref.g_tidal_moon,
+                                       rtol=0, atol=1e-18)
+            np.testing.assert_allclose(net.g_tidal_sun[s], ref.g_tidal_sun,
+                                       rtol=0, atol=1e-18)
+            np.testing.assert_allclose(net.g_total[s], ref.g_total,
+                                       rtol=0, atol=1e-15)
+            assert net.cos_zenith[s] == pytest.approx(ref.cos_zenith)
+
+    def test_caller_arrays_stay_writable(self):
+        times = np.datetime64('2025-03-20', 'ns') + np.arange(3) * 60 * 10**9
+        g = np.zeros((1, 3))
+        net = NetworkTimeSeries(times=times, stations=(Station(0, 0),),
+                                g_total=g, g_static=g, g_normal=np.ones(1),
+                                cos_zenith=np.ones(1), g_tidal=g,
+                                g_tidal_moon=g, g_tidal_sun=g)
+        assert times.flags.writeable and g.flags.writeable
+        assert not net.times.flags.writeable
+        assert not net.g_total.flags.writeable
+        with pytest.raises(ValueError):
+            net.g_tidal[0, 0] = 1.0
+
+    def test_blocked_epochs_seamless(self, monkeypatch):
+        """Splitting epochs into blocks does not change the result."""
+        import pytheas._core as core
+        times = (np.datetime64('2025-03-20', 'ns')
+                 + np.arange(100) * np.timedelta64(7, 'm'))
+        full = compute_network_timeseries(times, NETWORK)
+        monkeypatch.setattr(core, '_NETWORK_BLOCK', 7)
+        blocked = compute_network_timeseries(times, NETWORK)
+        np.testing.assert_array_equal(blocked.g_tidal, full.g_tidal)
+
+    def test_station_view(self):
+        times = [datetime(2025, 3, 20, 6), datetime(2025, 3, 20, 12)]
+        net = compute_network_timeseries(times, NETWORK)
+        ts = net.station(0)
+        assert isinstance(ts, TimeSeries)
+        assert ts.times == times
+        np.testing.assert_array_equal(ts.g_tidal, net.g_tidal[0])
+        assert net.stations[2] == Station(64.1, -21.9, 30.0, 30.0, 120.0)
+
+    def test_read_only(self):
+        net = compute_network_timeseries([datetime(2025, 3, 20)], NETWORK)
+        with pytest.raises(ValueError):
+            net.g_tidal[0, 0] = 0.0
+        with pytest.raises(ValueError):
+            net.g_static[0, 0] = 0.0
+
+    def test_empty_network_raises(self):
+        with pytest.raises(ValueError, match="stations must not be empty"):
+            compute_network_timeseries([datetime(2025, 3, 20)], [])
+
+
 # =========================================================================
 # Edge cases
 # =========================================================================
@@ -581,6 +954,42 @@ class TestLabFrame:
         r = field.reading([0, 0, 1])
         assert abs(r - (-field.g_normal)) < 1e-4
 
+    # -- Batched particles --
+
+    def test_batched_eom_matches_single(self, field):
+        """eom over (N, 3) particles equals per-particle calls."""
+        rng = np.random.default_rng(1)
+        dx, v = rng.normal(size=(50, 3)), rng.normal(size=(50, 3))
+        ref = np.array([field.g + field.T @ dx[i]
+                        - 2.0 * np.cross(field.omega, v[i])
+                        for i in range(50)])
+        np.testing.assert_allclose(field.eom(dx, v), ref, rtol=1e-14, atol=1e-18)
+        # Broadcasting one velocity, and writing into a given buffer
+        out = np.empty((50, 3))
+        assert field.eom(dx, v[0], out=out) is out
+        np.testing.assert_allclose(out, [field.eom(d, v[0]) for d in dx],
+                                   rtol=0, atol=1e-15)
+
+    def test_batched_at(self, field):
+        dx = np.arange(12.0).reshape(4, 3)
+        np.testing.assert_allclose(field.at(dx), [field.at(d) for d in dx],
+                                   rtol=0, atol=1e-15)
+        assert field.at([0, 0, 1]).shape == (3,)
+
+    def test_batched_reading_axes(self, field):
+        """(K, 3) axes and (N, 3) offsets give (N, K) readings."""
+        axes = np.array([[0, 0, 1], [1, 0, 0], [0, 0.6, 0.8]])
+        dx = np.array([[0, 0, 0], [0, 0, 10.0]])
+        r = field.reading(axes, dx)
+        assert r.shape == (2, 3)
+        for i in range(2):
+            for k in range(3):
+                assert r[i, k] == pytest.approx(
+                    field.reading(axes[k], dx[i]), abs=1e-15)
+        assert field.reading(axes).shape == (3,)
+        assert field.reading(axes[0], dx).shape == (2,)
+        assert isinstance(field.reading(axes[0], dx[1]), float)
+
     # -- Shapes and types --
 
     def test_field_shapes(self, field):
@@ -614,24 +1023,73 @@ class TestLabFrame:
         ts = lab.timeseries(
             datetime(2025, 3, 20), datetime(2025, 3, 21),
             interval_minutes=60.0)
-        assert len(ts['times']) == 25
-        assert len(ts['fields']) == 25
+        assert isinstance(ts, GravityFieldSeries)
+        assert len(ts.times) == 25
+        assert len(ts) == 25
+        assert ts.g.shape == (25, 3)
+        assert ts.T.shape == (25, 3, 3)
+        assert ts.g_tidal_moon.shape == (25, 3)
 
     def test_timeseries_returns_gravity_fields(self, lab):
-        """Timeseries returns GravityField objects."""
+        """Indexing and iteration yield GravityField views."""
         ts = lab.timeseries(
             datetime(2025, 3, 20), datetime(2025, 3, 20, 1, 0),
             n_samples=3)
-        for f in ts['fields']:
+        for f in ts:
             assert isinstance(f, GravityField)
+        assert isinstance(ts[-1], GravityField)
+        np.testing.assert_array_equal(ts[1].T, ts.T[1])
+        assert len(ts[1:]) == 2
+
+    def test_timeseries_caller_arrays_stay_writable(self):
+        g = np.zeros((2, 3))
+        ts = GravityFieldSeries(times=[datetime(2025, 3, 20)] * 2, g=g,
+                                T=np.zeros((2, 3, 3)), g_tidal_moon=g,
+                                g_tidal_sun=[[0.0] * 3] * 2,
+                                omega=[0.0, 0.0, 7.292115e-5],
+                                g_normal=9.8)
+        assert g.flags.writeable
+        assert not ts.g.flags.writeable
+        assert not ts.omega.flags.writeable
+        assert ts.g_tidal_sun.shape == (2, 3)
+        with pytest.raises(ValueError):
+            ts.g_tidal_moon[0, 0] = 1.0
 
-    def test_timeseries_n_samples(self, lab):
-        """n_samples overrides interval_minutes."""
+    def test_timeseries_matches_field(self, lab):
+        """Columnar results agree with per-epoch LabFrame.field."""
+        ts = lab.timeseries(
+            datetime(2025, 3, 20), datetime(2025, 3, 21), n_samples=5)
+        for t, f in zip(ts.times, ts):
+            ref = lab.field(t)
+            np.testing.assert_allclose(f.g, ref.g, rtol=0, atol=1e-15)
+            np.testing.assert_allclose(f.T, ref.T, rtol=1e-12, atol=1e-24)
+            np.testing.assert_allclose(f.g_tidal_sun, ref.g_tidal_sun,
+                                       rtol=0, atol=1e-20)
+            assert f.g_normal == ref.g_normal
+
+    def test_timeseries_read_only(self, lab):
+        ts = lab.timeseries(
+            datetime(2025, 3, 20), datetime(2025, 3, 21), n_samples=3)
+        with pytest.raises(ValueError):
+            ts.g[0, 2] = 0.0
+        with pytest.raises(ValueError):
+            ts[0].T[0, 0] = 0.0
+
+    def test_timeseries_order_zero(self, lab):
+        """order=0 carries the Earth tensor at every epoch."""
+        ts = lab.timeseries(
+            datetime(2025, 3, 20), datetime(2025, 3, 21), n_samples=4,
+            order=0)
+        np.testing.assert_array_equal(ts.T[3], lab._T_earth)
+
+    def test_timeseries_dict_access(self, lab):
+        """The former dict keys still work."""
         ts = lab.timeseries(
             datetime(2025, 3, 20), datetime(2025, 3, 21),
             n_samples=10)
         assert len(ts['times']) == 10
         assert len(ts['fields']) == 10
+        assert isinstance(ts['fields'][0], GravityField)
 
     def test_timeseries_invalid_interval_raises(self, lab):
         with pytest.raises(ValueError, match="interval_minutes must be > 0"):
@@ -697,9 +1155,36 @@ class TestDataclassAPI:
         assert d['g_normal'] == data.g_normal
 
     def test_gravityfield_arrays_are_readonly(self):
-        field = LabFrame(48.14, 11.58, 500.0).field(self.DT)
+        field = LabFrame(48.14, 11.58, 500.0).field(self.DT, readonly=True)
+        for arr in (field.g, field.T, field.omega, field.g_tidal_moon):
+            with pytest.raises(ValueError):
+                arr[0] = 0.0
+        copied = GravityField(field.g, field.omega, field.T, field.g_normal,
+                              field.g_tidal_moon, field.g_tidal_sun)
         with pytest.raises(ValueError):
-            field.g[0] = 0.0
+            copied.T[0, 0] = 0.0
+
+    def test_gravityfield_owns_fresh_arrays(self):
+        """LabFrame.field hands over its arrays; shared ones stay read-only."""
+        lab = LabFrame(48.14, 11.58, 500.0)
+        a, b = lab.field(self.DT), lab.field(self.DT)
+        a.g[0] = 1.0
+        assert b.g[0] != 1.0
+        assert not np.shares_memory(a.T, b.T)
+        with pytest.raises(ValueError):
+            a.omega[0] = 0.0
+        with pytest.raises(ValueError):
+            lab.field(self.DT, order=0).T[0, 0] = 0.0
+        with pytest.raises(FrozenInstanceError):
+            a.g = b.g
+        assert not hasattr(a, '__dict__')
+
+    def test_gravityfield_pickle(self):
+        import pickle
+        field = LabFrame(48.14, 11.58, 500.0).field(self.DT)
+        clone = pickle.loads(pickle.dumps(field))
+        np.testing.assert_array_equal(clone.T, field.T)
+        assert clone.g_normal == field.g_normal
 
     def test_timeseries_arrays_are_readonly(self):
         data = compute_timeseries(
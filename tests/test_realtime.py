@@ -0,0 +1,86 @@
+"""Tests for pytheas.realtime -- wall-clock prediction stream."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pytheas import compute_g, realtime, RealtimeSample, Station
+
+
+STATION = Station(48.14, 11.58, 500.0, zenith_deg=30.0, azimuth_deg=70.0)
+
+
+def collect(stream):
+    async def run():
+        return [sample async for sample in stream]
+    return asyncio.run(run())
+
+
+class TestRealtime:
+    def test_samples_match_compute_g(self):
+        """Streamed predictions equal compute_g at the scheduled epochs."""
+        stream = realtime(STATION, cadence=0.01, lookahead=0.03, count=8)
+        samples = collect(stream)
+        assert len(samples) == 8
+        assert all(isinstance(s, RealtimeSample) for s in samples)
+        for s in samples:
+            ref = compute_g(s.time, 48.14, 11.58, 500.0, 30.0, 70.0)
+            assert abs(s.result.g_tidal - ref.g_tidal) < 1e-18
+            assert abs(s.result.g_total - ref.g_total) < 4e-15
+            assert s.result.cos_zenith == pytest.approx(ref.cos_zenith)
+
+    def test_wall_clock_alignment(self):
+        """Epochs are consecutive cadence multiples, delivered on time."""
+        samples = collect(realtime(STATION, cadence=0.02, count=5))
+        steps = [(b.time - a.time) for a, b in zip(samples, samples[1:])]
+        assert steps == [timedelta(milliseconds=20)] * 4
+        us = (samples[0].time - datetime(1970, 1, 1)) // timedelta(
+            microseconds=1)
+        assert us % 20_000 == 0
+        assert all(s.latency >= 0 for s in samples)
+
+    def test_metrics_and_catch_up(self):
+        """Epochs in the past are yielded at once and counted late."""
+        start = (datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+                 - timedelta(seconds=10))
+        stream = realtime(STATION, cadence=1.0, start=start, count=5)
+        samples = collect(stream)
+        assert samples[0].time == start
+        m = stream.metrics
+        assert m.samples == 5
+        assert m.late == 5
+        assert m.latency_max >= m.latency_mean > 5.0
+        assert m.jitter > 0.0
+
+    def test_aware_start(self):
+        """A timezone-aware start is converted to the naive UTC schedule."""
+        utc = (datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0)
+               - timedelta(seconds=3))
+        aware = (utc + timedelta(hours=2)).replace(
+            tzinfo=timezone(timedelta(hours=2)))
+        samples = collect(realtime(STATION, cadence=1.0, start=aware,
+                                   count=2))
+        assert samples[0].time == utc
+        assert 3.0 <= samples[0].latency < 60.0
+
+    def test_tuple_station_and_timedelta_cadence(self):
+        samples = collect(realtime((48.14, 11.58, 500.0),
+                                   cadence=timedelta(milliseconds=10),
+                                   count=2))
+        ref = compute_g(samples[1].time, 48.14, 11.58, 500.0)
+        assert abs(samples[1].result.g_tidal - ref.g_tidal) < 1e-18
+
+    def test_aclose_stops_stream(self):
+        async def run():
+            stream = realtime(STATION, cadence=0.01)
+            first = await stream.__anext__()
+            await stream.aclose()
+            rest = [s async for s in stream]
+            return first, rest
+        first, rest = asyncio.run(run())
+        assert rest == []
+
+    def test_invalid_cadence_raises(self):
+        with pytest.raises(ValueError, match="cadence must be"):
+            realtime(STATION, cadence=0.0)
@@ -0,0 +1,238 @@
+"""Tests for pytheas.server and pytheas.client -- offline, on localhost."""
+
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from pytheas import compute_g
+from pytheas.client import Client, ServerError
+from pytheas.server import PredictionServer, _evaluate
+
+
+class _Running:
+    """A PredictionServer on its own event loop in a background thread."""
+
+    def __init__(self, **kwargs):
+        self.server = PredictionServer(port=0, **kwargs)
+        self.loop = asyncio.new_event_loop()
+        started = threading.Event()
+
+        def run():
+            asyncio.set_event_loop(self.loop)
+            self.loop.run_until_complete(self.server.start())
+            started.set()
+            self.loop.run_forever()
+
+        self.thread = threading.Thread(target=run, daemon=True)
+        self.thread.start()
+        started.wait(5)
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.server.close(),
+                                         self.loop).result(5)
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(5)
+
+
+@pytest.fixture(scope="module")
+def running():
+    srv = _Running(batch_window=0.05)
+    yield srv
+    srv.stop()
+
+
+EPOCH = datetime(2025, 3, 20, 12)
+
+
+class TestServer:
+    def test_compute_g_matches_library(self, running):
+        with Client(running.server.address) as c:
+            r = c.compute_g(EPOCH, 48.14, 11.58, 500.0, 30.0, 45.0)
+        ref = compute_g(EPOCH, 48.14, 11.58, 500.0, 30.0, 45.0)
+        assert abs(r.g_tidal - ref.g_tidal) < 1e-18
+        assert abs(r.g_total - ref.g_total) < 4e-15
+        assert r.cos_zenith == pytest.approx(ref.cos_zenith)
+
+    def test_pipelined_requests_coalesce(self, running):
+        """Requests sent together are answered in order from one batch."""
+        epochs = [EPOCH + timedelta(minutes=10 * i) for i in range(50)]
+        reqs = [(t, 48.14 + i * 0.01, 11.58, 500.0)
+                for i, t in enumerate(epochs)] + [(EPOCH, -33.9, 18.4, 0.0, 10.0, 90.0)]
+        before = running.server.batches
+        with Client(running.server.address) as c:
+            results = c.compute_many(reqs)
+        assert running.server.batches - before == 1
+        for (t, *site), r in zip(reqs, results):
+            ref = compute_g(t, *site)
+            assert abs(r.g_tidal - ref.g_tidal) < 1e-18
+
+    def test_concurrent_clients_share_batches(self, running):
+        """Requests from several connections inside the window coalesce."""
+        before_b = running.server.batches
+        before_r = running.server.requests
+        barrier = threading.Barrier(4)
+        out = []
+
+        def worker(lat):
+            with Client(running.server.address) as c:
+                barrier.wait()
+                out.append(c.compute_many([(EPOCH, lat, 0.0)] * 5))
+
+        threads = [threading.Thread(target=worker, args=(lat,))
+                   for lat in (0.0, 20.0, 40.0, 60.0)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+        assert len(out) == 4
+        assert running.server.requests - before_r == 20
+        assert running.server.batches - before_b < 4
+
+    def test_nearby_epochs_share_ephemerides(self, running):
+        """Epochs within the tolerance are evaluated once."""
+        reqs = [(EPOCH + timedelta(microseconds=us), 48.14, 11.58, 500.0)
+                for us in (0, 150, 320, -240)]
+        before = running.server.epochs
+        with Client(running.server.address) as c:
+            results = c.compute_many(reqs)
+        assert running.server.epochs - before == 1
+        ref = compute_g(EPOCH, 48.14, 11.58, 500.0)
+        for r in results:
+            assert abs(r.g_tidal - ref.g_tidal) < 1e-18
+
+    def test_zero_tolerance_merges_identical_only(self):
+        srv = _Running(batch_window=0.05, epoch_tolerance=0.0)
+        try:
+            reqs = [(EPOCH + timedelta(microseconds=us), 48.14, 11.58)
+                    for us in (0, 0, 150)]
+            with Client(srv.server.address) as c:
+                results = c.compute_many(reqs)
+            assert srv.server.epochs == 2
+            ref = compute_g(reqs[2][0], 48.14, 11.58, 0.0)
+            assert abs(results[2].g_tidal - ref.g_tidal) < 1e-18
+        finally:
+            srv.stop()
+
+    def test_raw_protocol_and_errors(self, running):
+        """ISO times are accepted and bad lines get error responses."""
+        host, port = running.server.address
+        with socket.create_connection((host, port), timeout=5) as s:
+            f = s.makefile('rwb')
+            f.write(b'{"id": "a", "time": "2025-03-20T12:00", '
+                    b'"lat": 48.14, "lon": 11.58}\n')
+            f.write(b'{"id": "b", "lat": 1.0}\n')
+            f.write(b'not json\n')
+            f.flush()
+            good, missing, bad = (json.loads(f.readline()) for _ in range(3))
+        assert good['id'] == 'a'
+        assert abs(good['g_tidal']
+                   - compute_g(EPOCH, 48.14, 11.58, 0.0).g_tidal) < 1e-18
+        assert missing['id'] == 'b' and 'error' in missing
+        assert bad['id'] is None and 'error' in bad
+
+    def test_client_raises_server_error(self, running):
+        with Client(running.server.address) as c:
+            with pytest.raises(ServerError):
+                c.compute_many([(EPOCH, 'north', 0.0)])
+            # The connection stays usable after an error
+            assert c.compute_g(EPOCH, 0.0, 0.0).g_normal > 9.7
+
+    def test_rejects_out_of_range_values(self, running):
+        host, port = running.server.address
+        with socket.create_connection((host, port), timeout=5) as s:
+            f = s.makefile('rwb')
+            f.write(b'{"id": 1, "t_ns": 1e23, "lat": 0.0, "lon": 0.0}\n')
+            f.write(b'{"id": 2, "t_ns": 0, "lat": NaN, "lon": 0.0}\n')
+            f.write(b'{"id": 3, "t_ns": 0, "lat": 0.0, "lon": 0.0, '
+                    b'"alt": Infinity}\n')
+            f.flush()
+            replies = [json.loads(f.readline()) for _ in range(3)]
+        assert [r['id'] for r in replies] == [1, 2, 3]
+        assert all('error' in r for r in replies)
+
+
+def _barrier_requests(address, requests):
+    """Send each request on its own connection at once; return the replies."""
+    barrier = threading.Barrier(len(requests))
+    out = [None] * len(requests)
+
+    def worker(i, req):
+        with socket.create_connection(address, timeout=5) as s:
+            f = s.makefile('rwb')
+            barrier.wait()
+            f.write(json.dumps(req).encode() + b'\n')
+            f.flush()
+            out[i] = json.loads(f.readline())
+
+    threads = [threading.Thread(target=worker, args=(i, req))
+               for i, req in enumerate(requests)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    return out
+
+
+def test_bad_request_does_not_fail_its_batch():
+    """An error in a coalesced batch only reaches the request causing it."""
+    from pytheas._core import _datetime_to_ns
+    from pytheas.ephem import ChebyshevEphemeris
+
+    eph = ChebyshevEphemeris(EPOCH - timedelta(days=1),
+                             EPOCH + timedelta(days=1))
+    srv = _Running(batch_window=0.2, ephemeris=eph)
+    try:
+        good = {'id': 'good', 't_ns': _datetime_to_ns(EPOCH),
+                'lat': 48.14, 'lon': 11.58}
+        # Parses fine, but lies outside the ephemeris window
+        outside = dict(good, id='outside',
+                       t_ns=_datetime_to_ns(EPOCH + timedelta(days=30)))
+        before = srv.server.batches
+        bad, ok = _barrier_requests(srv.server.address, [outside, good])
+        assert srv.server.batches - before == 1
+        assert bad['id'] == 'outside' and 'window' in bad['error']
+        assert ok['id'] == 'good' and 'error' not in ok
+        (ref,), _ = _evaluate([('good', good['t_ns'], 48.14, 11.58,
+                                0.0, 0.0, 0.0)], eph)
+        assert ok == ref
+
+        huge = dict(good, id='huge', t_ns=1e23)
+        bad, ok = _barrier_requests(srv.server.address, [huge, good])
+        assert bad['id'] == 'huge' and 'error' in bad
+        assert ok == ref
+    finally:
+        srv.stop()
+
+
+def test_client_import_skips_numpy():
+    """Services can import the client without paying for NumPy."""
+    code = ("import sys, pytheas.client; "
+            "assert 'numpy' not in sys.modules, 'numpy imported'; "
+            "assert 'pytheas._core' not in sys.modules, 'core imported'")
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_client_epoch_conversion():
+    from pytheas._core import _datetime_to_ns
+    from pytheas.client import _datetime_to_ns as client_ns
+    aware = datetime(2025, 3, 20, 14, 0, 0, 123456,
+                     tzinfo=timezone(timedelta(hours=2)))
+    for dt in (EPOCH, aware, datetime(1969, 7, 20, 20, 17, 40)):
+        assert client_ns(dt) == _datetime_to_ns(dt)
+
+
+@pytest.mark.skipif(not hasattr(socket, 'AF_UNIX'), reason="no Unix sockets")
+def test_unix_socket(tmp_path):
+    srv = _Running(path=str(tmp_path / "pytheas.sock"))
+    try:
+        with Client(str(tmp_path / "pytheas.sock")) as c:
+            r = c.compute_g(EPOCH, 48.14, 11.58, 500.0)
+        assert abs(r.g_tidal - compute_g(EPOCH, 48.14, 11.58, 500.0).g_tidal) < 1e-18
+    finally:
+        srv.stop()